@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to benchmark the startup of the entry points (via `python -X importtime`)
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+import sys
+from pathlib import Path
+
+os.chdir(Path(__file__).parent.parent)
+sys.path.insert(0, os.getcwd())
+
+import re
+import statistics
+import subprocess
+import time
+from argparse import ArgumentParser
+from argparse import RawTextHelpFormatter
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# e.g. "import time:       153 |        361 |   src.setup.info"
+PATTERN_IMPORTTIME = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def parse_args(*args: str):
+    parser = ArgumentParser(
+        prog="benchmark importtime",
+        description="measures the startup time of an entry point and the modules which dominate it",
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--entry",
+        type=str,
+        help="module of entry point",
+        nargs="?",
+        default="src.cli",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="number of repetitions",
+        nargs="?",
+        default=5,
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        help="number of (top-level) modules to display",
+        nargs="?",
+        default=10,
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        help="(optional) budget in ms for the median startup time, exceeding which fails",
+        nargs="?",
+        default=None,
+    )
+    parser.add_argument(
+        "args",
+        type=str,
+        help="arguments passed to entry point",
+        nargs="*",
+        default=["version"],
+    )
+    args_parsed = parser.parse_args(args)
+    return args_parsed
+
+
+def measure(entry: str, *args: str) -> tuple[float, list[tuple[str, int]]]:
+    """
+    Runs the entry point once,
+    returning the wall time (in seconds)
+    and the cumulative import times (in µs) of the top-level imports.
+    """
+    t0 = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", entry, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - t0
+
+    modules = []
+    for line in result.stderr.splitlines():
+        m = PATTERN_IMPORTTIME.match(line)
+        # NOTE: nested imports are indented by 2 spaces per level
+        if m is None or len(m.group(3)) > 1:
+            continue
+        modules.append((m.group(4), int(m.group(2))))
+
+    return elapsed, modules
+
+
+# ----------------------------------------------------------------
+# EXECUTION
+# ----------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = parse_args(*sys.argv[1:])
+
+    times = list[float]()
+    modules = list[tuple[str, int]]()
+    for _ in range(args.repeat):
+        elapsed, modules = measure(args.entry, *args.args)
+        times.append(elapsed)
+
+    median = 1000 * statistics.median(times)
+    total = sum(t for _, t in modules) / 1000
+    print(f"python -m {args.entry} {' '.join(args.args)}:")
+    print(f"- wall time   min {1000 * min(times):.1f} ms | median {median:.1f} ms")
+    print(f"- imports     {total:.1f} ms ({len(modules)} top-level modules)")
+    for name, t in sorted(modules, key=lambda x: -x[1])[: args.top]:
+        print(f"  - {name:<40} {t / 1000:.1f} ms")
+
+    if args.budget is not None and median > args.budget:
+        print(f"startup exceeds budget of {args.budget:.1f} ms!")
+        exit(1)
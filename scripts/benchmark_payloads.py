@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to benchmark the validation of (large) requests payloads
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+import sys
+from pathlib import Path
+
+os.chdir(Path(__file__).parent.parent)
+sys.path.insert(0, os.getcwd())
+
+import json
+import statistics
+import timeit
+from argparse import ArgumentParser
+from argparse import RawTextHelpFormatter
+
+from src.models.application import *
+from src.models.filesmanager import *
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def parse_args(*args: str):
+    parser = ArgumentParser(
+        prog="benchmark payloads",
+        description="compares validation of requests payloads with and without the json fast path",
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--tasks",
+        type=int,
+        help="number of tasks in payload",
+        nargs="?",
+        default=10_000,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="number of repetitions per method",
+        nargs="?",
+        default=10,
+    )
+    args_parsed = parser.parse_args(args)
+    return args_parsed
+
+
+def create_payload(n: int, /) -> bytes:
+    tasks = [
+        {
+            "label": f"task {k}",
+            "options": {
+                "reset-queue": True,
+                "max-depth": 10,
+                "max-duration": "00:05:00",
+            },
+            "data": {
+                "inputs": {
+                    "location": "OS",
+                    "path": f"data/example/{k}",
+                },
+            },
+        }
+        for k in range(n)
+    ]
+    return json.dumps(tasks).encode()
+
+
+def validate_legacy(contents: bytes, /) -> RequestsPayload:
+    """
+    Validation as performed prior to the fast path
+    """
+    assets = json.loads(contents)
+    try:
+        return RequestsPayload.model_validate(assets)
+
+    except Exception as err:
+        try:
+            return ProxyConfig.model_validate(assets)
+
+        except Exception as _:
+            raise err
+
+
+# ----------------------------------------------------------------
+# EXECUTION
+# ----------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = parse_args(*sys.argv[1:])
+    contents = create_payload(args.tasks)
+    parser = PayloadParser[RequestsPayload](type_=RequestsPayload, managers={})
+
+    # sanity check
+    assert parser.parse(contents) == validate_legacy(contents)
+
+    methods = {
+        "legacy (json.loads + model_validate)": lambda: validate_legacy(contents),
+        "cached parser (validate_json)": lambda: parser.parse(contents),
+    }
+    # NOTE: interleave methods to reduce bias due to noise
+    times = {label: list[float]() for label in methods}
+    for _ in range(args.repeat):
+        for label, method in methods.items():
+            times[label].append(timeit.timeit(method, number=1))
+
+    print(f"payload of {args.tasks} tasks ({len(contents) / 1024:.1f} kb):")
+    for label, values in times.items():
+        print(f"- {label:<40} min {1000 * min(values):.2f} ms | median {1000 * statistics.median(values):.2f} ms")  # fmt: skip
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Script to benchmark the traversal algorithms on synthetic trees held in memory,
+i.e. free of effects of the kernel and the file system
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+import sys
+from pathlib import Path
+
+os.chdir(Path(__file__).parent.parent)
+sys.path.insert(0, os.getcwd())
+
+import statistics
+import time
+from argparse import ArgumentParser
+from argparse import RawTextHelpFormatter
+
+from src.algorithms.filesmanager import *
+from src.models.filesmanager import *
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def parse_args(*args: str):
+    parser = ArgumentParser(
+        prog="benchmark search",
+        description="measures the recursive search of wide, deep and skewed trees held in memory",
+        formatter_class=RawTextHelpFormatter,
+    )
+    parser.add_argument(
+        "--files",
+        type=int,
+        help="number of files per folder",
+        nargs="?",
+        default=10,
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        help="number of repetitions per tree",
+        nargs="?",
+        default=3,
+    )
+    args_parsed = parser.parse_args(args)
+    return args_parsed
+
+
+# ----------------------------------------------------------------
+# EXECUTION
+# ----------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = parse_args(*sys.argv[1:])
+    manager = MemoryFilesManager()
+
+    # NOTE: trees of roughly the same number of folders
+    t0 = time.perf_counter()
+    create_wide_tree(manager, path="wide", width=10, depth=4, files_per_folder=args.files)
+    create_deep_tree(manager, path="deep", depth=1_000, width=10, files_per_folder=args.files)  # fmt: skip
+    create_skewed_tree(manager, path="skewed", depth=20, files_per_folder=args.files)
+    elapsed = time.perf_counter() - t0
+    print(f"created {manager.n_folders} folders and {manager.n_files} files in {elapsed:.2f} s:")
+
+    for path in ["wide", "deep", "skewed"]:
+        times = list[float]()
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            n = sum(1 for _ in recursive_file_search(manager, path=path))
+            times.append(time.perf_counter() - t0)
+
+        median = statistics.median(times)
+        print(f"- {path:<8} {n:>8} files | min {1000 * min(times):.1f} ms | median {1000 * median:.1f} ms | {n / median:,.0f} files/s")  # fmt: skip
@@ -38,6 +38,8 @@ ENCODING = Literal[
 
 BASIC_FILETYPES = Literal[
     ".json",
+    ".ndjson",
+    ".jsonl",
     ".yaml",
     ".toml",
     ".xml",
@@ -51,6 +53,7 @@ class EnumMimeTypes(StrEnum):
     BYTES = "application/octet-stream"
     TEXT = "text/plain"
     JSON = "application/json"
+    NDJSON = "application/x-ndjson"
     # see https://learn.microsoft.com/previous-versions/office/office-2007-resource-kit/ee309278(v=office.12)
     XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
     YAML = "application/x-yaml"
@@ -60,6 +63,7 @@ MIME_TYPES = Literal[
     "application/octet-stream",
     "text/plain",
     "application/json",
+    "application/x-ndjson",
     "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     "application/x-yaml",
 ]
@@ -68,4 +72,5 @@ MIME_TYPES = Literal[
 MAP_MIME_TYPE_TO_FILETYPE: dict[MIME_TYPES, BASIC_FILETYPES] = {
     "application/x-yaml": ".yaml",
     "application/json": ".json",
+    "application/x-ndjson": ".ndjson",
 }
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+A minimal in-process registry of metrics,
+which can be rendered in the Prometheus text exposition format.
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import math
+from abc import ABC
+from abc import abstractmethod
+from bisect import bisect_left
+from threading import Lock
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "BUCKETS_LATENCY",
+    "BUCKETS_SIZE",
+    "METRICS",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# default buckets (in seconds)
+BUCKETS_LATENCY = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)  # fmt: skip
+# default buckets (counts)
+BUCKETS_SIZE = (1, 10, 100, 1_000, 10_000, 100_000, 1_000_000)
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class Metric(ABC):
+    """
+    Base class for metrics, optionally with labels.
+
+    ```py
+    errors = METRICS.counter("errors_total", "number of errors", labels=["kind"])
+    errors.labels(kind="timeout").inc()
+    ```
+    """
+
+    kind: str = "untyped"
+    name: str
+    help: str
+    label_names: tuple[str, ...]
+    _children: dict[tuple[str, ...], "Metric"]
+    _lock: Lock
+
+    def __init__(self, name: str, help: str, /, *, labels: list[str] | tuple[str, ...] = ()):
+        self.name = name
+        self.help = help
+        self.label_names = tuple(labels)
+        self._children = {}
+        self._lock = Lock()
+
+    def labels(self, **values: str):
+        """
+        Returns the child metric for a combination of label values.
+        """
+        key = tuple(str(values[name]) for name in self.label_names)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._create_child())
+        return child
+
+    def collect(self) -> list[str]:
+        """
+        Returns lines of the metric in the Prometheus text format.
+        """
+        lines = [
+            f"# HELP {self.name} {self.help}",
+            f"# TYPE {self.name} {self.kind}",
+        ]
+        if len(self.label_names) == 0:
+            lines.extend(self._samples(""))
+            return lines
+
+        for key, child in sorted(self._children.items()):
+            labels = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(self.label_names, key))  # fmt: skip
+            lines.extend(child._samples(labels))
+        return lines
+
+    def _create_child(self) -> "Metric":
+        return self.__class__(self.name, self.help)
+
+    @abstractmethod
+    def _samples(self, labels: str, /) -> list[str]:
+        """
+        Returns the sample lines of a single (child) metric with the given (formatted) labels.
+        """
+        ...
+
+
+class Counter(Metric):
+    """
+    A monotonically increasing value.
+    """
+
+    kind = "counter"
+    _value: float
+
+    def __init__(self, *_, **__):
+        super().__init__(*_, **__)
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def inc(self, amount: float = 1, /):
+        with self._lock:
+            self._value += amount
+
+    def _samples(self, labels: str, /) -> list[str]:
+        return [f"{self.name}{_braces(labels)} {_format(self._value)}"]
+
+
+class Gauge(Metric):
+    """
+    A value which can go up and down.
+    """
+
+    kind = "gauge"
+    _value: float
+
+    def __init__(self, *_, **__):
+        super().__init__(*_, **__)
+        self._value = 0.0
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def set(self, value: float, /):
+        # NOTE: assignment is atomic, hence no lock required
+        self._value = value
+
+    def inc(self, amount: float = 1, /):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1, /):
+        with self._lock:
+            self._value -= amount
+
+    def _samples(self, labels: str, /) -> list[str]:
+        return [f"{self.name}{_braces(labels)} {_format(self._value)}"]
+
+
+class Histogram(Metric):
+    """
+    Counts observations in (cumulative) buckets.
+    """
+
+    kind = "histogram"
+    buckets: tuple[float, ...]
+    _counts: list[int]
+    _sum: float
+    _count: int
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        /,
+        *,
+        labels: list[str] | tuple[str, ...] = (),
+        buckets: tuple[float, ...] = BUCKETS_LATENCY,
+    ):
+        super().__init__(name, help, labels=labels)
+        self.buckets = tuple(sorted(buckets))
+        # NOTE: last bucket is +Inf
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, value: float, /):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+            self._count += 1
+
+    def _create_child(self) -> "Histogram":
+        return Histogram(self.name, self.help, buckets=self.buckets)
+
+    def _samples(self, labels: str, /) -> list[str]:
+        sep = "," if labels else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip([*self.buckets, math.inf], self._counts):
+            cumulative += count
+            le = "+Inf" if bound == math.inf else _format(bound)
+            lines.append(f'{self.name}_bucket{{{labels}{sep}le="{le}"}} {cumulative}')
+        lines.append(f"{self.name}_sum{_braces(labels)} {_format(self._sum)}")
+        lines.append(f"{self.name}_count{_braces(labels)} {self._count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of all metrics of the process.
+
+    NOTE: metrics are registered idempotently,
+    i.e. registering a metric with an existing name returns the existing metric.
+    """
+
+    _metrics: dict[str, Metric]
+    _lock: Lock
+
+    def __init__(self):
+        self._metrics = {}
+        self._lock = Lock()
+
+    def counter(self, name: str, help: str, /, *, labels: list[str] | tuple[str, ...] = ()) -> Counter:  # fmt: skip
+        return self._register(Counter(name, help, labels=labels))
+
+    def gauge(self, name: str, help: str, /, *, labels: list[str] | tuple[str, ...] = ()) -> Gauge:  # fmt: skip
+        return self._register(Gauge(name, help, labels=labels))
+
+    def histogram(
+        self,
+        name: str,
+        help: str,
+        /,
+        *,
+        labels: list[str] | tuple[str, ...] = (),
+        buckets: tuple[float, ...] = BUCKETS_LATENCY,
+    ) -> Histogram:
+        return self._register(Histogram(name, help, labels=labels, buckets=buckets))
+
+    def render(self) -> str:
+        """
+        Renders all metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = [line for metric in metrics for line in metric.collect()]
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Metric, /):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def _braces(labels: str, /) -> str:
+    return f"{{{labels}}}" if labels else ""
+
+
+def _format(value: float, /) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str, /) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# ----------------------------------------------------------------
+# GLOBAL REGISTRY
+# ----------------------------------------------------------------
+
+METRICS = MetricsRegistry()
@@ -7,6 +7,7 @@
 
 import logging
 from functools import wraps
+from threading import RLock
 from typing import Any
 from typing import Callable
 from typing import Generic
@@ -74,19 +75,34 @@ def compute_once(method: Callable[[], RETURN]) -> Callable[[], RETURN]:
     and thereafter simply returns an internally stored value.
 
     If for some reason the value is destroyed, then recomputes this.
+
+    The computation is thread-safe, i.e. concurrent first calls only compute once.
+    To force recomputation upon the next call use `.reset()` on the decorated method.
     """
     _value = None
     _first = True
+    _lock = RLock()
 
     @wraps(method)
     def wrapped_method() -> RETURN:
         nonlocal _value
         nonlocal _first
-        if _first or _value is None:
-            _value = method()
-        _first = False
-        return _value
+        # NOTE: hot path - no locking once computed
+        if not _first and _value is not None:
+            return _value
+
+        with _lock:
+            if _first or _value is None:
+                _value = method()
+            _first = False
+            return _value
+
+    def reset():
+        nonlocal _first
+        with _lock:
+            _first = True
 
+    wrapped_method.reset = reset
     return wrapped_method
 
 
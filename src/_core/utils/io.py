@@ -6,13 +6,13 @@
 # ----------------------------------------------------------------
 
 import json
+import re
 from base64 import b64decode
 from base64 import b64encode
 from hashlib import sha256
 from io import BytesIO
 from typing import Any
-
-import yaml
+from typing import Generator
 
 from ..constants import *
 from .io_yaml import *
@@ -26,11 +26,19 @@ __all__ = [
     "decode_base_64",
     "encode_base_64",
     "hash_encode",
+    "iter_contents",
     "parse_contents",
     "read_yaml",
     "read_yaml_from_contents",
 ]
 
+# ----------------------------------------------------------------
+# LOCAL CONSTANTS
+# ----------------------------------------------------------------
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
 # ----------------------------------------------------------------
 # METHODS
 # ----------------------------------------------------------------
@@ -87,20 +95,20 @@ def read_yaml(path: str):
     """
     Reads yaml from a path and uses custom registered constructors for parsing.
     """
-    register_yaml_constructors()
     with open(path, "rb") as fp:
-        assets = yaml.load(fp, Loader=yaml.FullLoader)
+        assets = load_yaml(fp)
         return assets
 
 
-def read_yaml_from_contents(contents: bytes):
+def read_yaml_from_contents(contents: bytes, /, *, includes: list[str] | None = None):
     """
     Reads yaml from bytes and uses custom registered constructors for parsing.
+
+    NOTE: the paths of included files are appended to `includes` (if provided).
     """
-    register_yaml_constructors()
-    with BytesIOStream(contents) as fp:
-        assets = yaml.load(fp, Loader=yaml.FullLoader)
-        return assets
+    # NOTE: libyaml parses bytes directly (no need for a stream)
+    assets = load_yaml(contents, includes=includes)
+    return assets
 
 
 def parse_contents(
@@ -108,15 +116,90 @@ def parse_contents(
     /,
     *,
     format: BASIC_FILETYPES,
+    includes: list[str] | None = None,
 ) -> Any:
+    """
+    Parses contents in a given format.
+
+    NOTE: for `.yaml` the paths of included files are appended to `includes` (if provided).
+    """
     match format:
         case ".json":
             # read from contents (assumed to be in yaml-format)
             return json.loads(contents)
 
+        case ".ndjson" | ".jsonl":
+            # read from contents (one json-value per line)
+            return list(iter_contents(contents, format=format))
+
         case ".yaml":
             # read from contents (assumed to be in yaml-format)
-            return read_yaml_from_contents(contents)
+            return read_yaml_from_contents(contents, includes=includes)
 
         case _:
             raise ValueError(f"No read method developed for {format}")
+
+
+def iter_contents(
+    contents: bytes,
+    /,
+    *,
+    format: BASIC_FILETYPES,
+) -> Generator[Any, None, None]:
+    """
+    Lazily parses contents, yielding one value at a time:
+
+    - `.json` - the elements of a top-level array one by one (otherwise the entire value)
+    - `.ndjson`, `.jsonl` - the value on each (non-empty) line
+    - `.yaml` - each document (separated by `---`)
+    """
+    match format:
+        case ".json":
+            yield from iter_json_array(contents.decode("utf-8-sig"))
+
+        case ".ndjson" | ".jsonl":
+            for line in contents.splitlines():
+                if line.strip() == b"":
+                    continue
+                yield json.loads(line)
+
+        case ".yaml":
+            yield from load_yaml_all(contents)
+
+        case _:
+            raise ValueError(f"No streaming read method developed for {format}")
+
+
+def iter_json_array(text: str, /) -> Generator[Any, None, None]:
+    """
+    Parses the elements of a top-level json array one at a time
+    (without parsing the remainder of the array).
+    If the text is not an array, yields the entire value.
+    """
+    index = _JSON_WHITESPACE.match(text, 0).end()
+    if not text.startswith("[", index):
+        yield json.loads(text)
+        return
+
+    index = _JSON_WHITESPACE.match(text, index + 1).end()
+    if text.startswith("]", index):
+        index += 1
+
+    else:
+        while True:
+            value, index = _JSON_DECODER.raw_decode(text, index)
+            yield value
+
+            index = _JSON_WHITESPACE.match(text, index).end()
+            if text.startswith(",", index):
+                index = _JSON_WHITESPACE.match(text, index + 1).end()
+                continue
+
+            if text.startswith("]", index):
+                index += 1
+                break
+
+            raise json.JSONDecodeError("expected ',' or ']'", text, index)
+
+    if _JSON_WHITESPACE.match(text, index).end() != len(text):
+        raise json.JSONDecodeError("extra data", text, index)
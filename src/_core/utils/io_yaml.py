@@ -5,8 +5,12 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
+import os
 import re
 from contextvars import ContextVar
+from typing import Any
+from typing import BinaryIO
+from typing import Generator
 
 import yaml
 
@@ -15,6 +19,10 @@ import yaml
 # ----------------------------------------------------------------
 
 __all__ = [
+    "YamlIncludeCycleError",
+    "YamlLoader",
+    "load_yaml",
+    "load_yaml_all",
     "register_yaml_constructors",
 ]
 
@@ -24,6 +32,43 @@ __all__ = [
 
 _yaml_constructors_registered = ContextVar[bool]("constructors registered", default=False)
 
+# NOTE: (cache, stack) of included files - shared by all (nested) loaders within a single load
+_yaml_includes = ContextVar[tuple[dict[str, Any], list[str]] | None]("yaml includes", default=None)  # fmt: skip
+
+# sentinel for end of documents
+_END = object()
+
+# NOTE: use (much faster) libyaml bindings if available
+try:
+    _BaseLoader = yaml.CFullLoader
+
+except AttributeError as _:
+    _BaseLoader = yaml.FullLoader
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class YamlIncludeCycleError(ValueError):
+    """
+    Raised if yaml files (directly or indirectly) include themselves.
+    """
+
+    pass
+
+
+class YamlLoader(_BaseLoader):
+    """
+    Loader with the custom constructors registered,
+    based on the libyaml bindings (if available).
+
+    NOTE: subclassed, so that registration does not modify the loaders of `yaml` globally.
+    """
+
+    pass
+
+
 # ----------------------------------------------------------------
 # METHODS
 # ----------------------------------------------------------------
@@ -36,6 +81,7 @@ def register_yaml_constructors():
     if _yaml_constructors_registered.get():
         return
 
+    # NOTE: registers on default (python) loaders of yaml
     yaml.add_constructor(tag="!include", constructor=include_constructor)
     yaml.add_constructor(tag="!not", constructor=not_constructor)
     yaml.add_constructor(tag="!join", constructor=join_constructor)
@@ -45,22 +91,88 @@ def register_yaml_constructors():
     return
 
 
+def load_yaml(
+    stream: BinaryIO | bytes | str,
+    /,
+    *,
+    includes: list[str] | None = None,
+) -> Any:
+    """
+    Loads yaml using the custom constructors.
+
+    NOTE: within a single load, each included file is only parsed once
+    (and is shared by all places which include it).
+
+    NOTE: if `includes` is provided, the (absolute) paths of all files included
+    (directly or indirectly) are appended to it, e.g. to track them as dependencies.
+    """
+    state = _yaml_includes.get()
+    token = _yaml_includes.set(({}, [])) if state is None else None
+    try:
+        return yaml.load(stream, Loader=YamlLoader)
+
+    finally:
+        if includes is not None:
+            cache, _ = _yaml_includes.get()
+            includes.extend(path for path in cache if path not in includes)
+        if token is not None:
+            _yaml_includes.reset(token)
+
+
+def load_yaml_all(stream: BinaryIO | bytes | str, /) -> Generator[Any, None, None]:
+    """
+    Lazily loads all documents (separated by `---`) of a yaml stream.
+
+    NOTE: included files are shared across all documents.
+    """
+    documents = yaml.load_all(stream, Loader=YamlLoader)
+    state = _yaml_includes.get() or ({}, [])
+    while True:
+        # DEV-NOTE: only set state whilst parsing the next document,
+        # as the generator may be consumed in a different context
+        token = _yaml_includes.set(state)
+        try:
+            document = next(documents, _END)
+
+        finally:
+            _yaml_includes.reset(token)
+
+        if document is _END:
+            return
+
+        yield document
+
+
 # ----------------------------------------------------------------
 # PARTS
 # ----------------------------------------------------------------
 
 
 def include_constructor(loader: yaml.Loader, node: yaml.Node):
+    value = loader.construct_yaml_str(node)
+    # parse argument
+    m = re.match(pattern=r"^(.*)\/#\/?(.*)$", string=value)
+    path = m.group(1) if m else value
+    path_abs = os.path.abspath(path)
+
+    # NOTE: cycles are errors in the config and thus not suppressed
+    cache, stack = _yaml_includes.get() or ({}, [])
+    if path_abs in stack:
+        chain_str = " -> ".join([*stack, path_abs])
+        raise YamlIncludeCycleError(f"circular reference encountered whilst including yaml {chain_str}!")  # fmt: skip
+
     try:
-        value = loader.construct_yaml_str(node)
-        assert isinstance(value, str)
-        # parse argument
-        m = re.match(pattern=r"^(.*)\/#\/?(.*)$", string=value)
-        # read yaml from path
-        path = m.group(1) if m else value
-        register_yaml_constructors()
-        with open(path, "rb") as fp:
-            obj = yaml.load(fp, yaml.FullLoader)
+        # read yaml from path (once per load)
+        if path_abs in cache:
+            obj = cache[path_abs]
+        else:
+            stack.append(path_abs)
+            try:
+                with open(path, "rb") as fp:
+                    obj = cache[path_abs] = load_yaml(fp)
+            finally:
+                stack.pop()
+
         # get part of yaml
         keys_as_str = m.group(2) if m else ""
         keys = keys_as_str.split("/")
@@ -70,6 +182,9 @@ def include_constructor(loader: yaml.Loader, node: yaml.Node):
             obj = obj.get(key, dict())
         return obj
 
+    except YamlIncludeCycleError as err:
+        raise err
+
     except Exception as _:
         return None
 
@@ -100,3 +215,13 @@ def tuple_constructor(loader: yaml.Loader, node: yaml.Node):
 
     except Exception as _:
         return None
+
+
+# ----------------------------------------------------------------
+# REGISTRATION
+# ----------------------------------------------------------------
+
+YamlLoader.add_constructor("!include", include_constructor)
+YamlLoader.add_constructor("!not", not_constructor)
+YamlLoader.add_constructor("!join", join_constructor)
+YamlLoader.add_constructor("!tuple", tuple_constructor)
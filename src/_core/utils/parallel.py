@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+from typing import TypeVar
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "map_ordered",
+]
+
+# ----------------------------------------------------------------
+# LOCAL CONSTANTS/VARIABLES
+# ----------------------------------------------------------------
+
+T = TypeVar("T")
+RETURN = TypeVar("RETURN")
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def map_ordered(
+    method: Callable[[T], RETURN],
+    items: Iterable[T],
+    /,
+    *,
+    max_workers: int,
+    max_pending: int | None = None,
+    thread_name_prefix: str = "map-ordered",
+) -> Generator[RETURN, None, None]:
+    """
+    Applies a method concurrently (in a pool of threads) to a stream of items
+    and yields the results in the order of the items.
+
+    In contrast to `ThreadPoolExecutor.map`, the items are consumed lazily:
+    at most `max_pending` items (default: twice the number of workers) are in flight,
+    so that memory remains bounded and the first results are available early.
+
+    NOTE: if the consumer stops early, pending items are cancelled.
+    """
+    if max_workers <= 1:
+        yield from map(method, items)
+        return
+
+    max_pending = max(max_pending or 2 * max_workers, 1)
+    pending = deque[Future[RETURN]]()
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix) as executor:  # fmt: skip
+        try:
+            for item in items:
+                pending.append(executor.submit(method, item))
+                if len(pending) >= max_pending:
+                    yield pending.popleft().result()
+
+            while len(pending) > 0:
+                yield pending.popleft().result()
+
+        finally:
+            for future in pending:
+                future.cancel()
@@ -6,10 +6,14 @@
 # ----------------------------------------------------------------
 
 import json
+from collections.abc import Iterator
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Any
+from typing import Generator
 
 from pydantic import BaseModel
+from pydantic_core import to_json
 from safetywrap import Err
 from safetywrap import Ok
 from safetywrap import Result
@@ -24,6 +28,7 @@ __all__ = [
     "JSON_TYPE",
     "JSON_TYPE_BASIC",
     "serialise_any_as_object",
+    "serialise_any_as_stream",
     "serialise_any_as_text",
 ]
 
@@ -35,6 +40,13 @@ __all__ = [
 JSON_TYPE_BASIC = None | bool | str | int | float | datetime
 JSON_TYPE = JSON_TYPE_BASIC | list["JSON_TYPE"] | dict[str, "JSON_TYPE"]
 
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# NOTE: size (in bytes) from which chunks are emitted when streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
 # ----------------------------------------------------------------
 # METHODS
 # ----------------------------------------------------------------
@@ -121,3 +133,72 @@ def serialise_any_as_text(x: Any, /) -> Result[str, None]:
 
     # otherwise fail
     return Err(None)
+
+
+def serialise_any_as_stream(
+    x: Any,
+    /,
+    *,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+) -> Generator[bytes, None, None]:
+    """
+    Serialises any element incrementally as JSON (utf-8 encoded) chunks.
+
+    Lists, tuples, sets, mappings and iterators (e.g. generators) are written element by element,
+    without first being collected or converted to wrapper models,
+    so that memory usage does not scale with the size of the output.
+    All other elements (including pydantic models) are serialised via pydantic
+    (consistent with `serialise_any_as_object`).
+
+    NOTE: iterators are consumed lazily, i.e. only whilst the stream is being read.
+    """
+    buffer = bytearray()
+    for part in _serialise_parts(x):
+        buffer += part
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if len(buffer) > 0:
+        yield bytes(buffer)
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def _serialise_parts(x: Any, /) -> Generator[bytes, None, None]:
+    """
+    Recursively generates the parts of the JSON-serialisation of an element.
+    """
+    match x:
+        case bytes():
+            yield to_json(x.decode())
+
+        case Mapping():
+            yield b"{"
+            for k, (key, value) in enumerate(x.items()):
+                if k > 0:
+                    yield b","
+                yield to_json(str(key))
+                yield b":"
+                yield from _serialise_parts(value)
+            yield b"}"
+
+        case list() | tuple() | set() | frozenset() | Iterator():
+            yield b"["
+            for k, value in enumerate(x):
+                if k > 0:
+                    yield b","
+                yield from _serialise_parts(value)
+            yield b"]"
+
+        case _:
+            yield to_json(
+                x,
+                by_alias=True,
+                exclude_none=True,
+                inf_nan_mode="null",
+                serialize_unknown=True,
+            )
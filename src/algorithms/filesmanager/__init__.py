@@ -9,12 +9,29 @@ Algorithms to work with file systems
 # IMPORTS
 # ----------------------------------------------------------------
 
+from .duplicates import *
+from .estimate import *
+from .hashing import *
 from .search import *
+from .sniffing import *
+from .usage import *
 
 # ----------------------------------------------------------------
 # EXPORTS
 # ----------------------------------------------------------------
 
 __all__ = [
+    "MAGIC_NUMBERS",
+    "DiskUsage",
+    "DuplicateGroup",
+    "HashCache",
+    "compute_disk_usage",
+    "estimate_tree_size",
+    "find_duplicates",
+    "hash_file",
+    "hash_search_results",
+    "read_head",
     "recursive_file_search",
+    "sniff_content_type",
+    "sniff_search_results",
 ]
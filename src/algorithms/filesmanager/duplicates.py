@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detection of duplicate files
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import hashlib
+import logging
+import os
+from dataclasses import dataclass
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+
+from ..._core.constants import *
+from ..._core.metrics import *
+from ..._core.utils.parallel import *
+from ...models.application import *
+from ...models.filesmanager import *
+from .hashing import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "DuplicateGroup",
+    "find_duplicates",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+HEAD_SIZE = 4 * SIZE_1_KB
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_CANDIDATES = METRICS.counter("duplicates_candidates_total", "number of files remaining after each stage of duplicate detection", labels=["stage"])  # fmt: skip
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class DuplicateGroup:
+    """
+    Group of files with identical contents
+    """
+
+    size: int
+    digest: str
+    paths: list[str]
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def find_duplicates(
+    manager: FilesManager,
+    results: Iterable[tuple[int, str, str]],
+    /,
+    *,
+    algorithm: EnumHashAlgorithm = EnumHashAlgorithm.BLAKE2B,
+    min_size: int = 1,
+    head_size: int = HEAD_SIZE,
+    cache: HashCache | None = None,
+    max_workers: int = MAX_WORKERS,
+    guard: Callable[[], None] | None = None,
+) -> Generator[DuplicateGroup, None, None]:
+    """
+    Finds groups of duplicate files amongst the files found by a search (see `recursive_file_search`),
+    without hashing all files in full:
+
+    1. files are grouped by size, using the metadata of each folder (listed once per folder);
+    2. files of colliding sizes are grouped by a digest of their first and last `head_size` bytes;
+    3. only files which still collide are hashed in full.
+
+    The stages 2 and 3 are carried out in a pool of threads.
+    Groups are yielded in descending order of size (i.e. of wasted space per duplicate).
+
+    NOTE: files smaller than `min_size` (by default: empty files) are ignored.
+    NOTE: files which cannot be read (or no longer exist) are ignored.
+    NOTE: the `guard` (if given) is called after each file hashed in the stages 2 and 3
+    and raises in order to terminate the detection (e.g. once a deadline has passed).
+    """
+    # stage 1: group by size
+    by_size = dict[int, list[tuple[str, str]]]()
+    for path, filename, size in iter_sizes(manager, results):
+        if size >= min_size:
+            by_size.setdefault(size, []).append((path, filename))
+
+    candidates = [(size, item) for size, items in by_size.items() if len(items) > 1 for item in items]  # fmt: skip
+    METRIC_CANDIDATES.labels(stage="size").inc(len(candidates))
+
+    # stage 2: group by head/tail (small files are hashed in full right away)
+    def compute_partial(candidate: tuple[int, tuple[str, str]]) -> tuple[bool, str | None]:
+        size, (path, filename) = candidate
+        try:
+            file = manager.get_folder(path).get_file(filename)
+            if size <= 2 * head_size:
+                return True, hash_file(file, algorithm=algorithm, cache=cache)
+            return False, hash_head_tail(file, size=size, algorithm=algorithm, n=head_size)
+
+        except OSError as err:
+            logging.warning(f"could not read {path}/{filename}: {err}")
+            return False, None
+
+    by_partial = dict[tuple[int, bool, str], list[tuple[str, str]]]()
+    partials = map_ordered(compute_partial, candidates, max_workers=max_workers, thread_name_prefix="duplicates")  # fmt: skip
+    try:
+        for (size, item), (complete, digest) in zip(candidates, partials):
+            if guard is not None:
+                guard()
+            if digest is not None:
+                by_partial.setdefault((size, complete, digest), []).append(item)
+
+    finally:
+        # NOTE: cancels pending reads, if terminated by the guard
+        partials.close()
+
+    # stage 3: group by full digest
+    groups = dict[tuple[int, str], list[tuple[str, str]]]()
+    candidates = []
+    for (size, complete, digest), items in by_partial.items():
+        if len(items) <= 1:
+            continue
+        if complete:
+            groups[size, digest] = items
+            continue
+        candidates.extend((size, item) for item in items)
+
+    METRIC_CANDIDATES.labels(stage="partial").inc(len(candidates))
+
+    def compute_full(candidate: tuple[int, tuple[str, str]]) -> str | None:
+        _, (path, filename) = candidate
+        try:
+            file = manager.get_folder(path).get_file(filename)
+            return hash_file(file, algorithm=algorithm, cache=cache)
+
+        except OSError as err:
+            logging.warning(f"could not read {path}/{filename}: {err}")
+            return None
+
+    digests = map_ordered(compute_full, candidates, max_workers=max_workers, thread_name_prefix="duplicates")  # fmt: skip
+    try:
+        for (size, item), digest in zip(candidates, digests):
+            if guard is not None:
+                guard()
+            if digest is not None:
+                groups.setdefault((size, digest), []).append(item)
+
+    finally:
+        # NOTE: cancels pending reads, if terminated by the guard
+        digests.close()
+
+    for size, digest in sorted(groups, key=lambda key: -key[0]):
+        items = groups[size, digest]
+        if len(items) <= 1:
+            continue
+        paths = [manager.path_join(path, filename) for path, filename in items]
+        yield DuplicateGroup(size=size, digest=digest, paths=paths)
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def iter_sizes(
+    manager: FilesManager,
+    results: Iterable[tuple[int, str, str]],
+    /,
+) -> Generator[tuple[str, str, int], None, None]:
+    """
+    Attaches the sizes to the files found by a search.
+
+    NOTE: results of a search arrive folder by folder,
+    hence the metadata of each folder is only listed once.
+    NOTE: files (or folders) which vanished since the search (or cannot be accessed) are skipped.
+    """
+    path_current = None
+    folder = None
+    sizes = dict[str, int]()
+    for _, path, filename in results:
+        if path != path_current:
+            path_current = path
+            try:
+                folder = manager.get_folder(path)
+                columns = folder.get_files_meta_data_columns()
+                sizes = dict(zip(columns.names, columns.sizes))
+
+            except OSError as err:
+                logging.warning(f"could not list {path}: {err}")
+                folder = None
+
+        # NOTE: skip the remaining files of a folder which could not be listed
+        if folder is None:
+            continue
+
+        size = sizes.get(filename)
+        if size is None:
+            try:
+                size = folder.get_file(filename).size
+
+            except OSError as err:
+                logging.warning(f"could not read {path}/{filename}: {err}")
+                continue
+
+        yield path, filename, size
+
+
+def hash_head_tail(
+    file: FilesManagerFile,
+    /,
+    *,
+    size: int,
+    algorithm: EnumHashAlgorithm,
+    n: int = HEAD_SIZE,
+) -> str:
+    """
+    Computes a digest of the first and last `n` bytes of a file.
+
+    NOTE: for files without random access only the first `n` bytes are used.
+    """
+    h = hashlib.new(algorithm.value)
+    if isinstance(file, OSFilesManagerFile):
+        with open(file.path, "rb") as fp:
+            h.update(fp.read(n))
+            fp.seek(max(size - n, n))
+            h.update(fp.read(n))
+
+    else:
+        chunks = file.iter_chunks(chunk=n)
+        try:
+            h.update(next(chunks, b""))
+
+        finally:
+            chunks.close()
+
+    return f"{algorithm.value}:{h.hexdigest()}"
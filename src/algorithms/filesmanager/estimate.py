@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sampling based estimation of the size of directory trees
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import math
+import random
+import statistics
+import time
+from dataclasses import dataclass
+
+from ...models.application import *
+from ...models.filesmanager import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "estimate_tree_size",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+MIN_PROBES = 2
+
+# ----------------------------------------------------------------
+# LOCAL CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class FolderSample:
+    """
+    Cached listing of a folder visited during the estimation
+    """
+
+    n_files: int
+    mean_size: float
+    subfolders: list[str]
+    t_listing: float
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def estimate_tree_size(
+    manager: FilesManager,
+    /,
+    *,
+    path: str,
+    max_depth: int | None = None,
+    time_budget: float = 0.25,
+    max_probes: int = 500,
+    sample_files: int = 8,
+    seconds_per_file: float = 0.0,
+    confidence: float = 0.95,
+    seed: int | None = None,
+) -> SearchEstimate:
+    """
+    Estimates the number of folders, files and bytes within a directory,
+    as well as the expected duration of a full search,
+    without traversing the entire tree.
+
+    Uses Knuth's estimator: each probe walks from the root to a leaf,
+    at each level choosing a random subfolder and
+    weighting the observations by the product of the branching factors along the way.
+    Each probe yields an unbiased estimate,
+    the mean and standard error of which over all probes give the estimate and bounds.
+
+    @inputs
+
+    - `manager` - instance of `FilesManager` protocol for handling object in filessystem
+
+    - `path` <`string`> - path to directory to be estimated
+
+    - `max_depth` <`integer`> - (optional) depth beyond which probes do not descend
+
+    - `time_budget` <`number`> - time (in seconds) after which no further probes are started
+
+    - `max_probes` <`integer`> - maximum number of probes (at least 2 are performed)
+
+    - `sample_files` <`integer`> - number of files per folder whose sizes are sampled
+
+    - `seconds_per_file` <`number`> - expected cost (in seconds) of processing a file,
+        which is added to the (measured) cost of listing folders for the expected duration
+
+    - `confidence` <`number`> - confidence level of the bounds
+
+    - `seed` <`integer`> - (optional) seed for the random walks (for reproducibility)
+
+    NOTE: the estimator is unbiased, but has a heavy tail for unbalanced trees,
+    so the (normal) bounds are indicative only.
+    Lower bounds are at least the values actually observed.
+
+    NOTE: as probes share the upper levels of the tree,
+    folder listings are cached for the duration of the estimation.
+    """
+    rng = random.Random(seed)
+    cache = dict[str, FolderSample]()
+    samples = {"folders": list[float](), "files": list[float](), "bytes": list[float](), "duration": list[float]()}  # fmt: skip
+
+    t0 = time.perf_counter()
+    while len(samples["folders"]) < max(MIN_PROBES, max_probes):
+        # NOTE: always complete a minimal number of probes, to obtain bounds
+        if len(samples["folders"]) >= MIN_PROBES and time.perf_counter() - t0 >= time_budget:
+            break
+
+        est_folders = est_files = est_bytes = est_duration = 0.0
+        weight = 1
+        subpath = path
+        depth = 0
+        while True:
+            sample = cache.get(subpath)
+            if sample is None:
+                sample = cache[subpath] = sample_folder(manager, subpath, rng=rng, sample_files=sample_files)  # fmt: skip
+
+            est_folders += weight
+            est_files += weight * sample.n_files
+            est_bytes += weight * sample.n_files * sample.mean_size
+            est_duration += weight * (sample.t_listing + sample.n_files * seconds_per_file)
+
+            n_sub = len(sample.subfolders)
+            if n_sub == 0 or (max_depth is not None and depth >= max_depth):
+                break
+
+            weight *= n_sub
+            subpath = rng.choice(sample.subfolders)
+            depth += 1
+
+        samples["folders"].append(est_folders)
+        samples["files"].append(est_files)
+        samples["bytes"].append(est_bytes)
+        samples["duration"].append(est_duration)
+
+    elapsed = time.perf_counter() - t0
+
+    # values observed directly serve as lower bounds
+    observed = {
+        "folders": float(len(cache)),
+        "files": float(sum(sample.n_files for sample in cache.values())),
+        "bytes": 0.0,
+        "duration": 0.0,
+    }
+
+    z = statistics.NormalDist().inv_cdf((1 + confidence) / 2)
+    intervals = {
+        key: compute_interval(values, z=z, minimum=observed[key])
+        for key, values in samples.items()
+    }
+
+    return SearchEstimate(
+        probes=len(samples["folders"]),
+        folders_listed=len(cache),
+        elapsed=elapsed,
+        confidence=confidence,
+        **intervals,
+    )
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def sample_folder(
+    manager: FilesManager,
+    path: str,
+    /,
+    *,
+    rng: random.Random,
+    sample_files: int,
+) -> FolderSample:
+    """
+    Lists a folder and samples the sizes of (some of) its files
+    """
+    t0 = time.perf_counter()
+    folder = manager.get_folder(path)
+    filenames = list(folder.get_filenames())
+    subfolders = list(folder.get_subfolder_paths())
+    t_listing = time.perf_counter() - t0
+
+    # NOTE: not included in listing time, as the search itself does not stat files
+    mean_size = 0.0
+    if len(filenames) > 0 and sample_files > 0:
+        names = rng.sample(filenames, min(sample_files, len(filenames)))
+        mean_size = statistics.fmean(folder.get_file(name).size or 0 for name in names)
+
+    return FolderSample(
+        n_files=len(filenames),
+        mean_size=mean_size,
+        subfolders=subfolders,
+        t_listing=t_listing,
+    )
+
+
+def compute_interval(
+    values: list[float],
+    /,
+    *,
+    z: float,
+    minimum: float = 0.0,
+) -> EstimateInterval:
+    """
+    Computes mean and confidence bounds (via the standard error) of estimates
+    """
+    n = len(values)
+    mean = statistics.fmean(values)
+    err = statistics.stdev(values) / math.sqrt(n)
+    value = max(minimum, mean)
+    lower = max(minimum, mean - z * err)
+    upper = max(value, mean + z * err)
+    return EstimateInterval(
+        value=value,
+        lower=lower,
+        upper=upper,
+    )
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Hashing of contents of files
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import hashlib
+import logging
+import mmap
+import os
+import sqlite3
+from threading import Lock
+from typing import Generator
+from typing import Iterable
+
+from ..._core.constants import *
+from ..._core.metrics import *
+from ..._core.utils.parallel import *
+from ...models.application import *
+from ...models.filesmanager import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "HashCache",
+    "hash_file",
+    "hash_search_results",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+MAX_WORKERS = min(8, os.cpu_count() or 1)
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_HASHED = METRICS.counter("hash_files_total", "number of files hashed", labels=["cached"])  # fmt: skip
+METRIC_HASHED_BYTES = METRICS.counter("hash_bytes_total", "number of bytes read for hashing")  # fmt: skip
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class HashCache:
+    """
+    Persistent (sqlite) cache of digests of files on the local operating system,
+    keyed by `(device, inode, size, time of modification)` and the algorithm.
+
+    NOTE: files whose key is unchanged are assumed to have unchanged contents
+    and are hence never re-hashed.
+    NOTE: the cache is thread-safe.
+    """
+
+    path: str
+    _connection: sqlite3.Connection
+    _lock: Lock
+
+    def __init__(self, path: str = ":memory:", /):
+        self.path = path
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS digests (
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                algorithm TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                PRIMARY KEY (dev, ino, size, mtime_ns, algorithm)
+            ) WITHOUT ROWID
+            """
+        )
+        return
+
+    def get(self, key: tuple[int, int, int, int], algorithm: str, /) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT digest FROM digests WHERE dev = ? AND ino = ? AND size = ? AND mtime_ns = ? AND algorithm = ?",  # fmt: skip
+                (*key, algorithm),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key: tuple[int, int, int, int], algorithm: str, digest: str, /):
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO digests (dev, ino, size, mtime_ns, algorithm, digest) VALUES (?, ?, ?, ?, ?, ?)",  # fmt: skip
+                (*key, algorithm, digest),
+            )
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def hash_search_results(
+    manager: FilesManager,
+    results: Iterable[tuple[int, str, str]],
+    /,
+    *,
+    algorithm: EnumHashAlgorithm,
+    cache: HashCache | None = None,
+    max_workers: int = MAX_WORKERS,
+) -> Generator[tuple[int, str, str, str | None], None, None]:
+    """
+    Hashes the files found by a search (see `recursive_file_search`) in a pool of threads,
+    and yields the results (in their original order) together with the digests.
+
+    NOTE: the digest is `None` if the file could not be read.
+    """
+
+    def compute(result: tuple[int, str, str]) -> tuple[int, str, str, str | None]:
+        d, path, filename = result
+        try:
+            file = manager.get_folder(path).get_file(filename)
+            digest = hash_file(file, algorithm=algorithm, cache=cache)
+
+        except OSError as err:
+            logging.warning(f"could not hash {path}/{filename}: {err}")
+            digest = None
+
+        return d, path, filename, digest
+
+    yield from map_ordered(compute, results, max_workers=max_workers, thread_name_prefix="hash")  # fmt: skip
+
+
+def hash_file(
+    file: FilesManagerFile,
+    /,
+    *,
+    algorithm: EnumHashAlgorithm,
+    cache: HashCache | None = None,
+    chunk: int = SIZE_1_MB,
+) -> str:
+    """
+    Computes the digest of the contents of a file, in the form `<algorithm>:<hex digest>`.
+
+    Files on the local operating system are memory-mapped (with hints for sequential reads)
+    and their digests are cached, other files are streamed.
+
+    NOTE: hashing releases the GIL, hence files can be hashed concurrently in threads.
+    """
+    if isinstance(file, OSFilesManagerFile):
+        return hash_os_file(file.path, algorithm=algorithm, cache=cache, chunk=chunk)
+
+    h = hashlib.new(algorithm.value)
+    for contents in file.iter_chunks(chunk=chunk):
+        h.update(contents)
+        METRIC_HASHED_BYTES.inc(len(contents))
+
+    METRIC_HASHED.labels(cached="false").inc()
+    return f"{algorithm.value}:{h.hexdigest()}"
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def hash_os_file(
+    path: str,
+    /,
+    *,
+    algorithm: EnumHashAlgorithm,
+    cache: HashCache | None = None,
+    chunk: int = SIZE_1_MB,
+) -> str:
+    with open(path, "rb") as fp:
+        fd = fp.fileno()
+        meta = os.fstat(fd)
+        key = (meta.st_dev, meta.st_ino, meta.st_size, meta.st_mtime_ns)
+        digest = None if cache is None else cache.get(key, algorithm.value)
+        if digest is not None:
+            METRIC_HASHED.labels(cached="true").inc()
+            return digest
+
+        # NOTE: hints to the kernel to read ahead aggressively (only on some OS's)
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        h = hashlib.new(algorithm.value)
+        # NOTE: empty files cannot be mapped
+        if meta.st_size > 0:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                view = memoryview(mm)
+                try:
+                    for k in range(0, len(view), chunk):
+                        h.update(view[k : k + chunk])
+
+                finally:
+                    view.release()
+
+        METRIC_HASHED_BYTES.inc(meta.st_size)
+
+    METRIC_HASHED.labels(cached="false").inc()
+    digest = f"{algorithm.value}:{h.hexdigest()}"
+    if cache is not None:
+        cache.put(key, algorithm.value, digest)
+    return digest
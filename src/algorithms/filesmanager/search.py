@@ -9,9 +9,12 @@ Recursive search algorithms
 # IMPORTS
 # ----------------------------------------------------------------
 
+import time
 from collections import deque
+from typing import Callable
 from typing import Generator
 
+from ..._core.metrics import *
 from ...models.filesmanager import *
 
 # ----------------------------------------------------------------
@@ -22,6 +25,15 @@ __all__ = [
     "recursive_file_search",
 ]
 
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_FILES = METRICS.counter("search_files_total", "number of files found by search")  # fmt: skip
+METRIC_FOLDERS = METRICS.counter("search_folders_total", "number of folders listed by search")  # fmt: skip
+METRIC_LISTING = METRICS.histogram("search_folder_listing_seconds", "latency of listing contents of a folder")  # fmt: skip
+METRIC_FRONTIER = METRICS.gauge("search_frontier_size", "number of folders pending in (most recent) search")  # fmt: skip
+
 # ----------------------------------------------------------------
 # METHODS
 # ----------------------------------------------------------------
@@ -34,6 +46,7 @@ def recursive_file_search(
     path: str,
     skip_empty: bool = False,
     max_queue_size: int = 1_000_000,
+    on_folder: Callable[[int], None] | None = None,
 ) -> Generator[tuple[int, str, str], None, None]:
     """
     Uses a FIFO-queue to search for all files in a given directory
@@ -50,6 +63,9 @@ def recursive_file_search(
 
     - `max_queue_size` <`integer`> - a safety bound to prevent out of memory exceptions
 
+    - `on_folder` - (optional) callback, called after each folder has been processed
+        with the number of folders still pending
+
     @generates
 
     - `d` - current (relative) depth within directory,
@@ -62,6 +78,7 @@ def recursive_file_search(
     # create and initialise queue
     q = deque[tuple[int, str | list[str]]]()
     q.append((0, path))
+    n_pending = 1
 
     # keep alive as long as queue not empty
     while (L := len(q)) > 0:
@@ -80,27 +97,53 @@ def recursive_file_search(
 
         # otherwise entry is a path
         path = entry
+        n_pending -= 1
 
         # obtain folder handler
+        t0 = time.perf_counter()
         folder = manager.get_folder(path)
+        METRIC_FOLDERS.inc()
 
         # (optional) skip if folder empty
         if skip_empty and guard_empty_folder(folder):
+            METRIC_FRONTIER.set(n_pending)
+            if on_folder is not None:
+                on_folder(n_pending)
             continue
 
         # process filenames
-        for filename in folder.get_filenames():
-            # (optional) skip if file empty
-            # NOTE: only requests file object if needed
-            if skip_empty and guard_empty_file(folder, filename):
-                continue
-
-            # -> send result
-            yield d, path, filename
+        # NOTE: timer paused whilst results are consumed by caller
+        filenames = folder.get_filenames()
+        t_listing = time.perf_counter() - t0
+        n_files = 0
+        try:
+            for filename in filenames:
+                # (optional) skip if file empty
+                # NOTE: only requests file object if needed
+                if skip_empty and guard_empty_file(folder, filename):
+                    continue
+
+                # -> send result
+                n_files += 1
+                yield d, path, filename
+
+        finally:
+            # NOTE: update metrics once per folder (not per file) to keep overhead low
+            METRIC_FILES.inc(n_files)
 
         # process subfolders - create new tasks
-        if len(paths := folder.get_subfolder_paths()) > 0:
+        t0 = time.perf_counter()
+        paths = folder.get_subfolder_paths()
+        t_listing += time.perf_counter() - t0
+        if len(paths) > 0:
             q.append((d + 1, paths))
+            n_pending += len(paths)
+
+        METRIC_LISTING.observe(t_listing)
+        METRIC_FRONTIER.set(n_pending)
+
+        if on_folder is not None:
+            on_folder(n_pending)
 
     # DEV-NOTE: ensures that something is yielded for the empty case
     empty = list[tuple[int, str, str]]()
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Detection of content types of files (by their leading bytes)
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import logging
+import mimetypes
+import os
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+
+from ..._core.constants import *
+from ..._core.metrics import *
+from ..._core.utils.parallel import *
+from ...models.filesmanager import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "MAGIC_NUMBERS",
+    "read_head",
+    "sniff_content_type",
+    "sniff_search_results",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+HEAD_SIZE = 4 * SIZE_1_KB
+MAX_WORKERS = min(16, 2 * (os.cpu_count() or 1))
+
+MIME_EMPTY = "application/x-empty"
+MIME_TEXT = "text/plain"
+MIME_BINARY = "application/octet-stream"
+MIME_ZIP = "application/zip"
+
+# table of magic numbers: (offset, signature, content type)
+# NOTE: entries are matched in order, hence more specific signatures come first
+# NOTE: short signatures which also occur in text are validated (see `WEAK_SIGNATURES`)
+MAGIC_NUMBERS: list[tuple[int, bytes, str]] = [
+    # images
+    (0, b"\x89PNG\r\n\x1a\n", "image/png"),
+    (0, b"\xff\xd8\xff", "image/jpeg"),
+    (0, b"GIF87a", "image/gif"),
+    (0, b"GIF89a", "image/gif"),
+    (0, b"II*\x00", "image/tiff"),
+    (0, b"MM\x00*", "image/tiff"),
+    (0, b"BM", "image/bmp"),
+    (0, b"\x00\x00\x01\x00", "image/vnd.microsoft.icon"),
+    (0, b"8BPS", "image/vnd.adobe.photoshop"),
+    (8, b"WEBP", "image/webp"),
+    (4, b"ftypavif", "image/avif"),
+    (4, b"ftypheic", "image/heic"),
+    # audio/video
+    (8, b"WAVE", "audio/wav"),
+    (8, b"AVI ", "video/x-msvideo"),
+    (0, b"OggS", "audio/ogg"),
+    (0, b"fLaC", "audio/flac"),
+    (0, b"ID3", "audio/mpeg"),
+    (4, b"ftypqt", "video/quicktime"),
+    (4, b"ftyp", "video/mp4"),
+    (0, b"\x1a\x45\xdf\xa3", "video/webm"),
+    # documents
+    (0, b"%PDF-", "application/pdf"),
+    (0, b"%!PS", "application/postscript"),
+    (0, b"{\\rtf", "application/rtf"),
+    (0, b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/x-ole-storage"),
+    (0, b"wOFF", "font/woff"),
+    (0, b"wOF2", "font/woff2"),
+    # archives
+    (0, b"PK\x03\x04", MIME_ZIP),
+    (0, b"PK\x05\x06", MIME_ZIP),
+    (0, b"\x1f\x8b", "application/gzip"),
+    (0, b"BZh", "application/x-bzip2"),
+    (0, b"\xfd7zXZ\x00", "application/x-xz"),
+    (0, b"\x28\xb5\x2f\xfd", "application/zstd"),
+    (0, b"7z\xbc\xaf\x27\x1c", "application/x-7z-compressed"),
+    (0, b"Rar!\x1a\x07", "application/vnd.rar"),
+    (257, b"ustar", "application/x-tar"),
+    # data
+    (0, b"SQLite format 3\x00", "application/vnd.sqlite3"),
+    (0, b"PAR1", "application/vnd.apache.parquet"),
+    (0, b"\x89HDF\r\n\x1a\n", "application/x-hdf5"),
+    (0, b"\x93NUMPY", "application/x-npy"),
+    # executables
+    (0, b"\x7fELF", "application/x-elf"),
+    (0, b"MZ", "application/vnd.microsoft.portable-executable"),
+    (0, b"\x00asm", "application/wasm"),
+    (0, b"\xca\xfe\xba\xbe", "application/java-vm"),
+    (0, b"\xcf\xfa\xed\xfe", "application/x-mach-binary"),
+    # text formats with signatures
+    (0, b"<?xml", "application/xml"),
+    (0, b"#!", "text/x-script"),
+]
+
+# NOTE: the same container is used by several formats, which are only distinguished by their extensions
+ZIP_EXTENSIONS = {".docx", ".xlsx", ".pptx", ".odt", ".ods", ".odp", ".epub", ".jar", ".apk", ".whl"}  # fmt: skip
+
+BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+
+# NOTE: sizes of the DIB headers of the known versions of bitmaps
+BMP_DIB_HEADER_SIZES = {12, 40, 52, 56, 64, 108, 124}
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_SNIFFED = METRICS.counter("sniff_files_total", "number of files whose content type was sniffed", labels=["matched"])  # fmt: skip
+METRIC_SNIFFED_BYTES = METRICS.counter("sniff_bytes_total", "number of bytes read for sniffing content types")  # fmt: skip
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def sniff_search_results(
+    manager: FilesManager,
+    results: Iterable[tuple],
+    /,
+    *,
+    n: int = HEAD_SIZE,
+    max_workers: int = MAX_WORKERS,
+    max_pending: int | None = None,
+) -> Generator[tuple, None, None]:
+    """
+    Sniffs the content types of the files found by a search (see `recursive_file_search`),
+    by reading (at most) the first `n` bytes of each file in a pool of threads,
+    and yields the results (in their original order) with the content type appended.
+
+    NOTE: results need only start with `(d, path, filename)`,
+    so that the stage can be chained with others (e.g. `hash_search_results`).
+    NOTE: the content type is `None` if the file could not be read.
+    """
+
+    def compute(result: tuple) -> tuple:
+        _, path, filename, *_ = result
+        try:
+            file = manager.get_folder(path).get_file(filename)
+            head = read_head(file, n=n)
+            mime = sniff_content_type(head, filename=filename)
+
+        except OSError as err:
+            logging.warning(f"could not sniff {path}/{filename}: {err}")
+            mime = None
+
+        return *result, mime
+
+    # NOTE: reads are I/O bound, hence more items are kept in flight than for hashing
+    max_pending = max_pending or 4 * max_workers
+    yield from map_ordered(compute, results, max_workers=max_workers, max_pending=max_pending, thread_name_prefix="sniff")  # fmt: skip
+
+
+def sniff_content_type(
+    head: bytes,
+    /,
+    *,
+    filename: str | None = None,
+) -> str:
+    """
+    Determines the content type of a file from its leading bytes via a table of magic numbers.
+
+    The extension (of the `filename`) is only used to refine ambiguous results
+    (formats sharing a container, or the kind of plain text).
+    """
+    if len(head) == 0:
+        METRIC_SNIFFED.labels(matched="true").inc()
+        return MIME_EMPTY
+
+    _, ext = os.path.splitext(filename or "")
+    ext = ext.lower()
+    guessed, _ = mimetypes.guess_type(f"_{ext}", strict=False) if ext else (None, None)
+
+    for offset, signature, mime in MAGIC_NUMBERS:
+        if head.startswith(signature, offset):
+            # NOTE: weak signatures are only accepted if the remainder of the header is consistent
+            validate = WEAK_SIGNATURES.get(signature)
+            if validate is not None and not validate(head):
+                continue
+            METRIC_SNIFFED.labels(matched="true").inc()
+            if mime == MIME_ZIP and ext in ZIP_EXTENSIONS and guessed is not None:
+                return guessed
+            return mime
+
+    METRIC_SNIFFED.labels(matched="false").inc()
+    if not is_text(head):
+        return MIME_BINARY
+
+    # NOTE: the extension decides which kind of text (e.g. csv, json, ...)
+    if guessed is not None and (guessed.startswith("text/") or guessed in ("application/json", "application/xml", "application/javascript")):  # fmt: skip
+        return guessed
+    return MIME_TEXT
+
+
+def read_head(
+    file: FilesManagerFile,
+    /,
+    *,
+    n: int = HEAD_SIZE,
+) -> bytes:
+    """
+    Reads (at most) the first `n` bytes of a file,
+    without reading (or downloading) the remainder.
+    """
+    if isinstance(file, OSFilesManagerFile):
+        # NOTE: unbuffered, so that no more than requested is read
+        with open(file.path, "rb", buffering=0) as fp:
+            head = fp.read(n)
+
+    else:
+        chunks = file.iter_chunks(chunk=n)
+        try:
+            head = next(chunks, b"")
+
+        finally:
+            chunks.close()
+
+    METRIC_SNIFFED_BYTES.inc(len(head))
+    return head
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def is_text(head: bytes, /) -> bool:
+    """
+    Heuristic: leading bytes are text if they contain a byte-order mark
+    or decode as UTF-8 (allowing a truncated final character) without NUL bytes.
+    """
+    if head.startswith(BOMS):
+        return True
+
+    if b"\x00" in head:
+        return False
+
+    for k in range(4):
+        try:
+            head[: len(head) - k].decode("utf-8")
+            return True
+
+        except UnicodeDecodeError:
+            continue
+
+    return False
+
+
+def is_bmp(head: bytes, /) -> bool:
+    """
+    Validates the header of a bitmap via the size of its DIB header (at offset 14).
+    """
+    if len(head) < 18:
+        return False
+    size = int.from_bytes(head[14:18], "little")
+    return size in BMP_DIB_HEADER_SIZES
+
+
+def is_portable_executable(head: bytes, /) -> bool:
+    """
+    Validates the header of a (DOS) executable via the offset `e_lfanew` (at 0x3C),
+    which has to point to the signature of a portable executable (within the head).
+    """
+    if len(head) < 0x40:
+        return False
+    offset = int.from_bytes(head[0x3C:0x40], "little")
+    return offset >= 0x40 and head.startswith(b"PE\x00\x00", offset)
+
+
+def is_id3(head: bytes, /) -> bool:
+    """
+    Validates an ID3v2 tag via its (major) version, flags and (sync-safe) size.
+    """
+    if len(head) < 10:
+        return False
+    version, revision, flags = head[3], head[4], head[5]
+    if version not in (2, 3, 4) or revision == 0xFF or flags & 0x0F != 0:
+        return False
+    return all(byte < 0x80 for byte in head[6:10])
+
+
+# NOTE: validators for signatures too short to be conclusive by themselves
+WEAK_SIGNATURES: dict[bytes, Callable[[bytes], bool]] = {
+    b"BM": is_bmp,
+    b"MZ": is_portable_executable,
+    b"ID3": is_id3,
+}
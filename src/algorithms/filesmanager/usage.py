@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Disk usage of directory trees
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import heapq
+import logging
+import time
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Callable
+
+from ..._core.metrics import *
+from ...models.application import *
+from ...models.filesmanager import *
+from ...models.internal import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "DiskUsage",
+    "compute_disk_usage",
+]
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_FOLDERS = METRICS.counter("usage_folders_total", "number of folders listed for disk usage")  # fmt: skip
+METRIC_FAILURES = METRICS.counter("usage_folder_failures_total", "number of folders which could not be listed for disk usage")  # fmt: skip
+METRIC_LISTING = METRICS.histogram("usage_folder_listing_seconds", "latency of listing contents of a folder for disk usage")  # fmt: skip
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class DiskUsage:
+    """
+    Usage of the directories of a tree as columns,
+    i.e. the k-th entry of each column belongs to the k-th directory.
+
+    Directories are stored in breadth-first order (the root has index `0`),
+    hence parents always precede their children (`parents[k] < k`, except for the root whose parent is `-1`).
+
+    The columns `files`/`bytes` contain the usage of the files directly within each directory,
+    the columns `*_total` the cumulative usage of each directory and all its subdirectories.
+    """
+
+    paths: list[str] = field(default_factory=list)
+    depths: array = field(default_factory=lambda: array("q"))
+    parents: array = field(default_factory=lambda: array("q"))
+    files: array = field(default_factory=lambda: array("q"))
+    bytes: array = field(default_factory=lambda: array("q"))
+    folders_total: array = field(default_factory=lambda: array("q"))
+    files_total: array = field(default_factory=lambda: array("q"))
+    bytes_total: array = field(default_factory=lambda: array("q"))
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def append(self, path: str, /, *, depth: int, parent: int, files: int, bytes: int) -> int:  # fmt: skip
+        self.paths.append(path)
+        self.depths.append(depth)
+        self.parents.append(parent)
+        self.files.append(files)
+        self.bytes.append(bytes)
+        return len(self.paths) - 1
+
+    def rollup(self):
+        """
+        Computes the cumulative columns in a single (children-first) pass,
+        i.e. each directory adds its totals to its parent, without re-walking subtrees.
+        """
+        n = len(self)
+        self.folders_total = array("q", [0]) * n
+        self.files_total = array("q", self.files)
+        self.bytes_total = array("q", self.bytes)
+        # NOTE: children succeed their parents, hence are complete once reached in reverse order
+        for k in range(n - 1, 0, -1):
+            p = self.parents[k]
+            self.folders_total[p] += self.folders_total[k] + 1
+            self.files_total[p] += self.files_total[k]
+            self.bytes_total[p] += self.bytes_total[k]
+
+    def get_entry(self, k: int, /) -> DiskUsageEntry:
+        return DiskUsageEntry(
+            path=self.paths[k],
+            folders=self.folders_total[k],
+            files=self.files_total[k],
+            bytes=self.bytes_total[k],
+        )
+
+    def top(self, n: int, /) -> list[DiskUsageEntry]:
+        """
+        Returns the (at most) `n` heaviest directories, in descending order of their cumulative size.
+        """
+        indices = heapq.nlargest(n, range(len(self)), key=self.bytes_total.__getitem__)
+        return [self.get_entry(k) for k in indices]
+
+    def to_tree(
+        self,
+        *,
+        max_depth: int = 2,
+        max_children: int | None = None,
+    ) -> GenericTree[DiskUsageEntry]:
+        """
+        Summarises the usage as a tree of directories up to a (relative) depth,
+        whereby the children of each directory are sorted in descending order of their cumulative size.
+
+        NOTE: if `max_children` is set, the remaining children of a directory
+        are merged into a single entry with the path `<directory>/...`.
+        """
+        children = [list[int]() for _ in range(len(self))]
+        for k in range(1, len(self)):
+            if self.depths[k] <= max_depth:
+                children[self.parents[k]].append(k)
+
+        def build(k: int) -> DiskUsageEntry | GenericTree[DiskUsageEntry]:
+            indices = sorted(children[k], key=self.bytes_total.__getitem__, reverse=True)
+            if len(indices) == 0 and k > 0:
+                return self.get_entry(k)
+
+            tree = GenericTree[DiskUsageEntry](root=self.get_entry(k))
+            for j in indices[:max_children]:
+                tree.add(build(j))
+
+            rest = indices[max_children:] if max_children is not None else []
+            if len(rest) > 0:
+                tree.add(DiskUsageEntry(
+                    path=f"{self.paths[k]}/...",
+                    folders=sum(self.folders_total[j] + 1 for j in rest),
+                    files=sum(self.files_total[j] for j in rest),
+                    bytes=sum(self.bytes_total[j] for j in rest),
+                ))  # fmt: skip
+
+            return tree
+
+        return build(0)
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def compute_disk_usage(
+    manager: FilesManager,
+    /,
+    *,
+    path: str,
+    max_queue_size: int = 1_000_000,
+    on_folder: Callable[[int], None] | None = None,
+    guard: Callable[..., None] | None = None,
+) -> DiskUsage:
+    """
+    Computes the cumulative number of files/bytes per directory in a single traversal.
+
+    Each folder is listed once (see `get_listing`, which yields the columnar metadata of files
+    together with the paths to subfolders) and the totals are rolled up children-first afterwards (see `DiskUsage.rollup`).
+
+    @inputs
+
+    - `manager` - instance of `FilesManager` protocol for handling object in filessystem
+
+    - `path` <`string`> - path to directory to be traversed
+
+    - `max_queue_size` <`integer`> - a safety bound to prevent out of memory exceptions
+
+    - `on_folder` - (optional) callback, called after each folder has been processed
+        with the number of folders still pending
+
+    - `guard` - (optional) callback, called after each folder has been processed
+        with the keyword arguments `d` (depth) and `count` (number of files so far),
+        which raises in order to terminate the traversal
+
+    NOTE: subfolders which cannot be listed are logged and counted as empty,
+    whereas the failure to list the root (e.g. if it does not exist) is raised.
+    """
+    usage = DiskUsage()
+    q = deque[tuple[int, int, str]]()
+    q.append((0, -1, path))
+    count = 0
+
+    while (L := len(q)) > 0:
+        # safeguard to prevent memory issues
+        if L > max_queue_size:
+            raise MemoryError(f"queue {L} exceeds maximum size permitted {max_queue_size}")
+
+        d, parent, path = q.popleft()
+
+        t0 = time.perf_counter()
+        try:
+            folder = manager.get_folder(path)
+            columns, subpaths = folder.get_listing()
+
+        except OSError as err:
+            if d == 0:
+                raise
+            logging.warning(f"could not list {path}: {err}")
+            METRIC_FAILURES.inc()
+            columns = MetaDataColumns()
+            subpaths = []
+
+        METRIC_LISTING.observe(time.perf_counter() - t0)
+        METRIC_FOLDERS.inc()
+
+        k = usage.append(path, depth=d, parent=parent, files=len(columns), bytes=columns.total_size)  # fmt: skip
+        for subpath in subpaths:
+            q.append((d + 1, k, subpath))
+
+        count += len(columns)
+        if guard is not None:
+            guard(d=d, count=count)
+
+        if on_folder is not None:
+            on_folder(len(q))
+
+    usage.rollup()
+    return usage
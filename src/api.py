@@ -9,6 +9,7 @@ Entry point to serve as FastAPI-application
 # IMPORTS
 # ----------------------------------------------------------------
 
+import json
 import os
 import sys
 from pathlib import Path
@@ -31,6 +32,8 @@ from .setup import *
 # ----------------------------------------------------------------
 
 PID = os.getpid()
+# NOTE: used to pass on cli arguments to the worker processes
+ENV_WORKER_ARGS = "APP_API_WORKER_ARGS"
 # NOTE: need this in case Azurite blob storage is connected
 try:
     logger = logging.getLogger("azure.core.pipeline.policies")
@@ -40,26 +43,75 @@ except Exception as _:
     pass
 
 # ----------------------------------------------------------------
-# EXECUTION
+# METHODS
 # ----------------------------------------------------------------
 
-if __name__ == "__main__":
-    args = CliArguments(config.INFO).parse(*sys.argv[1:])
+
+def create_app():
+    """
+    Factory to create the app.
+
+    Called once in each worker process (after it has been forked/spawned)
+    and initialises the per-worker state, so that this is warm before the first request.
+    The settings are passed on from the main process via the environment.
+    """
+    args = json.loads(os.environ.get(ENV_WORKER_ARGS) or "{}")
+    verbose = args.get("verbose", False)
 
     config.pid.set(PID)
-    config.path_env.set(args.env)
-    config.path_logging.set(args.log)
-    config.path_config.set(args.config)
+    config.path_env.set(args.get("env", ".env"))
+    config.path_logging.set(args.get("log"))
+    config.path_config.set(args.get("config", "setup/config.yaml"))
+    config.api_workers.set(args.get("workers") or 1)
     config.initialise_application(
         name="app",
         serialise=False,
         log_to_files=True,
-        verbose=args.verbose,
+        verbose=verbose,
     )
 
-    # create app
+    # NOTE: state of jobs and admission control is held per worker process
+    if config.api_workers() > 1:
+        logging.warning("running with several worker processes - background jobs are disabled and admission control applies per worker")  # fmt: skip
+
+    # warm up per-worker state
+    # DEV-NOTE: connections to the queue are opened per request,
+    # as the blocking connections are not thread-safe
+    config.get_managers()
+    config.get_queue_parameters()
+    config.parser_config()
+    config.get_job_manager()
+    config.get_admission_controller()
+
     route = ""  # NOTE: only use "/xyz" do serve multiple application on the same port
-    app = create_ui(route=route, debug=args.verbose)
+    app = create_ui(route=route, debug=verbose)
+    return app
+
+
+# ----------------------------------------------------------------
+# EXECUTION
+# ----------------------------------------------------------------
+
+if __name__ == "__main__":
+    args = CliArguments(config.INFO).parse(*sys.argv[1:])
+    os.environ[ENV_WORKER_ARGS] = json.dumps(vars(args))
+
+    config.path_env.set(args.env)
+    host = config.http_ip.get()
+    port = config.http_port.get()
+
+    # run app in the current process
+    if args.workers <= 1:
+        app = create_app()
+        uvicorn.run(app=app, host=host, port=port)
 
-    # run app
-    uvicorn.run(app=app, host=config.http_ip.get(), port=config.http_port.get())
+    # run app in worker processes, each of which creates its own app
+    else:
+        uvicorn.run(
+            app="src.api:create_app",
+            factory=True,
+            host=host,
+            port=port,
+            workers=args.workers,
+            log_level="debug" if args.verbose else "info",
+        )
@@ -5,6 +5,7 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
+from ..._core.metrics import *
 from ...setup import *
 
 # ----------------------------------------------------------------
@@ -12,6 +13,7 @@ from ...setup import *
 # ----------------------------------------------------------------
 
 __all__ = [
+    "endpoint_metrics",
     "endpoint_ping",
     "endpoint_version",
 ]
@@ -27,3 +29,7 @@ def endpoint_ping() -> str:
 
 def endpoint_version() -> str:
     return config.VERSION
+
+
+def endpoint_metrics() -> str:
+    return METRICS.render()
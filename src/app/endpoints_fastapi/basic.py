@@ -10,7 +10,10 @@ including resources and endpoints.
 # IMPORTS
 # ----------------------------------------------------------------
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.routing import APIRouter
 from fastapi.security import HTTPBasic
 from fastapi.templating import Jinja2Templates
@@ -19,6 +22,7 @@ from fastapi_offline import FastAPIOffline
 from ...setup import *
 from .endpoints_basic import *
 from .endpoints_features import *
+from .endpoints_jobs import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -49,6 +53,7 @@ def create_ui(
         description=config.INFO.description,
         version=config.INFO.version,
         debug=debug,
+        lifespan=lifespan,
         # see https://fastapi.tiangolo.com/how-to/configure-swagger-ui
         # and https://swagger.io/docs/open-source-tools/swagger-ui/usage/configuration
         swagger_ui_parameters={
@@ -66,6 +71,17 @@ def create_ui(
     return app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Cancels all unfinished background jobs when the server stops,
+    as the (non-daemon) workers of the jobs would otherwise keep the process alive.
+    """
+    yield
+    # NOTE: blocks until running jobs have reached their next checkpoint
+    await run_in_threadpool(config.get_job_manager().shutdown)
+
+
 # def add_resources(
 #     app: FastAPI | APIRouter,
 #     /,
@@ -93,4 +109,5 @@ def add_endpoints(
 
     add_endpoints_basic(app, tag="Basic", route=route, sec=sec_http, tmplt=tmplt)
     add_endpoints_features(app, tag="Features", route=route, sec=sec_http, tmplt=tmplt)
+    add_endpoints_jobs(app, tag="Jobs", route=route, sec=sec_http, tmplt=tmplt)
     return
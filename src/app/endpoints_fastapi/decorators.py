@@ -6,6 +6,8 @@
 # ----------------------------------------------------------------
 
 import logging
+from collections.abc import Iterator
+from functools import cache
 from functools import wraps
 from typing import Any
 from typing import Awaitable
@@ -17,6 +19,8 @@ from typing import TypeVar
 from fastapi import HTTPException
 from fastapi import Request
 from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from fastapi.responses import StreamingResponse
 from fastapi.security import HTTPBasicCredentials
 from pydantic import BaseModel
 from safetywrap import Err
@@ -80,28 +84,35 @@ def catch_internal_server_error(
             logging.error(err)
             code = 422
             err_str = str(err)
+            retry_after = None
 
         except ExceptionWithData as err:
             logging.error(err)
             err_str = str(err)
             code = err.code or CODE_DEFAULT
+            retry_after = err.data.get("retry-after")
 
         except Exception as err:
             logging.error(err)
             err_str = error_with_trace(err)
             err_str = str(err)
             code = 500
+            retry_after = None
 
         except BaseException as err:
             logging.error(err)
             err_str = str(err)
             code = 500
+            retry_after = None
 
         # NOTE: headers MUST be string-valued!
         headers = dict(
             code=str(code),
             message=err_str,
         )
+        # NOTE: informs clients when to retry, e.g. upon 429 (too many requests)
+        if retry_after is not None:
+            headers["Retry-After"] = str(retry_after)
         raise HTTPException(status_code=code, detail=err_str, headers=headers)
 
     return wrapped_action
@@ -116,13 +127,16 @@ def output_as_bytes(
 ):
     """
     Decorates endpoint with parsed query params and deserialised body
+
+    NOTE: collections and iterators are streamed, so that large results
+    need not be held in memory (as a whole) and start arriving sooner.
     """
 
     @wraps(action)
     async def wrapped_action(
         *_: PARAMS.args,
         **__: PARAMS.kwargs,
-    ) -> JSONResponse:
+    ) -> Response:
         # run method
         result = await action(*_, **__)
 
@@ -136,6 +150,12 @@ def output_as_bytes(
             case Ok():
                 result = result.unwrap()
 
+        # stream large/lazy results
+        if isinstance(result, list | tuple | Iterator):
+            contents = serialise_any_as_stream(result)
+            response = StreamingResponse(contents, status_code=code, media_type="application/json")  # fmt: skip
+            return response
+
         # serialise result
         contents = serialise_any_as_object(result).unwrap_or(None)  # fmt: skip
 
@@ -184,13 +204,17 @@ def add_http_auth(
     return wrapped_action
 
 
+@cache
 def parse_payload(
     type_: type[BaseModel],
     /,
 ):
     """
     Parsers arbitrary payloads
+
+    NOTE: the parser (and its validators) are built once per type and reused across requests.
     """
+    parser = PayloadParser[MODEL](type_=type_, managers=config.get_managers())
 
     async def method(
         request: Request,
@@ -200,8 +224,6 @@ def parse_payload(
             content_type = request.headers.get("Content-Type")
             fmt = MAP_MIME_TYPE_TO_FILETYPE.get(content_type)
             contents = await request.body()
-
-            parser = PayloadParser[MODEL](type_=type_, managers=config.get_managers())
             payload = parser.parse(contents, format=fmt)
             return payload
 
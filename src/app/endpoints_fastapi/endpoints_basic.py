@@ -13,6 +13,7 @@ from typing import Annotated
 
 from fastapi import Depends
 from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
 from fastapi.responses import RedirectResponse
 from fastapi.routing import APIRouter
 from fastapi.security import HTTPBasic
@@ -82,3 +83,28 @@ def add_endpoints_basic(
     ):
         version = ep.endpoint_version()
         return version
+
+    @app.get(
+        "/metrics",
+        summary="Displays metrics of the (worker) process in the Prometheus text format",
+        tags=[tag],
+        include_in_schema=True,
+        response_class=PlainTextResponse,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+    ):
+        """
+        NOTE: requires the same basic authentication as the other endpoints exposing internal state
+        (configure `basic_auth` in the scrape config of Prometheus).
+
+        NOTE: if the server runs with multiple workers,
+        the metrics are those of the worker handling the request.
+        """
+        contents = ep.endpoint_metrics()
+        return PlainTextResponse(contents, media_type="text/plain; version=0.0.4")
@@ -13,14 +13,18 @@ from typing import Annotated
 
 from fastapi import Depends
 from fastapi import FastAPI
+from fastapi import Query
 from fastapi import Request
 from fastapi.routing import APIRouter
 from fastapi.security import HTTPBasic
 from fastapi.security import HTTPBasicCredentials
 from fastapi.templating import Jinja2Templates
+from starlette.concurrency import run_in_threadpool
 
 from ...features import *
 from ...models.application import *
+from ...models.jobs import *
+from ...setup import *
 from .decorators import *
 
 # ----------------------------------------------------------------
@@ -48,6 +52,8 @@ def add_endpoints_features(
     """
     Adds endpoints pertaining to the features of the repo.
     """
+    # NOTE: build parsers upon start up
+    parser = parse_payload(RequestsPayload)
 
     @app.post(
         "/feature/search-fs",
@@ -67,9 +73,250 @@ def add_endpoints_features(
         request: Request,
     ):
         # process body
-        parser = parse_payload(RequestsPayload)
         contents: RequestsPayload = await parser(request)
         tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action():
+            with admission.admit(keys):
+                return feat_searchfs.superfeature(tasks)
+
+        # perform feature
+        # NOTE: run in thread pool, so that the event loop is not blocked
+        # whilst waiting for admission or during the scan
+        result = await run_in_threadpool(action)
+        return result
+
+    @app.post(
+        "/feature/search-fs/estimate",
+        summary="Estimates the size and duration of the feature SEARCH-FS",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+        time_budget: Annotated[float, Query(alias="time-budget", gt=0, le=10)] = 0.25,
+    ):
+        """
+        Samples random paths through the directories of each task
+        and returns the estimated number of folders, files and bytes
+        as well as the expected duration (in seconds) of a full search,
+        each with confidence bounds.
+
+        Use this to choose `max-items` and `max-duration` before running the search.
+        """
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        # perform estimation
+        result = await run_in_threadpool(feat_searchfs.estimate, tasks, time_budget=time_budget)  # fmt: skip
+        return result
+
+    @app.post(
+        "/feature/search-fs/jobs",
+        summary="Submits the feature SEARCH-FS as a background job",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+    ):
+        """
+        Returns immediately with the id of the job,
+        which can be used to poll the status/progress of the job or to cancel it.
+        """
+        config.check_jobs_available()
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action(progress: JobProgress):
+            # NOTE: jobs are already bounded by the job manager,
+            # hence wait (until cancelled) instead of being rejected
+            with admission.admit(keys, queue=False, timeout=None, check=progress.check):
+                return feat_searchfs.superfeature(tasks, progress=progress)
+
+        # submit feature
+        manager = config.get_job_manager()
+        job = manager.submit(action, label=EnumFeatures.SEARCH_FS.value)
+        return job.summary()
+
+    @app.post(
+        "/feature/duplicates",
+        summary="Runs the feature DUPLICATES",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+    ):
+        """
+        Publishes each group of files with identical contents to the route of its task.
+        """
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action():
+            with admission.admit(keys):
+                return feat_duplicates.superfeature(tasks)
+
+        # perform feature
+        # NOTE: run in thread pool, so that the event loop is not blocked
+        result = await run_in_threadpool(action)
+        return result
+
+    @app.post(
+        "/feature/duplicates/jobs",
+        summary="Submits the feature DUPLICATES as a background job",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+    ):
+        """
+        Returns immediately with the id of the job,
+        which can be used to poll the status/progress of the job or to cancel it.
+        """
+        config.check_jobs_available()
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action(progress: JobProgress):
+            with admission.admit(keys, queue=False, timeout=None, check=progress.check):
+                return feat_duplicates.superfeature(tasks, progress=progress)
+
+        # submit feature
+        manager = config.get_job_manager()
+        job = manager.submit(action, label=EnumFeatures.DUPLICATES.value)
+        return job.summary()
+
+    @app.post(
+        "/feature/disk-usage",
+        summary="Runs the feature DISK-USAGE",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+    ):
+        """
+        Publishes a summary of the usage of disk space per directory to the route of each task.
+        """
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action():
+            with admission.admit(keys):
+                return feat_diskusage.superfeature(tasks)
+
         # perform feature
-        result = feat_searchfs.superfeature(tasks)
+        # NOTE: run in thread pool, so that the event loop is not blocked
+        result = await run_in_threadpool(action)
         return result
+
+    @app.post(
+        "/feature/disk-usage/jobs",
+        summary="Submits the feature DISK-USAGE as a background job",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        request: Request,
+    ):
+        """
+        Returns immediately with the id of the job,
+        which can be used to poll the status/progress of the job or to cancel it.
+        """
+        config.check_jobs_available()
+        # process body
+        contents: RequestsPayload = await parser(request)
+        tasks = parse_tasks(contents)
+        keys = get_scan_keys(tasks)
+        admission = config.get_admission_controller()
+
+        def action(progress: JobProgress):
+            with admission.admit(keys, queue=False, timeout=None, check=progress.check):
+                return feat_diskusage.superfeature(tasks, progress=progress)
+
+        # submit feature
+        manager = config.get_job_manager()
+        job = manager.submit(action, label=EnumFeatures.DISK_USAGE.value)
+        return job.summary()
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def get_scan_keys(tasks: list[RequestTask], /) -> list[str]:
+    """
+    Gets the keys (location + path prefix) under which the scans of the tasks are admitted.
+    """
+    depth = config.admission_prefix_depth()
+    keys = [
+        get_admission_key(task.data.inputs.location.value, task.data.inputs.path, depth=depth)
+        for task in tasks
+    ]
+    return keys
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+API endpoints for background jobs.
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from typing import Annotated
+
+from fastapi import Depends
+from fastapi import FastAPI
+from fastapi.routing import APIRouter
+from fastapi.security import HTTPBasic
+from fastapi.security import HTTPBasicCredentials
+from fastapi.templating import Jinja2Templates
+
+from ...setup import *
+from .decorators import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "add_endpoints_jobs",
+]
+
+# ----------------------------------------------------------------
+# ENDPOINTS
+# ----------------------------------------------------------------
+
+
+def add_endpoints_jobs(
+    app: FastAPI | APIRouter,
+    /,
+    *,
+    tag: str,
+    route: str,
+    sec: HTTPBasic,
+    tmplt: Jinja2Templates,
+):
+    """
+    Adds endpoints to monitor and cancel background jobs.
+    """
+
+    @app.get(
+        "/jobs",
+        summary="Lists the status of all retained jobs",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+    ):
+        config.check_jobs_available()
+        manager = config.get_job_manager()
+        return (job.summary() for job in manager.list())
+
+    @app.get(
+        "/jobs/{job_id}",
+        summary="Displays the status and live progress of a job",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        job_id: str,
+    ):
+        config.check_jobs_available()
+        manager = config.get_job_manager()
+        job = manager.get(job_id)
+        return job.summary()
+
+    @app.delete(
+        "/jobs/{job_id}",
+        summary="Cancels a job",
+        tags=[tag],
+        include_in_schema=True,
+    )
+    @catch_internal_server_error
+    @add_http_auth
+    @output_as_bytes
+    async def method(
+        # DEV-NOTE: add for @add_http_auth-decorator
+        http_cred: Annotated[HTTPBasicCredentials, Depends(sec)],
+        # end of decorator arguments
+        /,
+        *,
+        job_id: str,
+    ):
+        """
+        NOTE: running jobs are cancelled cooperatively,
+        i.e. they terminate upon processing the next folder/file.
+        """
+        config.check_jobs_available()
+        manager = config.get_job_manager()
+        job = manager.cancel(job_id)
+        return job.summary()
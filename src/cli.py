@@ -16,13 +16,10 @@ from pathlib import Path
 os.chdir(Path(__file__).parent.parent)
 sys.path.insert(0, os.getcwd())
 
-from ._core.logging import *
-from ._core.utils.basic import *
-from .features import *
-from .models.application import *
-from .queries import *
+# NOTE: only light modules are loaded up front, the application is loaded once the mode is known
+from .models.generated.application import EnumFeatures
 from .queries._console.cli import *
-from .setup import *
+from .setup.info import *
 
 # ----------------------------------------------------------------
 # LOCAL CONSTANTS
@@ -35,13 +32,20 @@ PID = os.getpid()
 # ----------------------------------------------------------------
 
 if __name__ == "__main__":
-    args = CliArguments(config.INFO).parse(*sys.argv[1:])
+    args = CliArguments(load_repo_info()).parse(*sys.argv[1:])
 
     # handle simple endpoints immediately
     if args.mode == EnumFeatures.VERSION:
-        print(config.VERSION)
+        print(get_version())
         exit(0)
 
+    from ._core.utils.basic import *
+    from ._core.utils.serialise import *
+    from .features import *
+    from .models.application import *
+    from .models.filesmanager import *
+    from .setup import config
+
     config.pid.set(PID)
     config.path_env.set(args.env)
     config.path_config.set(args.config)
@@ -54,10 +58,24 @@ if __name__ == "__main__":
     )
 
     match args.mode:
-        case EnumFeatures.SEARCH_FS:
+        case EnumFeatures.SEARCH_FS if args.estimate:
             payload = config.parser_requests().parse()
             tasks = parse_tasks(payload)
+            result = feat_searchfs.estimate(tasks)
+            print(serialise_any_as_text(result).unwrap_or(""))
+
+        case EnumFeatures.SEARCH_FS:
+            # NOTE: stream tasks, so that large payloads need not be parsed in full up front
+            tasks = iter_tasks_from_file(config.get_managers(), loc=EnumFilesSystem.OS, path=config.path_requests.get())  # fmt: skip
             feat_searchfs.superfeature(tasks)
 
+        case EnumFeatures.DUPLICATES:
+            tasks = iter_tasks_from_file(config.get_managers(), loc=EnumFilesSystem.OS, path=config.path_requests.get())  # fmt: skip
+            feat_duplicates.superfeature(tasks)
+
+        case EnumFeatures.DISK_USAGE:
+            tasks = iter_tasks_from_file(config.get_managers(), loc=EnumFilesSystem.OS, path=config.path_requests.get())  # fmt: skip
+            feat_diskusage.superfeature(tasks)
+
         case _ as mode:
             raise NotImplementedError(f"no feature implemented for {extract_string(mode)}")
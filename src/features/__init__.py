@@ -10,6 +10,8 @@ Submodule containing all features.
 # ----------------------------------------------------------------
 
 # NOTE: only import/export the submodules which are called as such
+from . import feat_diskusage
+from . import feat_duplicates
 from . import feat_searchfs
 
 # ----------------------------------------------------------------
@@ -17,5 +19,7 @@ from . import feat_searchfs
 # ----------------------------------------------------------------
 
 __all__ = [
+    "feat_diskusage",
+    "feat_duplicates",
     "feat_searchfs",
 ]
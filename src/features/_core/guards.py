@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from datetime import datetime
+from datetime import timedelta
+
+from ..._core.metrics import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "guard_limits",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def guard_limits(
+    *,
+    d: int,
+    count: int,
+    max_depth: int,
+    max_items: int,
+    max_duration: timedelta,
+    t_max: datetime,
+    metric: Counter | None = None,
+):
+    """
+    Applies guard clauses to terminate search algorithm if limits are breached
+
+    NOTE: trips are counted in the `metric` (if given) under the label `reason`.
+    """
+    # terminate if search takes too long
+    if datetime.now() > t_max:
+        if metric is not None:
+            metric.labels(reason="duration").inc()
+        raise TimeoutError(f"search algorithm terminated - exceeded maximum tolerated duration of {max_duration}")  # fmt: skip
+
+    # terminate if depth exceeds limits
+    if d > max_depth:
+        if metric is not None:
+            metric.labels(reason="depth").inc()
+        raise Exception(f"search algorithm terminated - directory depth exceeeded maximum tolerated depth of {max_depth}")  # fmt: skip
+
+    # terminate if number of items exceeds limits
+    if count > max_items:
+        if metric is not None:
+            metric.labels(reason="items").inc()
+        raise Exception(f"search algorithm terminated - item count exceeeded maximum tolerated value of {max_items}")  # fmt: skip
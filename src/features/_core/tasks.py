@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import logging
+import time
+from collections.abc import Iterable
+from collections.abc import Sized
+from typing import Callable
+
+from safetywrap import Err
+from safetywrap import Ok
+from safetywrap import Result
+
+from ..._core.metrics import *
+from ..._core.utils.serialise import *
+from ..._core.utils.time import *
+from ...models.apis.queue import *
+from ...models.application import *
+from ...models.internal.errors import *
+from ...models.jobs import *
+from ...setup import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "run_tasks",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def run_tasks(
+    tasks: Iterable[RequestTask],
+    /,
+    *,
+    feat: EnumFeatures,
+    feature: Callable[..., None],
+    metric: Histogram,
+    progress: JobProgress | None = None,
+) -> Result[str, list[JSON_TYPE]]:
+    """
+    Calls a feature for a list of tasks,
+    each of which is logged to its own route `[<feature>].[<label>]`.
+
+    NOTE: if run as a job, the `progress` is updated and checked for cancellation.
+
+    NOTE: tasks may be streamed (e.g. via `iter_tasks`),
+    in which case each task is started as soon as it has been parsed.
+
+    NOTE: the durations of the tasks are observed in the `metric` under the label `status`.
+    """
+    # NOTE: currently unused
+    # cfg_general = config.parser_config().parse()
+    errors = list[JSON_TYPE]()
+    msg_exchange = ""
+    n_tot = len(tasks) if isinstance(tasks, Sized) else None
+    n_run = 0
+    settings = config.get_queue_parameters()
+    if progress is not None:
+        progress.tasks_total = n_tot
+
+    """
+    Establish connection to message queue
+    """
+
+    with ChannelContext(settings) as chan:
+        # NOTE: flow control registers callbacks on connection, hence only create once
+        flow = FlowControl(chan)
+
+        # FIXME: publication to exchages fails when msg_exchange is not ""
+        # chan.exchange_declare(exchange=msg_exchange, exchange_type="direct")
+
+        # perform each task an log each case to different route
+        for task in tasks:
+            n_run += 1
+            msg_route = f"[{feat.value}].[{task.label}]"
+
+            # ensure case has its own route and that it is cleared
+            chan.queue_declare(queue=msg_route, durable=False, exclusive=False)
+            if task.options.reset_queue:
+                chan.queue_purge(queue=msg_route)
+
+            """
+            Run feature with error handling
+            """
+
+            t0 = time.perf_counter()
+            status = "failed"
+            try:
+                feature(
+                    chan,
+                    label=task.label,
+                    ref=task.data.inputs,
+                    options=task.options,
+                    msg_exchange=msg_exchange,
+                    msg_route=msg_route,
+                    flow=flow,
+                    progress=progress,
+                )
+                status = "succeeded"
+
+            except ExceptionWithData as err:
+                msg = str(err)
+                logging.error(msg)
+                err.add_data("label", task.label)
+                body = {
+                    "timestamp": get_datetime_stamp(),
+                    "message": str(err),
+                    "code": err.code or 500,
+                    "data": err.data,
+                }
+                errors.append(body)
+                contents = serialise_any_as_text(body).unwrap_or("")
+                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
+
+            except Exception as err:
+                msg = str(err)
+                logging.error(msg)
+                body = {
+                    "timestamp": get_datetime_stamp(),
+                    "message": msg,
+                    "data": {
+                        "label": task.label,
+                    },
+                }
+                errors.append(body)
+                contents = serialise_any_as_text(body).unwrap_or("")
+                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
+
+            except BaseException as err:
+                # DEV-NOTE: pass on all other kinds of exceptions
+                msg = f"task terminated - {err}"
+                body = {
+                    "timestamp": get_datetime_stamp(),
+                    "message": msg,
+                    "data": {
+                        "label": task.label,
+                    },
+                }
+                errors.append(body)
+                contents = serialise_any_as_text(body).unwrap_or("")
+                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
+                status = "terminated"
+                raise err
+
+            finally:
+                metric.labels(status=status).observe(time.perf_counter() - t0)
+
+            # NOTE: raises if job was cancelled
+            if progress is not None:
+                progress.add_task()
+
+    """
+    Finally error handling
+    """
+
+    # NOTE: streamed tasks are only counted once run
+    n_tot = n_run
+    if (n := len(errors)) > 0:
+        match n, n_tot:
+            case 1, 1:
+                # NOTE: logging superfluous
+                pass
+
+            case _, _ if n == n_tot:
+                logging.warning(f"all of the {n_tot} tasks failed")
+
+            case _:
+                logging.warning(f"{n} of the {n_tot} tasks failed")
+
+        return Err(errors)
+
+    """
+    No errors - all tasks successful
+    """
+
+    return Ok("success")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from datetime import datetime
+from functools import partial
+
+from pika.adapters.blocking_connection import BlockingChannel
+
+from ..._core.logging import *
+from ..._core.metrics import *
+from ..._core.utils.serialise import *
+from ..._core.utils.time import *
+from ...algorithms.filesmanager import *
+from ...models.apis.queue import *
+from ...models.application import *
+from ...models.filesmanager import *
+from ...models.jobs import *
+from ...setup import *
+from .._core import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "feature",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# NOTE: bounds the size of the published summary for wide directories
+MAX_CHILDREN = 20
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_GUARD = METRICS.counter("diskusage_guard_trips_total", "number of traversals terminated by guards", labels=["reason"])  # fmt: skip
+
+# ----------------------------------------------------------------
+# FEATURE
+# ----------------------------------------------------------------
+
+
+@echo_function(
+    tag="FEATURE - DISK-USAGE | '{label}'",
+    level="INFO",
+    depth=0,
+)
+def feature(
+    chan: BlockingChannel,
+    /,
+    *,
+    label: str,
+    ref: FileRef,
+    options: RequestTaskOptions,
+    msg_exchange: str,
+    msg_route: str,
+    flow: FlowControl | None = None,
+    progress: JobProgress | None = None,
+):
+    """
+    Feature `DISK-USAGE`
+
+    Traverses a directory once and publishes a single summary of the cumulative usage per directory,
+    consisting of the `top-n` heaviest directories and a tree of directories up to `summary-depth`
+    (instead of one message per file as in `SEARCH-FS`).
+    """
+    managers = config.get_managers()
+
+    # NOTE: the deadline also bounds pauses of the flow control
+    t_max = datetime.now() + options.max_duration
+
+    # configure flow control for publication to queue
+    flow = flow or FlowControl(chan)
+    flow.configure(
+        queue=msg_route,
+        rate=options.publish_rate,
+        burst=options.publish_burst,
+        high_watermark=options.queue_high_watermark,
+        low_watermark=options.queue_low_watermark,
+        deadline=t_max,
+    )
+
+    # locate directory in file system
+    root = ref.path
+    loc = ref.location
+    manager = managers[loc]
+
+    # create guard to safeguard against computational limits
+    guard = partial(
+        guard_limits,
+        max_depth=options.max_depth,
+        max_items=options.max_items,
+        max_duration=options.max_duration,
+        t_max=t_max,
+        metric=METRIC_GUARD,
+    )
+
+    usage = compute_disk_usage(
+        manager,
+        path=root,
+        on_folder=progress.update_folders if progress is not None else None,
+        guard=guard,
+    )
+
+    body = {
+        "timestamp": get_datetime_stamp(),
+        "path": root,
+        "folders": usage.folders_total[0],
+        "files": usage.files_total[0],
+        "bytes": usage.bytes_total[0],
+        "top": usage.top(options.top_n),
+        "tree": usage.to_tree(max_depth=options.summary_depth, max_children=MAX_CHILDREN),
+    }
+    contents = serialise_any_as_text(body).unwrap_or("")
+    flow.publish(
+        exchange=msg_exchange,
+        routing_key=msg_route,
+        body=contents,
+        properties=RABBIT_LOG_LEVEL_INFO,
+    )
+    return
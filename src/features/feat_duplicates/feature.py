@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from datetime import datetime
+from functools import partial
+
+from pika.adapters.blocking_connection import BlockingChannel
+
+from ..._core.logging import *
+from ..._core.metrics import *
+from ..._core.utils.serialise import *
+from ..._core.utils.time import *
+from ...algorithms.filesmanager import *
+from ...models.apis.queue import *
+from ...models.application import *
+from ...models.filesmanager import *
+from ...models.jobs import *
+from ...setup import *
+from .._core import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "feature",
+]
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_PUBLISHED = METRICS.histogram("duplicates_published_groups", "number of groups of duplicates published per task", buckets=BUCKETS_SIZE)  # fmt: skip
+METRIC_GUARD = METRICS.counter("duplicates_guard_trips_total", "number of searches terminated by guards", labels=["reason"])  # fmt: skip
+
+# ----------------------------------------------------------------
+# FEATURE
+# ----------------------------------------------------------------
+
+
+@echo_function(
+    tag="FEATURE - DUPLICATES | '{label}'",
+    level="INFO",
+    depth=0,
+)
+def feature(
+    chan: BlockingChannel,
+    /,
+    *,
+    label: str,
+    ref: FileRef,
+    options: RequestTaskOptions,
+    msg_exchange: str,
+    msg_route: str,
+    flow: FlowControl | None = None,
+    progress: JobProgress | None = None,
+):
+    """
+    Feature `DUPLICATES`
+
+    Searches a directory (as in `SEARCH-FS`) and publishes each group of files with identical contents.
+    Files are compared by size first, then by their first/last few KB and only then by full digests
+    (using the algorithm of the option `hash`, by default blake2b).
+    """
+    managers = config.get_managers()
+
+    # NOTE: the deadline also bounds pauses of the flow control
+    t_max = datetime.now() + options.max_duration
+
+    # configure flow control for publication to queue
+    flow = flow or FlowControl(chan)
+    flow.configure(
+        queue=msg_route,
+        rate=options.publish_rate,
+        burst=options.publish_burst,
+        high_watermark=options.queue_high_watermark,
+        low_watermark=options.queue_low_watermark,
+        deadline=t_max,
+    )
+
+    # locate directory in file system
+    root = ref.path
+    loc = ref.location
+    manager = managers[loc]
+
+    # create guard to safeguard against computational limits
+    guard = partial(
+        guard_limits,
+        max_depth=options.max_depth,
+        max_items=options.max_items,
+        max_duration=options.max_duration,
+        t_max=t_max,
+        metric=METRIC_GUARD,
+    )
+
+    # NOTE: algorithm returns a generator
+    results = recursive_file_search(
+        manager,
+        path=root,
+        skip_empty=options.skip_empty,
+        on_folder=progress.update_folders if progress is not None else None,
+    )
+
+    # apply guards (during the search) to prevent unlimited search duration
+    def guarded(results):
+        for count, (d, subpath, filename) in enumerate(results, start=1):
+            guard(d=d, count=count)
+            # NOTE: raises if job was cancelled
+            if progress is not None:
+                progress.add_file()
+            yield d, subpath, filename
+
+    # apply guards (whilst comparing contents) to prevent unlimited duration after the search
+    def guard_compare():
+        # NOTE: only the duration is relevant, depth and count have already been checked
+        guard(d=0, count=0)
+        # NOTE: raises if job was cancelled
+        if progress is not None:
+            progress.check()
+
+    groups = find_duplicates(
+        manager,
+        guarded(results),
+        algorithm=options.hash or EnumHashAlgorithm.BLAKE2B,
+        cache=config.get_hash_cache(),
+        guard=guard_compare,
+    )
+
+    n_published = 0
+    try:
+        for group in groups:
+            body = {
+                "timestamp": get_datetime_stamp(),
+                "size": group.size,
+                "digest": group.digest,
+                "paths": group.paths,
+            }
+            contents = serialise_any_as_text(body).unwrap_or("")
+            flow.publish(
+                exchange=msg_exchange,
+                routing_key=msg_route,
+                body=contents,
+                properties=RABBIT_LOG_LEVEL_INFO,
+            )
+            n_published += 1
+
+            # NOTE: raises if job was cancelled
+            if progress is not None:
+                progress.check()
+
+    finally:
+        METRIC_PUBLISHED.observe(n_published)
+
+    return
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from collections.abc import Iterable
+
+from safetywrap import Result
+
+from ..._core.metrics import *
+from ..._core.utils.serialise import *
+from ...models.application import *
+from ...models.jobs import *
+from .._core import *
+from .feature import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "superfeature",
+]
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_TASKS = METRICS.histogram("duplicates_task_seconds", "duration of tasks", labels=["status"])  # fmt: skip
+
+# ----------------------------------------------------------------
+# WRAPPED FEATURES
+# ----------------------------------------------------------------
+
+
+def superfeature(
+    tasks: Iterable[RequestTask],
+    /,
+    *,
+    progress: JobProgress | None = None,
+) -> Result[str, list[JSON_TYPE]]:
+    """
+    Calls `DUPLICATES` features for a list of tasks
+
+    NOTE: if run as a job, the `progress` is updated and checked for cancellation.
+
+    NOTE: tasks may be streamed (e.g. via `iter_tasks`),
+    in which case each task is started as soon as it has been parsed.
+    """
+    return run_tasks(
+        tasks,
+        feat=EnumFeatures.DUPLICATES,
+        feature=feature,
+        metric=METRIC_TASKS,
+        progress=progress,
+    )
@@ -9,6 +9,7 @@ Submodule for the SEARCH-FS feature
 # IMPORTS
 # ----------------------------------------------------------------
 
+from .estimate import *
 from .superfeature import *
 
 # ----------------------------------------------------------------
@@ -16,5 +17,6 @@ from .superfeature import *
 # ----------------------------------------------------------------
 
 __all__ = [
+    "estimate",
     "superfeature",
 ]
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from ..._core.logging import *
+from ...algorithms.filesmanager import *
+from ...models.application import *
+from ...setup import *
+from .feature import METRIC_PUBLISH
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "estimate",
+]
+
+# ----------------------------------------------------------------
+# FEATURE
+# ----------------------------------------------------------------
+
+
+@echo_function(
+    tag="FEATURE - SEARCH-FS (estimate)",
+    level="INFO",
+    depth=0,
+)
+def estimate(
+    tasks: list[RequestTask],
+    /,
+    *,
+    time_budget: float = 0.25,
+) -> list[dict]:
+    """
+    Estimates the size of the search (and its duration) for each task,
+    without performing it and without connecting to the message queue.
+
+    NOTE: the cost of publishing a file is based on the latencies observed so far
+    (if any) and on the publication rate of the task (if limited).
+    """
+    managers = config.get_managers()
+
+    results = []
+    for task in tasks:
+        ref = task.data.inputs
+        manager = managers[ref.location]
+
+        seconds_per_file = METRIC_PUBLISH.sum / METRIC_PUBLISH.count if METRIC_PUBLISH.count > 0 else 0.0  # fmt: skip
+        if task.options.publish_rate:
+            seconds_per_file = max(seconds_per_file, 1 / task.options.publish_rate)
+
+        result = estimate_tree_size(
+            manager,
+            path=ref.path,
+            max_depth=task.options.max_depth,
+            time_budget=time_budget,
+            seconds_per_file=seconds_per_file,
+        )
+        results.append({"label": task.label, "estimate": result})
+
+    return results
@@ -5,20 +5,23 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
+import time
 from datetime import datetime
-from datetime import timedelta
 from functools import partial
 
 from pika.adapters.blocking_connection import BlockingChannel
 
 from ..._core.logging import *
+from ..._core.metrics import *
 from ..._core.utils.serialise import *
 from ..._core.utils.time import *
 from ...algorithms.filesmanager import *
 from ...models.apis.queue import *
 from ...models.application import *
 from ...models.filesmanager import *
+from ...models.jobs import *
 from ...setup import *
+from .._core import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -28,6 +31,14 @@ __all__ = [
     "feature",
 ]
 
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_PUBLISH = METRICS.histogram("searchfs_publish_seconds", "latency of publishing a message to the queue (incl. flow control)")  # fmt: skip
+METRIC_PUBLISHED = METRICS.histogram("searchfs_published_messages", "number of messages published per task", buckets=BUCKETS_SIZE)  # fmt: skip
+METRIC_GUARD = METRICS.counter("searchfs_guard_trips_total", "number of searches terminated by guards", labels=["reason"])  # fmt: skip
+
 # ----------------------------------------------------------------
 # FEATURE
 # ----------------------------------------------------------------
@@ -47,6 +58,8 @@ def feature(
     options: RequestTaskOptions,
     msg_exchange: str,
     msg_route: str,
+    flow: FlowControl | None = None,
+    progress: JobProgress | None = None,
 ):
     """
     Feature `SEARCH-FS`
@@ -55,6 +68,20 @@ def feature(
     # cfg_general = config.parser_config().parse()
     managers = config.get_managers()
 
+    # NOTE: the deadline also bounds pauses of the flow control
+    t_max = datetime.now() + options.max_duration
+
+    # configure flow control for publication to queue
+    flow = flow or FlowControl(chan)
+    flow.configure(
+        queue=msg_route,
+        rate=options.publish_rate,
+        burst=options.publish_burst,
+        high_watermark=options.queue_high_watermark,
+        low_watermark=options.queue_low_watermark,
+        deadline=t_max,
+    )
+
     # locate directory in file system
     root = ref.path
     loc = ref.location
@@ -66,65 +93,73 @@ def feature(
         max_depth=options.max_depth,
         max_items=options.max_items,
         max_duration=options.max_duration,
-        t_max=datetime.now() + options.max_duration,
+        t_max=t_max,
+        metric=METRIC_GUARD,
     )
 
-    # run search algorithm and apply guards to prevent unlimited search duration
-    for count, (d, subpath, filename) in enumerate(
-        # NOTE: algorithm returns a generator
-        recursive_file_search(
-            manager,
-            path=root,
-            skip_empty=options.skip_empty,
-        ),
-        # keep track of number of items found
-        start=1,
-    ):
-        # apply guard
-        guard(d=d, count=count)
-
-        # if not blocked by guard log to queue
-        body = {
-            "timestamp": get_datetime_stamp(),
-            "path": subpath,
-            "filename": filename,
-        }
-        contents = serialise_any_as_text(body).unwrap_or("")
-        chan.basic_publish(
-            exchange=msg_exchange,
-            routing_key=msg_route,
-            body=contents,
-            properties=RABBIT_LOG_LEVEL_INFO,
-        )
-
-    return
-
-
-# ----------------------------------------------------------------
-# AUXILIARY METHODS
-# ----------------------------------------------------------------
-
-
-def guard_limits(
-    *,
-    d: int,
-    count: int,
-    max_depth: int,
-    max_items: int,
-    max_duration: timedelta,
-    t_max: datetime,
-):
-    """
-    Applies guard clauses to terminate search algorithm if limits are breached
-    """
-    # terminate if search takes too long
-    if datetime.now() > t_max:
-        raise TimeoutError(f"search algorithm terminated - exceeded maximum tolerated duration of {max_duration}")  # fmt: skip
+    # NOTE: algorithm returns a generator
+    results = recursive_file_search(
+        manager,
+        path=root,
+        skip_empty=options.skip_empty,
+        on_folder=progress.update_folders if progress is not None else None,
+    )
 
-    # terminate if depth exceeds limits
-    if d > max_depth:
-        raise Exception(f"search algorithm terminated - directory depth exceeeded maximum tolerated depth of {max_depth}")  # fmt: skip
+    # apply guards (during the search) to prevent unlimited search duration
+    # NOTE: the subsequent stages read ahead, hence files beyond the limits must not enter them
+    def guarded(results):
+        for count, (d, subpath, filename) in enumerate(results, start=1):
+            guard(d=d, count=count)
+            yield d, subpath, filename
+
+    results = guarded(results)
+
+    # (optional) hash contents of files concurrently (results remain in order)
+    if options.hash is not None:
+        results = hash_search_results(manager, results, algorithm=options.hash, cache=config.get_hash_cache())  # fmt: skip
+    else:
+        results = ((d, subpath, filename, None) for d, subpath, filename in results)
+
+    # (optional) detect content types of files from their first few KB (results remain in order)
+    if options.sniff:
+        results = sniff_search_results(manager, results)
+    else:
+        results = ((*result, None) for result in results)
+
+    # run search algorithm and publish results
+    n_published = 0
+    try:
+        # NOTE: keep track of number of items found
+        for count, (d, subpath, filename, digest, mime) in enumerate(results, start=1):
+            # apply guard (again), as hashing/sniffing may take long
+            guard(d=d, count=count)
+
+            # if not blocked by guard log to queue
+            body = {
+                "timestamp": get_datetime_stamp(),
+                "path": subpath,
+                "filename": filename,
+            }
+            if digest is not None:
+                body["digest"] = digest
+            if mime is not None:
+                body["content-type"] = mime
+            contents = serialise_any_as_text(body).unwrap_or("")
+            t0 = time.perf_counter()
+            flow.publish(
+                exchange=msg_exchange,
+                routing_key=msg_route,
+                body=contents,
+                properties=RABBIT_LOG_LEVEL_INFO,
+            )
+            METRIC_PUBLISH.observe(time.perf_counter() - t0)
+            n_published += 1
+
+            # NOTE: raises if job was cancelled
+            if progress is not None:
+                progress.add_file()
+
+    finally:
+        METRIC_PUBLISHED.observe(n_published)
 
-    # terminate if number of items exceeds limits
-    if count > max_items:
-        raise Exception(f"search algorithm terminated - item count exceeeded maximum tolerated value of {max_items}")  # fmt: skip
+    return
@@ -5,18 +5,15 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
-import logging
+from collections.abc import Iterable
 
-from safetywrap import Err
-from safetywrap import Ok
 from safetywrap import Result
 
+from ..._core.metrics import *
 from ..._core.utils.serialise import *
-from ..._core.utils.time import *
-from ...models.apis.queue import *
 from ...models.application import *
-from ...models.internal.errors import *
-from ...setup import *
+from ...models.jobs import *
+from .._core import *
 from .feature import *
 
 # ----------------------------------------------------------------
@@ -27,120 +24,35 @@ __all__ = [
     "superfeature",
 ]
 
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_TASKS = METRICS.histogram("searchfs_task_seconds", "duration of tasks", labels=["status"])  # fmt: skip
+
 # ----------------------------------------------------------------
 # WRAPPED FEATURES
 # ----------------------------------------------------------------
 
 
 def superfeature(
-    tasks: list[RequestTask],
+    tasks: Iterable[RequestTask],
     /,
+    *,
+    progress: JobProgress | None = None,
 ) -> Result[str, list[JSON_TYPE]]:
     """
     Calls `SEARCH-FS` features for a list of tasks
-    """
-    feat = EnumFeatures.SEARCH_FS
-    # NOTE: currently unused
-    # cfg_general = config.parser_config().parse()
-    errors = list[JSON_TYPE]()
-    msg_exchange = ""
-    n_tot = len(tasks)
-    settings = config.get_queue_parameters()
-
-    """
-    Establish connection to message queue
-    """
-
-    with ChannelContext(settings) as chan:
-        # FIXME: publication to exchages fails when msg_exchange is not ""
-        # chan.exchange_declare(exchange=msg_exchange, exchange_type="direct")
-
-        # perform each task an log each case to different route
-        for task in tasks:
-            msg_route = f"[{feat.value}].[{task.label}]"
-
-            # ensure case has its own route and that it is cleared
-            chan.queue_declare(queue=msg_route, durable=False, exclusive=False)
-            if task.options.reset_queue:
-                chan.queue_purge(queue=msg_route)
-
-            """
-            Run feature with error handling
-            """
 
-            try:
-                feature(
-                    chan,
-                    label=task.label,
-                    ref=task.data.inputs,
-                    options=task.options,
-                    msg_exchange=msg_exchange,
-                    msg_route=msg_route,
-                )
+    NOTE: if run as a job, the `progress` is updated and checked for cancellation.
 
-            except ExceptionWithData as err:
-                msg = str(err)
-                logging.error(msg)
-                err.add_data("label", task.label)
-                body = {
-                    "timestamp": get_datetime_stamp(),
-                    "message": str(err),
-                    "code": err.code or 500,
-                    "data": err.data,
-                }
-                errors.append(body)
-                contents = serialise_any_as_text(body).unwrap_or("")
-                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
-
-            except Exception as err:
-                msg = str(err)
-                logging.error(msg)
-                body = {
-                    "timestamp": get_datetime_stamp(),
-                    "message": msg,
-                    "data": {
-                        "label": task.label,
-                    },
-                }
-                errors.append(body)
-                contents = serialise_any_as_text(body).unwrap_or("")
-                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
-
-            except BaseException as err:
-                # DEV-NOTE: pass on all other kinds of exceptions
-                msg = f"task terminated - {err}"
-                body = {
-                    "timestamp": get_datetime_stamp(),
-                    "message": msg,
-                    "data": {
-                        "label": task.label,
-                    },
-                }
-                errors.append(body)
-                contents = serialise_any_as_text(body).unwrap_or("")
-                chan.basic_publish(exchange=msg_exchange, routing_key=msg_route, body=contents, properties=RABBIT_LOG_LEVEL_ERROR)  # fmt: skip
-                raise err
-
-    """
-    Finally error handling
-    """
-
-    if (n := len(errors)) > 0:
-        match n, n_tot:
-            case 1, 1:
-                # NOTE: logging superfluous
-                pass
-
-            case _, _ if n == n_tot:
-                logging.warning(f"all of the {n_tot} tasks failed")
-
-            case _:
-                logging.warning(f"{n} of the {n_tot} tasks failed")
-
-        return Err(errors)
-
-    """
-    No errors - all tasks successful
+    NOTE: tasks may be streamed (e.g. via `iter_tasks`),
+    in which case each task is started as soon as it has been parsed.
     """
-
-    return Ok("success")
+    return run_tasks(
+        tasks,
+        feat=EnumFeatures.SEARCH_FS,
+        feature=feature,
+        metric=METRIC_TASKS,
+        progress=progress,
+    )
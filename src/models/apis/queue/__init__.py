@@ -6,6 +6,7 @@
 # ----------------------------------------------------------------
 
 from .channels import *
+from .flow import *
 from .logging import *
 
 # ----------------------------------------------------------------
@@ -20,4 +21,6 @@ __all__ = [
     "RABBIT_ROUTE_INFO",
     "RABBIT_ROUTE_WARNING",
     "ChannelContext",
+    "FlowControl",
+    "TokenBucket",
 ]
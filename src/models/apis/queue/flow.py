@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Flow control for publishing to the queue
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import logging
+import time
+from datetime import datetime
+from typing import Callable
+
+from pika import BasicProperties
+from pika.adapters.blocking_connection import BlockingChannel
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "FlowControl",
+    "TokenBucket",
+]
+
+# ----------------------------------------------------------------
+# LOCAL CONSTANTS
+# ----------------------------------------------------------------
+
+BACKOFF_MIN = 0.05  # seconds
+BACKOFF_MAX = 5.0  # seconds
+POLL_INTERVAL = 0.5  # seconds
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class TokenBucket:
+    """
+    A token bucket to limit the rate of an action.
+
+    Each call of `reserve` consumes tokens and returns the duration (in seconds)
+    the caller must wait before carrying out the action.
+    Tokens are refilled at a constant `rate` up to a maximum of `burst`.
+
+    ```py
+    bucket = TokenBucket(100, burst=10) # 100 actions per second
+    for _ in range(1000):
+        time.sleep(bucket.reserve())
+        ...
+    ```
+
+    NOTE: a `rate` of `None` means that the bucket never throttles.
+    """
+
+    _rate: float | None
+    _burst: float
+    _tokens: float
+    _t_last: float
+    _clock: Callable[[], float]
+
+    def __init__(
+        self,
+        rate: float | None,
+        /,
+        *,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        assert rate is None or rate > 0, "Rate must be positive!"
+        self._rate = rate
+        self._burst = float(max(burst, 1))
+        self._clock = clock
+        self._tokens = self._burst
+        self._t_last = clock()
+        return
+
+    @property
+    def unlimited(self) -> bool:
+        """
+        Whether or not the bucket throttles
+        """
+        return self._rate is None
+
+    @property
+    def tokens(self) -> float:
+        """
+        Current number of tokens (negative if reservations are outstanding)
+        """
+        self._refill()
+        return self._tokens
+
+    def reserve(self, n: int = 1, /) -> float:
+        """
+        Consumes `n` tokens and returns the duration to wait (in seconds)
+        until the tokens are actually available.
+        """
+        if self._rate is None:
+            return 0.0
+
+        self._refill()
+        self._tokens -= n
+        if self._tokens >= 0:
+            return 0.0
+
+        return -self._tokens / self._rate
+
+    def drain(self):
+        """
+        Empties the bucket, e.g. to prevent bursts after pauses.
+        """
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self):
+        t = self._clock()
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (t - self._t_last) * self._rate)
+        self._t_last = t
+
+
+class FlowControl:
+    """
+    Flow control layer for publication to a queue.
+
+    - reacts to `connection.blocked`/`connection.unblocked` notifications of the broker
+    - limits the rate of publication via a token bucket
+    - (optional) polls the depth of the target queue via a passive `queue_declare`
+      and pauses whilst the depth lies above a high watermark,
+      until it falls below a low watermark.
+
+    All waiting is carried out via the connection,
+    so that heartbeats and broker notifications continue to be processed.
+
+    ```py
+    with ChannelContext(settings) as chan:
+        flow = FlowControl(chan)
+        flow.configure(queue="...", rate=500, burst=50, high_watermark=100_000)
+        for body in ...:
+            flow.publish(exchange="", routing_key="...", body=body)
+    ```
+
+    NOTE: the callbacks are registered once per connection,
+    hence create one instance per channel and reconfigure it per task.
+
+    NOTE: if a `deadline` is configured, waiting beyond it raises a `TimeoutError`,
+    so that a stalled consumer cannot hang a task indefinitely.
+    """
+
+    _chan: BlockingChannel
+    _blocked: bool
+    _bucket: TokenBucket
+    _queue: str | None
+    _high_watermark: int | None
+    _low_watermark: int | None
+    _deadline: datetime | None
+    _t_poll: float
+
+    def __init__(self, chan: BlockingChannel, /):
+        self._chan = chan
+        self._blocked = False
+        connection = chan.connection
+        connection.add_on_connection_blocked_callback(self._on_blocked)
+        connection.add_on_connection_unblocked_callback(self._on_unblocked)
+        self.configure()
+        return
+
+    @property
+    def blocked(self) -> bool:
+        """
+        Whether or not the broker currently blocks publication
+        """
+        return self._blocked
+
+    def configure(
+        self,
+        /,
+        *,
+        queue: str | None = None,
+        rate: float | None = None,
+        burst: int = 100,
+        high_watermark: int | None = None,
+        low_watermark: int | None = None,
+        deadline: datetime | None = None,
+    ):
+        """
+        (Re)configures the flow control, e.g. for a new task.
+        """
+        self._bucket = TokenBucket(rate, burst=burst)
+        self._queue = queue
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        if high_watermark is not None and low_watermark is None:
+            self._low_watermark = high_watermark // 2
+        self._deadline = deadline
+        self._t_poll = 0.0
+        return self
+
+    def publish(
+        self,
+        /,
+        *,
+        exchange: str,
+        routing_key: str,
+        body: str | bytes,
+        properties: BasicProperties | None = None,
+    ):
+        """
+        Waits according to flow control, then publishes to the queue.
+        """
+        self.wait()
+        self._chan.basic_publish(
+            exchange=exchange,
+            routing_key=routing_key,
+            body=body,
+            properties=properties,
+        )
+
+    def wait(self):
+        """
+        Waits until publication of the next message is permitted.
+        """
+        self._wait_while_blocked()
+        self._wait_for_queue()
+        self._wait_for_token()
+
+    # ----------------------------------------------------------------
+    # PRIVATE METHODS
+    # ----------------------------------------------------------------
+
+    def _sleep(self, duration: float, /):
+        # DEV-NOTE: sleeping via the connection keeps processing I/O (heartbeats, callbacks)
+        self._chan.connection.sleep(duration)
+
+    def _sleep_until_deadline(self, duration: float, /, *, reason: str):
+        """
+        Sleeps (at most until the deadline, if configured) and raises once the deadline has passed.
+        """
+        if self._deadline is not None:
+            remaining = (self._deadline - datetime.now()).total_seconds()
+            if remaining <= 0:
+                raise TimeoutError(f"publication terminated - exceeded deadline whilst {reason}")  # fmt: skip
+            duration = min(duration, remaining)
+        self._sleep(duration)
+
+    def _on_blocked(self, *_):
+        logging.warning("broker blocked the connection - publication paused")
+        self._blocked = True
+
+    def _on_unblocked(self, *_):
+        logging.info("broker unblocked the connection - publication resumed")
+        self._blocked = False
+
+    def _wait_while_blocked(self):
+        backoff = BACKOFF_MIN
+        while self._blocked:
+            self._sleep_until_deadline(backoff, reason="the broker blocked the connection")
+            backoff = min(2 * backoff, BACKOFF_MAX)
+        return
+
+    def _wait_for_token(self):
+        if self._bucket.unlimited:
+            return
+        if (dt := self._bucket.reserve()) > 0:
+            self._sleep(dt)
+        return
+
+    def _wait_for_queue(self):
+        if self._queue is None or self._high_watermark is None:
+            return
+
+        # only poll the queue depth periodically
+        t = time.monotonic()
+        if t - self._t_poll < POLL_INTERVAL:
+            return
+        self._t_poll = t
+
+        if self._get_queue_depth() <= self._high_watermark:
+            return
+
+        logging.info(f"queue '{self._queue}' exceeds high watermark of {self._high_watermark} messages - traversal paused")  # fmt: skip
+        backoff = BACKOFF_MIN
+        while (depth := self._get_queue_depth()) > self._low_watermark:
+            self._sleep_until_deadline(backoff, reason=f"queue '{self._queue}' exceeded its high watermark")  # fmt: skip
+            backoff = min(2 * backoff, BACKOFF_MAX)
+        logging.info(f"queue '{self._queue}' fell to {depth} messages - traversal resumed")
+
+        # prevent a burst after the pause
+        self._bucket.drain()
+        self._t_poll = time.monotonic()
+        return
+
+    def _get_queue_depth(self) -> int:
+        frame = self._chan.queue_declare(queue=self._queue, passive=True)
+        return frame.method.message_count
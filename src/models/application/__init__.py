@@ -5,26 +5,37 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
+from ..generated.application import DiskUsageEntry
 from ..generated.application import EnumFeatures
+from ..generated.application import EnumHashAlgorithm
+from ..generated.application import EstimateInterval
 from ..generated.application import GeneralConfig
 from ..generated.application import RepoInfo
 from ..generated.application import RequestTask
 from ..generated.application import RequestTaskData
 from ..generated.application import RequestTaskOptions
 from ..generated.application import RequestsPayload
+from ..generated.application import SearchEstimate
+from .streaming import *
 
 # ----------------------------------------------------------------
 # EXPORTS
 # ----------------------------------------------------------------
 
 __all__ = [
+    "DiskUsageEntry",
     "EnumFeatures",
+    "EnumHashAlgorithm",
+    "EstimateInterval",
     "GeneralConfig",
     "RepoInfo",
     "RequestTask",
     "RequestTaskData",
     "RequestTaskOptions",
     "RequestsPayload",
+    "SearchEstimate",
+    "iter_tasks",
+    "iter_tasks_from_file",
     "parse_tasks",
 ]
 
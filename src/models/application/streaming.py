@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Streaming of tasks from (large) request payloads
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from typing import Generator
+
+from ..._core.utils.io import *
+from ..filesmanager import *
+from ..generated.application import RequestTask
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "iter_tasks",
+    "iter_tasks_from_file",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def iter_tasks(
+    contents: bytes,
+    /,
+    *,
+    fmt: EnumDataFileFormat,
+    managers: dict[EnumFilesSystem, FilesManager] | None = None,
+    chain: list[tuple[EnumFilesSystem, str]] | None = None,
+) -> Generator[RequestTask, None, None]:
+    """
+    Lazily parses and validates tasks one at a time from a requests payload,
+    so that they can be processed before the remainder of the payload has been parsed.
+
+    Supports
+
+    - `.json` - a single task or an array of tasks
+    - `.ndjson`, `.jsonl` - a task or an array of tasks per line
+    - `.yaml` - a task or a list of tasks per document (separated by `---`)
+
+    Each value may also be a proxy config referencing a file,
+    from which tasks are then streamed (requires `managers`).
+
+    NOTE: tasks to be ignored are skipped.
+    NOTE: invalid tasks only raise once reached.
+    """
+    validator = get_config_validator(RequestTask)
+    validator_proxy = get_config_validator(ProxyConfig)
+
+    for value in iter_contents(contents, format=fmt.value):
+        values = value if isinstance(value, list) else [value]
+        for value in values:
+            try:
+                task = validator.validate_python(value)
+
+            except Exception as err:
+                try:
+                    proxy = validator_proxy.validate_python(value)
+
+                except Exception as _:
+                    # raise first error!
+                    raise err
+
+                if managers is None:
+                    raise err
+
+                yield from iter_tasks_from_proxy(proxy, managers=managers, chain=chain)
+                continue
+
+            if task.ignore:
+                continue
+
+            yield task
+
+
+def iter_tasks_from_file(
+    managers: dict[EnumFilesSystem, FilesManager],
+    /,
+    *,
+    loc: EnumFilesSystem,
+    path: str,
+    fmt: EnumDataFileFormat | None = None,
+    chain: list[tuple[EnumFilesSystem, str]] | None = None,
+) -> Generator[RequestTask, None, None]:
+    """
+    Lazily parses and validates tasks one at a time from a requests file.
+
+    NOTE: see `iter_tasks`.
+    """
+    loader = ConfigLoader[RequestTask](managers=managers, type_=RequestTask)
+    contents, fmt_ = loader.get_file_contents(loc=loc, path=path)
+    yield from iter_tasks(contents, fmt=fmt or fmt_, managers=managers, chain=chain)
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def iter_tasks_from_proxy(
+    proxy: ProxyConfig,
+    /,
+    *,
+    managers: dict[EnumFilesSystem, FilesManager],
+    chain: list[tuple[EnumFilesSystem, str]] | None = None,
+) -> Generator[RequestTask, None, None]:
+    # for chain of references
+    if chain is None:
+        chain = []
+
+    loc = proxy.ref.location
+    path = proxy.ref.path
+    if (loc, path) in chain:
+        chain_str = " -> ".join([f"{loc_}/{path_}" for loc_, path_ in [*chain, (loc, path)]])  # fmt: skip
+        raise Exception(f"circular reference encountered whilst importing tasks {chain_str}!")  # fmt: skip
+
+    yield from iter_tasks_from_file(managers, loc=loc, path=path, fmt=proxy.ref.format, chain=[*chain, (loc, path)])  # fmt: skip
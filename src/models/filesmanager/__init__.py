@@ -14,7 +14,12 @@ from ..generated.application import EnumFilesSystem
 from ..generated.application import FileRef
 from ..generated.application import MetaData
 from ..generated.application import ProxyConfig
+from .archive import *
+from .blob import *
+from .cache import *
+from .columns import *
 from .config import *
+from .memory import *
 from .os import *
 from .payloads import *
 from .traits import *
@@ -24,17 +29,43 @@ from .traits import *
 # ----------------------------------------------------------------
 
 __all__ = [
+    "ARCHIVE_EXTENSIONS",
+    "CONFIG_CACHE",
+    "ArchiveFilesManager",
+    "ArchiveFilesManagerFile",
+    "ArchiveFilesManagerFolder",
+    "ArchiveIndex",
+    "BlobFilesManager",
+    "BlobFilesManagerFile",
+    "BlobFilesManagerFolder",
+    "BlobItem",
+    "BlobPage",
+    "BlobStorageClient",
+    "ConfigCache",
     "ConfigLoader",
+    "DeletionReport",
     "EnumDataFileFormat",
     "EnumFilesSystem",
     "FileRef",
     "FilesManager",
     "FilesManagerFile",
     "FilesManagerFolder",
+    "MemoryFilesManager",
+    "MemoryFilesManagerFile",
+    "MemoryFilesManagerFolder",
     "MetaData",
+    "MetaDataColumns",
     "OSFilesManager",
     "OSFilesManagerFile",
     "OSFilesManagerFolder",
     "PayloadParser",
     "ProxyConfig",
+    "create_deep_tree",
+    "create_skewed_tree",
+    "create_wide_tree",
+    "delete_tree",
+    "get_config_validator",
+    "get_file_signature",
+    "is_archive_name",
+    "parse_connection_string",
 ]
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This submodule provides a realisation of the FilesManager interface for the contents of archives (zip/tar)
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from .classes import *
+from .index import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "ARCHIVE_EXTENSIONS",
+    "ArchiveFilesManager",
+    "ArchiveFilesManagerFile",
+    "ArchiveFilesManagerFolder",
+    "ArchiveIndex",
+    "is_archive_name",
+]
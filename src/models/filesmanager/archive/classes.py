@@ -0,0 +1,549 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+from array import array
+from contextlib import contextmanager
+from datetime import timezone
+from io import UnsupportedOperation
+from pathlib import Path
+from threading import Lock
+from typing import IO
+from typing import Generator
+from typing import Iterable
+
+from pydantic import AwareDatetime
+
+from ...._core.constants import *
+from ...generated.application import MetaData
+from ..columns import *
+from ..memory import *
+from ..os import *
+from .index import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "ArchiveFilesManager",
+    "ArchiveFilesManagerFile",
+    "ArchiveFilesManagerFolder",
+]
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class ArchiveFilesManager:
+    """
+    File system for the contents of archives (zip/tar) on the local operating system,
+    without extracting these.
+
+    Paths run through an archive, e.g. `data/bundle.zip/inner/folder`.
+    Each archive is indexed once (and again only if it is modified),
+    listings are served from the index and contents of members are streamed upon request.
+
+    NOTE: archives are read-only (writes raise `io.UnsupportedOperation`).
+    NOTE: archives nested within archives are not opened.
+    """
+
+    _timezone: timezone | None
+    _indices: dict[str, ArchiveIndex]
+    _lock: Lock
+
+    def __init__(self, tz: timezone | None = None):
+        self._timezone = tz
+        self._indices = {}
+        self._lock = Lock()
+        return
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        """
+        Splits a full path into (absolute directory, basename, ext).
+        """
+        return OSFilesManager.path_split(path)
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path).
+        """
+        return "", path
+
+    @staticmethod
+    def path_join(*path: str) -> str:
+        """
+        Static method to combine parts of path
+        """
+        return OSFilesManager.path_join(*path)
+
+    @staticmethod
+    def path_rel(root: str, path: str, /) -> list[str]:
+        """
+        Static method to compute series of subpaths from a root to a given path
+        """
+        return OSFilesManager.path_rel(root, path)
+
+    @staticmethod
+    def path_split_archive(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (path to archive, path within archive),
+        whereby the archive is the first component of the path with the extension of an archive.
+        """
+        parts = Path(path).parts
+        for k, part in enumerate(parts):
+            if is_archive_name(part):
+                path_archive = Path(*parts[: k + 1]).as_posix()
+                if os.path.isfile(path_archive):
+                    return path_archive, "/".join(parts[k + 1 :]) or "."
+
+        raise FileNotFoundError(f"no archive found along path {path!r}")
+
+    def get_index(self, path: str, /) -> ArchiveIndex:
+        """
+        Gets the index of an archive, (re)building it if it does not exist or is out of date.
+        """
+        with self._lock:
+            index = self._indices.get(path)
+            if index is not None and index.is_valid():
+                return index
+
+            if index is not None:
+                index.close()
+            index = self._indices[path] = ArchiveIndex(path, tz=self._timezone)
+            return index
+
+    def close(self):
+        """
+        Closes all archives (indices are rebuilt upon next access).
+        """
+        with self._lock:
+            for index in self._indices.values():
+                index.close()
+            self._indices.clear()
+
+    def get_file(self, *path: str) -> ArchiveFilesManagerFile:
+        """
+        Use files manager to get file by full path
+        """
+        path_full = ArchiveFilesManager.path_join(*path).strip().rstrip(r"\/")
+        return ArchiveFilesManagerFile(self, path=path_full, tz=self._timezone)
+
+    def get_folder(self, *path: str) -> ArchiveFilesManagerFolder:
+        """
+        Use files manager to get folder by full path
+        """
+        path_full = ArchiveFilesManager.path_join(*path).strip().rstrip(r"\/")
+        return ArchiveFilesManagerFolder(self, path=path_full, tz=self._timezone)
+
+    def create_folder(self, path: str, /) -> ArchiveFilesManagerFolder:
+        raise UnsupportedOperation("archives are read-only")
+
+    def create_file(
+        self,
+        contents: bytes,
+        /,
+        *,
+        path: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> ArchiveFilesManagerFile:
+        raise UnsupportedOperation("archives are read-only")
+
+
+class ArchiveFilesManagerFile:
+    """
+    File manager for a member of an archive
+
+    NOTE: the archive (and its index) is resolved once per object,
+    hence metadata reflect the archive at the time of first access.
+    """
+
+    _manager: ArchiveFilesManager
+    _path: str
+    _timezone: timezone | None
+    _resolved: tuple[str, ArchiveIndex] | None
+
+    def __init__(
+        self,
+        manager: ArchiveFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+        resolved: tuple[str, ArchiveIndex] | None = None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        self._resolved = resolved
+        return
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        return ArchiveFilesManager.path_split(path)
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path).
+        """
+        return ArchiveFilesManager.path_split_root(path)
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the file exists (unknown -> `None`)
+        """
+        try:
+            return self._get_member().exists
+
+        except FileNotFoundError as _:
+            return False
+
+        except Exception as _:
+            return None
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to file
+        """
+        return self._path
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets basepath of file
+        """
+        return os.path.dirname(self._path)
+
+    @property
+    def filename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        return os.path.basename(self._path)
+
+    @property
+    def basename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        basename, _ = os.path.splitext(self.filename)
+        return basename
+
+    @property
+    def ext(self) -> str:
+        """
+        Gets file extension
+        """
+        _, ext = os.path.splitext(self._path)
+        return ext
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of file (uncompressed)
+        """
+        return self._get_member().size
+
+    @property
+    def author(self) -> str | None:
+        """
+        Gets file author
+        """
+        return None
+
+    @property
+    def author_id(self) -> int | None:
+        """
+        Gets file author id
+        """
+        return None
+
+    @property
+    def date_created(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of creation
+
+        NOTE: archives only record dates of modification.
+        """
+        return self.date_modified
+
+    @property
+    def date_modified(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of (last) modification
+        """
+        return self._get_member().date_modified
+
+    def get_meta_data(self) -> MetaData:
+        """
+        Gets bundled meta data associated to file.
+        """
+        return MetaData(
+            filename=self.filename,
+            basename=self.basename,
+            ext=self.ext,
+            size=self.size,
+            author=self.author,
+            author_id=self.author_id,
+            time_created=self.date_created,
+            time_updated=self.date_modified,
+        )
+
+    @contextmanager
+    def open(self) -> Generator[IO[bytes], None, None]:
+        """
+        Opens a stream to the (uncompressed) contents of the file
+        """
+        path_archive, path = ArchiveFilesManager.path_split_archive(self._path)
+        index = self._manager.get_index(path_archive)
+        node = index.tree.get_node(path)
+        if node is None or not index.tree.get_file(path).exists:
+            raise FileNotFoundError(f"no such file: {self._path!r}")
+
+        with index.open(node) as fp:
+            yield fp
+
+    def read_as_bytes(self) -> bytes:
+        """
+        Downloads file contents as bytes
+        """
+        with self.open() as fp:
+            return fp.read()
+
+    def iter_chunks(self, *, chunk: int = SIZE_1_MB) -> Generator[bytes, None, None]:
+        """
+        Streams (uncompressed) file contents in chunks (of at most the given size)
+        """
+        with self.open() as fp:
+            while True:
+                contents = fp.read(chunk)
+                if not contents:
+                    break
+                yield contents
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current file
+
+        NOTE: archives are read-only.
+        """
+        return not self.exists
+
+    def _resolve(self) -> tuple[str, ArchiveIndex]:
+        """
+        Resolves (once) the path within the archive and the index of the archive.
+        """
+        if self._resolved is None:
+            path_archive, path = ArchiveFilesManager.path_split_archive(self._path)
+            self._resolved = path, self._manager.get_index(path_archive)
+        return self._resolved
+
+    def _get_member(self) -> MemoryFilesManagerFile:
+        path, index = self._resolve()
+        return index.tree.get_file(path)
+
+
+class ArchiveFilesManagerFolder:
+    """
+    Folder manager for a folder within an archive (incl. the archive itself)
+
+    NOTE: the archive (and its index) is resolved once per object
+    and shared with the file/folder objects obtained from it.
+    """
+
+    _manager: ArchiveFilesManager
+    _path: str
+    _timezone: timezone | None
+    _resolved: tuple[str, ArchiveIndex] | None
+
+    def __init__(
+        self,
+        manager: ArchiveFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+        resolved: tuple[str, ArchiveIndex] | None = None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        self._resolved = resolved
+        return
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the folder exists (unknown -> `None`)
+        """
+        try:
+            return self._get_member().exists
+
+        except FileNotFoundError as _:
+            return False
+
+        except Exception as _:
+            return None
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to folder
+        """
+        return self._path
+
+    @property
+    def name(self) -> str:
+        """
+        Gets name identifier of folder
+        """
+        return os.path.basename(self._path)
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of folder (number of entries)
+        """
+        return self._get_member().size
+
+    def get_file(self, name: str, /) -> ArchiveFilesManagerFile:
+        """
+        Gets file object by name within folder
+        """
+        path = ArchiveFilesManager.path_join(self._path, name)
+        return ArchiveFilesManagerFile(self._manager, path=path, tz=self._timezone, resolved=self._resolve_child(name))  # fmt: skip
+
+    def get_filenames(self) -> list[str]:
+        """
+        Get all filenames in folder
+        """
+        return self._get_member().get_filenames()
+
+    def get_files(self) -> list[ArchiveFilesManagerFile]:
+        """
+        Gets all file objects in folder
+        """
+        filenames = self.get_filenames()
+        files = [self.get_file(filename) for filename in filenames]
+        return files
+
+    def get_subfolder(self, name: str, /) -> ArchiveFilesManagerFolder:
+        """
+        Gets subfolder object by name within folder
+        """
+        path = ArchiveFilesManager.path_join(self._path, name)
+        return ArchiveFilesManagerFolder(self._manager, path=path, tz=self._timezone, resolved=self._resolve_child(name))  # fmt: skip
+
+    def get_subfolder_paths(self) -> list[str]:
+        """
+        Gets all paths to subfolders within folder
+        """
+        folder = self._get_member()
+        names = [os.path.basename(path) for path in folder.get_subfolder_paths()]
+        return [Path(self._path, name).as_posix() for name in names]
+
+    def get_subfolders(self) -> list[ArchiveFilesManagerFolder]:
+        """
+        Gets all subfolder objects within folder
+        """
+        paths = self.get_subfolder_paths()
+        return [self.get_subfolder(os.path.basename(path)) for path in paths]
+
+    def has_file(self, file: ArchiveFilesManagerFile, /) -> bool:
+        """
+        Checks if file of given name exists in folder
+        """
+        filenames = self.get_filenames()
+        return file.filename in filenames
+
+    def get_files_meta_data(self) -> list[MetaData]:
+        """
+        Gets a list of metadata associated to files
+        """
+        files = self.get_files()
+        return [file.get_meta_data() for file in files]
+
+    def get_files_meta_data_columns(self) -> MetaDataColumns:
+        """
+        Gets the metadata associated to files as columns (from the index)
+        """
+        columns = self._get_member().get_files_meta_data_columns()
+        # NOTE: archives only record dates of modification
+        columns.times_created = array("d", columns.times_modified)
+        return columns
+
+    def get_listing(self) -> tuple[MetaDataColumns, list[str]]:
+        """
+        Gets the metadata associated to files as columns and all paths to subfolders.
+        """
+        return self.get_files_meta_data_columns(), self.get_subfolder_paths()
+
+    def write_bytes(
+        self,
+        contents: bytes,
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> ArchiveFilesManagerFile:
+        raise UnsupportedOperation("archives are read-only")
+
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> ArchiveFilesManagerFile:
+        raise UnsupportedOperation("archives are read-only")
+
+    def add_subfolder(self, name: str) -> ArchiveFilesManagerFolder:
+        raise UnsupportedOperation("archives are read-only")
+
+    def clear_folder(self) -> bool:
+        """
+        Removes all contents of current folder
+
+        NOTE: archives are read-only.
+        """
+        return len(self.get_filenames()) == 0 and len(self.get_subfolder_paths()) == 0
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current folder
+
+        NOTE: archives are read-only.
+        """
+        return not self.exists
+
+    def _resolve(self) -> tuple[str, ArchiveIndex]:
+        """
+        Resolves (once) the path within the archive and the index of the archive.
+        """
+        if self._resolved is None:
+            path_archive, path = ArchiveFilesManager.path_split_archive(self._path)
+            self._resolved = path, self._manager.get_index(path_archive)
+        return self._resolved
+
+    def _resolve_child(self, name: str, /) -> tuple[str, ArchiveIndex]:
+        path, index = self._resolve()
+        return MemoryFilesManager.path_join(path, name), index
+
+    def _get_member(self) -> MemoryFilesManagerFolder:
+        path, index = self._resolve()
+        return index.tree.get_folder(path)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Directory indices of archives (zip/tar), built from their member listings
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+import tarfile
+import zipfile
+from contextlib import contextmanager
+from datetime import datetime
+from datetime import timezone
+from threading import Lock
+from typing import IO
+from typing import Generator
+
+from ..memory import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "ARCHIVE_EXTENSIONS",
+    "ArchiveIndex",
+    "is_archive_name",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+ARCHIVE_EXTENSIONS = (
+    ".zip",
+    ".tar",
+    ".tar.gz",
+    ".tgz",
+    ".tar.bz2",
+    ".tbz2",
+    ".tar.xz",
+    ".txz",
+)
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class ArchiveIndex:
+    """
+    Directory index of an archive.
+
+    The archive is opened once and its member listing
+    (the central directory of a zip, or a single pass over a tar)
+    is held as a tree in memory, from which listings and sizes are served.
+    Contents of members are only read upon request.
+
+    NOTE: only regular files and folders are indexed (e.g. links are skipped).
+    """
+
+    path: str
+    signature: tuple[int, int]
+    tree: MemoryFilesManager
+    _members: dict[int, zipfile.ZipInfo | tarfile.TarInfo]
+    _zip: zipfile.ZipFile | None
+    _lock: Lock
+
+    def __init__(self, path: str, /, *, tz: timezone | None = None):
+        self.path = path
+        self.signature = get_signature(path)
+        self.tree = MemoryFilesManager(tz=tz)
+        self._members = {}
+        self._zip = None
+        self._lock = Lock()
+
+        if zipfile.is_zipfile(path):
+            # NOTE: handle kept open, as zip archives support random access
+            self._zip = zipfile.ZipFile(path, "r")
+            for info in self._zip.infolist():
+                self._add_member(info.filename, info, is_dir=info.is_dir(), size=info.file_size, timestamp=get_zip_timestamp(info))  # fmt: skip
+
+        else:
+            with tarfile.open(path, "r:*") as tar:
+                for info in tar:
+                    if not (info.isdir() or info.isfile()):
+                        continue
+                    self._add_member(info.name, info, is_dir=info.isdir(), size=info.size, timestamp=info.mtime)  # fmt: skip
+
+        return
+
+    def is_valid(self) -> bool:
+        """
+        Whether the archive is unchanged since the index was built.
+        """
+        try:
+            return get_signature(self.path) == self.signature
+
+        except Exception as _:
+            return False
+
+    @contextmanager
+    def open(self, node: int, /) -> Generator[IO[bytes], None, None]:
+        """
+        Opens a stream to the contents of a member (by node of tree).
+        """
+        info = self._members[node]
+
+        if isinstance(info, zipfile.ZipInfo):
+            assert self._zip is not None
+            with self._lock:
+                fp = self._zip.open(info, "r")
+            with fp:
+                yield fp
+
+        else:
+            # NOTE: tar archives are reopened per read, as tar files cannot be shared between threads
+            with tarfile.open(self.path, "r:*") as tar:
+                fp = tar.extractfile(info)
+                assert fp is not None
+                with fp:
+                    yield fp
+
+    def close(self):
+        if self._zip is not None:
+            self._zip.close()
+            self._zip = None
+
+    def _add_member(
+        self,
+        name: str,
+        info: zipfile.ZipInfo | tarfile.TarInfo,
+        /,
+        *,
+        is_dir: bool,
+        size: int,
+        timestamp: float,
+    ):
+        # NOTE: normalisation strips absolute paths and "..", so members cannot escape the archive
+        parts = MemoryFilesManager.path_parts(name)
+        if len(parts) == 0:
+            return
+
+        try:
+            node = 0
+            for part in parts[:-1]:
+                node = self.tree.add_folder_node(node, part)
+
+            if is_dir:
+                self.tree.add_folder_node(node, parts[-1])
+                return
+
+            node = self.tree.add_file_node(node, parts[-1], size=size, timestamp=timestamp)
+            self._members[node] = info
+
+        # NOTE: skip members which clash with others (e.g. a file and a folder of the same name)
+        except (FileExistsError, IsADirectoryError, ValueError) as _:
+            return
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def is_archive_name(name: str, /) -> bool:
+    """
+    Whether a file name has the extension of a supported archive.
+    """
+    return name.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def get_signature(path: str, /) -> tuple[int, int]:
+    meta = os.stat(path)
+    return meta.st_mtime_ns, meta.st_size
+
+
+def get_zip_timestamp(info: zipfile.ZipInfo, /) -> float:
+    try:
+        return datetime(*info.date_time).timestamp()
+
+    except Exception as _:
+        return 0.0
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This submodule provides a realisation of the FilesManager interface for (Azure) blob storage
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from .classes import *
+from .client import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "BlobFilesManager",
+    "BlobFilesManagerFile",
+    "BlobFilesManagerFolder",
+    "BlobItem",
+    "BlobPage",
+    "BlobStorageClient",
+    "parse_connection_string",
+]
@@ -0,0 +1,670 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from __future__ import annotations
+
+import posixpath
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timezone
+from threading import Lock
+from typing import Generator
+from typing import Iterable
+
+import httpx
+from pydantic import AwareDatetime
+
+from ...._core.constants import *
+from ...._core.utils.time import *
+from ...generated.application import MetaData
+from ..columns import *
+from ..memory import *
+from .client import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "BlobFilesManager",
+    "BlobFilesManagerFile",
+    "BlobFilesManagerFolder",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+DELIMITER = "/"
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class BlobFilesManager:
+    """
+    File system for (Azure) blob storage, e.g. a local Azurite emulator.
+
+    Paths are of the form `container/virtual/folders/blob`.
+    Blob storage has no folders, instead virtual folders are synthesised from the delimiter `/`.
+
+    Rather than one request per (virtual) folder,
+    the first access to a folder lists all blobs beneath it via flat (paginated) listings,
+    which are held in memory for `ttl` seconds and serve all listings of its subfolders.
+    The listing is split by the immediate virtual subfolders,
+    the pages of which are fetched concurrently.
+    Hence the number of requests is proportional to the number of pages, not the number of folders.
+
+    NOTE: listings may be out of date by up to `ttl` seconds (modifications via this manager invalidate them).
+    """
+
+    client: BlobStorageClient
+    page_size: int
+    max_workers: int
+    ttl: float
+    max_listings: int
+    _timezone: timezone | None
+    _listings: OrderedDict[tuple[str, str], tuple[float, MemoryFilesManager]]
+    _lock: Lock
+
+    def __init__(
+        self,
+        connection_string: str,
+        /,
+        *,
+        tz: timezone | None = None,
+        page_size: int = 5000,
+        max_workers: int = 8,
+        ttl: float = 60.0,
+        max_listings: int = 16,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        self.client = BlobStorageClient(connection_string, transport=transport)
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.ttl = ttl
+        self.max_listings = max_listings
+        self._timezone = tz
+        self._listings = OrderedDict()
+        self._lock = Lock()
+        return
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        """
+        Splits a full path into (absolute directory, basename, ext).
+        """
+        return MemoryFilesManager.path_split(path)
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path), i.e. (container, name of blob).
+        """
+        container, _, name = BlobFilesManager.path_join(path).partition(DELIMITER)
+        return container, name
+
+    @staticmethod
+    def path_join(*path: str) -> str:
+        """
+        Static method to combine parts of path
+        """
+        return MemoryFilesManager.path_join(*path)
+
+    @staticmethod
+    def path_rel(root: str, path: str, /) -> list[str]:
+        """
+        Static method to compute series of subpaths from a root to a given path
+        """
+        return MemoryFilesManager.path_rel(root, path)
+
+    def get_file(self, *path: str) -> BlobFilesManagerFile:
+        """
+        Use files manager to get file by full path
+        """
+        path_full = BlobFilesManager.path_join(*path)
+        return BlobFilesManagerFile(self, path=path_full, tz=self._timezone)
+
+    def get_folder(self, *path: str) -> BlobFilesManagerFolder:
+        """
+        Use files manager to get folder by full path
+        """
+        path_full = BlobFilesManager.path_join(*path)
+        return BlobFilesManagerFolder(self, path=path_full, tz=self._timezone)
+
+    def create_folder(self, path: str, /) -> BlobFilesManagerFolder:
+        """
+        Use files manager to create folder by full path.
+
+        NOTE: virtual folders exist as soon as blobs exist within them,
+        hence only the container is created (if need be).
+        """
+        container, _ = BlobFilesManager.path_split_root(path)
+        self.client.create_container(container)
+        return self.get_folder(path)
+
+    def create_file(
+        self,
+        contents: bytes,
+        /,
+        *,
+        path: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> BlobFilesManagerFile:
+        """
+        Use files manager to create file by full path
+        """
+        path, basename, ext = BlobFilesManager.path_split(path)
+        filename = f"{basename}{ext}"
+        folder = self.create_folder(path)
+        file = folder.write_bytes(contents, name=filename, chunk=chunk)
+        return file
+
+    def close(self):
+        self.client.close()
+
+    # ----------------------------------------------------------------
+    # LISTINGS
+    # ----------------------------------------------------------------
+
+    def get_listing(self, container: str, prefix: str, /) -> MemoryFilesManager:
+        """
+        Gets a (cached) listing of all blobs under a prefix of a container,
+        as a tree in memory whose paths coincide with the names of the blobs.
+        """
+        tree = self.find_cached_listing(container, prefix)
+        if tree is not None:
+            return tree
+
+        now = time.monotonic()
+        tree = self.list_prefix(container, prefix)
+
+        with self._lock:
+            self._listings[container, prefix] = (now, tree)
+            while len(self._listings) > self.max_listings:
+                self._listings.popitem(last=False)
+
+        return tree
+
+    def find_cached_listing(self, container: str, prefix: str, /) -> MemoryFilesManager | None:
+        """
+        Finds a cached listing which contains all blobs under a prefix of a container,
+        i.e. a listing of the prefix itself or of one of its parents (`None` if there is none).
+
+        NOTE: expired listings are dropped.
+        """
+        now = time.monotonic()
+        with self._lock:
+            for (container_, prefix_), (t, tree) in list(self._listings.items()):
+                if now - t >= self.ttl:
+                    del self._listings[container_, prefix_]
+                    continue
+                if container_ == container and (prefix_ == "" or prefix == prefix_ or prefix.startswith(f"{prefix_}{DELIMITER}")):  # fmt: skip
+                    self._listings.move_to_end((container_, prefix_))
+                    return tree
+
+        return None
+
+    def list_prefix(self, container: str, prefix: str, /) -> MemoryFilesManager:
+        """
+        Lists all blobs under a prefix of a container into a tree in memory.
+
+        First lists the immediate contents of the prefix (grouped by the delimiter),
+        then lists the blobs of each immediate virtual subfolder flatly and concurrently.
+        """
+        # NOTE: the folder of the prefix only exists (virtually), if it contains blobs
+        tree = MemoryFilesManager(tz=self._timezone)
+        prefix_ = f"{prefix}{DELIMITER}" if prefix != "" else ""
+
+        subprefixes = []
+        for page in self.client.iter_blob_pages(container, prefix=prefix_, delimiter=DELIMITER, max_results=self.page_size):  # fmt: skip
+            add_blobs(tree, page.blobs)
+            subprefixes.extend(page.prefixes)
+
+        def list_flat(subprefix: str) -> list[BlobItem]:
+            blobs = []
+            for page in self.client.iter_blob_pages(container, prefix=subprefix, max_results=self.page_size):  # fmt: skip
+                blobs.extend(page.blobs)
+            return blobs
+
+        if len(subprefixes) > 0:
+            n = max(1, min(self.max_workers, len(subprefixes)))
+            with ThreadPoolExecutor(max_workers=n, thread_name_prefix="blob-listing") as executor:  # fmt: skip
+                for blobs in executor.map(list_flat, subprefixes):
+                    add_blobs(tree, blobs)
+
+        return tree
+
+    def invalidate(self, container: str, /):
+        """
+        Drops all cached listings of a container.
+        """
+        with self._lock:
+            for key in [key for key in self._listings if key[0] == container]:
+                del self._listings[key]
+
+
+class BlobFilesManagerFile:
+    """
+    File manager for a blob
+    """
+
+    _manager: BlobFilesManager
+    _path: str
+    _timezone: timezone | None
+
+    def __init__(
+        self,
+        manager: BlobFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        return
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        return BlobFilesManager.path_split(path)
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path).
+        """
+        return BlobFilesManager.path_split_root(path)
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the file exists (unknown -> `None`)
+        """
+        try:
+            self._get_properties()
+            return True
+
+        except FileNotFoundError as _:
+            return False
+
+        except Exception as _:
+            return None
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to file
+        """
+        return self._path
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets basepath of file
+        """
+        return posixpath.dirname(self._path)
+
+    @property
+    def filename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        return posixpath.basename(self._path)
+
+    @property
+    def basename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        basename, _ = posixpath.splitext(self.filename)
+        return basename
+
+    @property
+    def ext(self) -> str:
+        """
+        Gets file extension
+        """
+        _, ext = posixpath.splitext(self._path)
+        return ext
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of file
+        """
+        size, _, _ = self._get_properties()
+        return size
+
+    @property
+    def author(self) -> str | None:
+        """
+        Gets file author
+        """
+        return None
+
+    @property
+    def author_id(self) -> int | None:
+        """
+        Gets file author id
+        """
+        return None
+
+    @property
+    def date_created(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of creation
+        """
+        _, t, _ = self._get_properties()
+        return None if t is None else add_timezone(t, tz=self._timezone)
+
+    @property
+    def date_modified(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of (last) modification
+        """
+        _, _, t = self._get_properties()
+        return None if t is None else add_timezone(t, tz=self._timezone)
+
+    def get_meta_data(self) -> MetaData:
+        """
+        Gets bundled meta data associated to file.
+        """
+        return MetaData(
+            filename=self.filename,
+            basename=self.basename,
+            ext=self.ext,
+            size=self.size,
+            author=self.author,
+            author_id=self.author_id,
+            time_created=self.date_created,
+            time_updated=self.date_modified,
+        )
+
+    def read_as_bytes(self) -> bytes:
+        """
+        Downloads file contents as bytes
+        """
+        container, name = BlobFilesManager.path_split_root(self._path)
+        return self._manager.client.get_blob(container, name)
+
+    def iter_chunks(self, *, chunk: int = SIZE_1_MB) -> Generator[bytes, None, None]:
+        """
+        Streams (downloads) file contents in chunks (of at most the given size)
+        """
+        container, name = BlobFilesManager.path_split_root(self._path)
+        with self._manager.client.stream_blob(container, name) as response:
+            yield from response.iter_bytes(chunk_size=chunk)
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current file
+        """
+        container, name = BlobFilesManager.path_split_root(self._path)
+        self._manager.client.delete_blob(container, name)
+        self._manager.invalidate(container)
+        return True
+
+    def _get_properties(self):
+        """
+        Gets (size, date created, date modified),
+        from a cached listing if available, otherwise via a single request.
+        """
+        container, name = BlobFilesManager.path_split_root(self._path)
+        # NOTE: a listing of the (virtual) folder of the blob or of one of its parents contains the blob
+        tree = self._manager.find_cached_listing(container, posixpath.dirname(name))
+        if tree is not None:
+            file = tree.get_file(name)
+            if not file.exists:
+                raise FileNotFoundError(f"no such blob: {self._path!r}")
+            return file.size, file.date_created, file.date_modified
+
+        item = self._manager.client.get_blob_properties(container, name)
+        return item.size, item.date_created, item.date_modified
+
+
+class BlobFilesManagerFolder:
+    """
+    Folder manager for a (virtual) folder in blob storage, incl. containers
+    """
+
+    _manager: BlobFilesManager
+    _path: str
+    _timezone: timezone | None
+
+    def __init__(
+        self,
+        manager: BlobFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        return
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the folder exists (unknown -> `None`)
+
+        NOTE: virtual folders only exist, if they contain blobs.
+        """
+        try:
+            if self._path == ".":
+                return True
+            container, prefix = BlobFilesManager.path_split_root(self._path)
+            if prefix == "":
+                return container in self._manager.client.list_containers()
+            return self._get_listing().exists
+
+        except FileNotFoundError as _:
+            return False
+
+        except Exception as _:
+            return None
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to folder
+        """
+        return self._path
+
+    @property
+    def name(self) -> str:
+        """
+        Gets name identifier of folder
+        """
+        return posixpath.basename(self._path)
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of folder (number of entries)
+        """
+        return len(self.get_filenames()) + len(self.get_subfolder_paths())
+
+    def get_file(self, name: str, /) -> BlobFilesManagerFile:
+        """
+        Gets file object by name within folder
+        """
+        return self._manager.get_file(self._path, name)
+
+    def get_filenames(self) -> list[str]:
+        """
+        Get all filenames in folder
+        """
+        if self._path == ".":
+            return []
+        return self._get_listing().get_filenames()
+
+    def get_files(self) -> list[BlobFilesManagerFile]:
+        """
+        Gets all file objects in folder
+        """
+        filenames = self.get_filenames()
+        files = [self.get_file(filename) for filename in filenames]
+        return files
+
+    def get_subfolder(self, name: str, /) -> BlobFilesManagerFolder:
+        """
+        Gets subfolder object by name within folder
+        """
+        return self._manager.get_folder(self._path, name)
+
+    def get_subfolder_paths(self) -> list[str]:
+        """
+        Gets all paths to subfolders within folder
+        """
+        if self._path == ".":
+            return self._manager.client.list_containers()
+        folder = self._get_listing()
+        names = [posixpath.basename(path) for path in folder.get_subfolder_paths()]
+        return [f"{self._path}/{name}" for name in names]
+
+    def get_subfolders(self) -> list[BlobFilesManagerFolder]:
+        """
+        Gets all subfolder objects within folder
+        """
+        paths = self.get_subfolder_paths()
+        return [self._manager.get_folder(path) for path in paths]
+
+    def has_file(self, file: BlobFilesManagerFile, /) -> bool:
+        """
+        Checks if file of given name exists in folder
+        """
+        filenames = self.get_filenames()
+        return file.filename in filenames
+
+    def get_files_meta_data(self) -> list[MetaData]:
+        """
+        Gets a list of metadata associated to files
+        """
+        files = self.get_files()
+        return [file.get_meta_data() for file in files]
+
+    def get_files_meta_data_columns(self) -> MetaDataColumns:
+        """
+        Gets the metadata associated to files as columns (from the cached listing)
+        """
+        if self._path == ".":
+            return MetaDataColumns(tz=self._timezone)
+        return self._get_listing().get_files_meta_data_columns()
+
+    def get_listing(self) -> tuple[MetaDataColumns, list[str]]:
+        """
+        Gets the metadata associated to files as columns and all paths to subfolders.
+        NOTE: both are obtained from the same (cached) listing.
+        """
+        return self.get_files_meta_data_columns(), self.get_subfolder_paths()
+
+    def write_bytes(
+        self,
+        contents: bytes,
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> BlobFilesManagerFile:
+        file = self.get_file(name)
+        container, name_ = BlobFilesManager.path_split_root(file.path)
+        self._manager.client.put_blob(container, name_, contents)
+        self._manager.invalidate(container)
+        return file
+
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> BlobFilesManagerFile:
+        """
+        Uploads file contents given a stream of buffers,
+        staged in blocks of (at most) the size of a chunk.
+        """
+        file = self.get_file(name)
+        container, name_ = BlobFilesManager.path_split_root(file.path)
+        self._manager.client.put_blob_blocks(container, name_, chunks, block_size=chunk)
+        self._manager.invalidate(container)
+        return file
+
+    def add_subfolder(self, name: str) -> BlobFilesManagerFolder:
+        """
+        Adds subfolder and returns a manager for it.
+
+        NOTE: virtual folders exist as soon as blobs exist within them.
+        """
+        return self.get_subfolder(name)
+
+    def clear_folder(self) -> bool:
+        """
+        Removes all contents of current folder
+        """
+        container, prefix = BlobFilesManager.path_split_root(self._path)
+        prefix_ = f"{prefix}{DELIMITER}" if prefix != "" else ""
+        names = []
+        for page in self._manager.client.iter_blob_pages(container, prefix=prefix_, max_results=self._manager.page_size):  # fmt: skip
+            names.extend(blob.name for blob in page.blobs)
+
+        with ThreadPoolExecutor(max_workers=self._manager.max_workers, thread_name_prefix="blob-delete") as executor:  # fmt: skip
+            list(executor.map(lambda name: self._manager.client.delete_blob(container, name), names))  # fmt: skip
+
+        self._manager.invalidate(container)
+        return True
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current folder
+
+        NOTE: virtual folders cease to exist once they are empty (containers are retained).
+        """
+        return self.clear_folder()
+
+    def _get_listing(self) -> MemoryFilesManagerFolder:
+        container, prefix = BlobFilesManager.path_split_root(self._path)
+        tree = self._manager.get_listing(container, prefix)
+        folder = tree.get_folder(prefix)
+        if not folder.exists:
+            raise FileNotFoundError(f"no such folder: {self._path!r}")
+        return folder
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def add_blobs(tree: MemoryFilesManager, blobs: list[BlobItem], /):
+    """
+    Adds blobs to a tree, synthesising virtual folders from the delimiter.
+    """
+    # NOTE: consecutive blobs mostly share their folders
+    folders = dict[str, int]()
+    for blob in blobs:
+        head, _, name = blob.name.rstrip(DELIMITER).rpartition(DELIMITER)
+        node = folders.get(head)
+        if node is None:
+            node = folders[head] = tree.get_node(tree.create_folder(head or ".").path)
+
+        # NOTE: zero-length blobs ending in the delimiter mark (empty) folders
+        if blob.name.endswith(DELIMITER):
+            tree.add_folder_node(node, name)
+            continue
+
+        t_created = None if blob.date_created is None else blob.date_created.timestamp()
+        t_modified = None if blob.date_modified is None else blob.date_modified.timestamp()
+        tree.add_file_node(node, name, size=blob.size, timestamp=t_modified, timestamp_created=t_created)  # fmt: skip
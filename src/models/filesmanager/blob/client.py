@@ -0,0 +1,428 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Minimal client for the REST api of (Azure) blob storage,
+compatible with local emulators such as Azurite
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import base64
+import hashlib
+import hmac
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from email.utils import format_datetime
+from email.utils import parsedate_to_datetime
+from typing import Generator
+from typing import Iterable
+from urllib.parse import parse_qsl
+from urllib.parse import quote
+
+import httpx
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "BlobItem",
+    "BlobPage",
+    "BlobStorageClient",
+    "parse_connection_string",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+API_VERSION = "2021-08-06"
+BLOCK_SIZE = 4 * 2**20
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class BlobItem:
+    """
+    Entry of a listing of blobs
+    """
+
+    name: str
+    size: int
+    date_created: datetime | None
+    date_modified: datetime | None
+
+
+@dataclass(slots=True)
+class BlobPage:
+    """
+    Page of a listing of blobs
+    """
+
+    blobs: list[BlobItem]
+    prefixes: list[str]
+    next_marker: str | None
+
+
+class BlobStorageClient:
+    """
+    Client for the REST api of blob storage,
+    authenticated via shared key or via shared access signature (SAS).
+
+    NOTE: the client is thread-safe (connections are pooled by httpx).
+    """
+
+    endpoint: str
+    account: str
+    _key: bytes | None
+    _sas: list[tuple[str, str]]
+    _client: httpx.Client
+
+    def __init__(
+        self,
+        connection_string: str,
+        /,
+        *,
+        timeout: float = 30.0,
+        transport: httpx.BaseTransport | None = None,
+    ):
+        settings = parse_connection_string(connection_string)
+        self.account = settings.get("AccountName", "")
+        self.endpoint = settings.get("BlobEndpoint") or f"{settings.get('DefaultEndpointsProtocol', 'https')}://{self.account}.blob.{settings.get('EndpointSuffix', 'core.windows.net')}"  # fmt: skip
+        self.endpoint = self.endpoint.rstrip("/")
+        key = settings.get("AccountKey")
+        self._key = base64.b64decode(key) if key else None
+        self._sas = parse_qsl(settings.get("SharedAccessSignature", "").lstrip("?"))
+        if self._key is None and len(self._sas) == 0:
+            raise ValueError("connection string requires either an AccountKey or a SharedAccessSignature")  # fmt: skip
+
+        # NOTE: larger pool, as pages of listings may be fetched concurrently
+        limits = httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        self._client = httpx.Client(timeout=timeout, limits=limits, transport=transport)
+        return
+
+    def close(self):
+        self._client.close()
+
+    def list_blobs(
+        self,
+        container: str,
+        /,
+        *,
+        prefix: str = "",
+        delimiter: str | None = None,
+        marker: str | None = None,
+        max_results: int = 5000,
+    ) -> BlobPage:
+        """
+        Fetches a single page of the listing of blobs within a container.
+
+        NOTE: without a delimiter the listing is flat (all blobs under the prefix),
+        otherwise blobs are grouped by the delimiter into prefixes (i.e. virtual folders).
+        """
+        params = {"restype": "container", "comp": "list", "maxresults": str(max_results)}  # fmt: skip
+        if prefix != "":
+            params["prefix"] = prefix
+        if delimiter is not None:
+            params["delimiter"] = delimiter
+        if marker:
+            params["marker"] = marker
+
+        response = self._request("GET", container, params=params)
+        return parse_blob_page(response.content)
+
+    def iter_blob_pages(
+        self,
+        container: str,
+        /,
+        *,
+        prefix: str = "",
+        delimiter: str | None = None,
+        max_results: int = 5000,
+    ) -> Generator[BlobPage, None, None]:
+        """
+        Iterates through all pages of a listing of blobs (see `list_blobs`).
+        """
+        marker = None
+        while True:
+            page = self.list_blobs(container, prefix=prefix, delimiter=delimiter, marker=marker, max_results=max_results)  # fmt: skip
+            yield page
+            marker = page.next_marker
+            if not marker:
+                break
+
+    def list_containers(self) -> list[str]:
+        """
+        Lists the names of all containers of the account.
+        """
+        names = []
+        marker = None
+        while True:
+            params = {"comp": "list"}
+            if marker:
+                params["marker"] = marker
+            response = self._request("GET", "", params=params)
+            root = ET.fromstring(response.content)
+            names.extend(node.findtext("Name") or "" for node in root.iterfind("Containers/Container"))  # fmt: skip
+            marker = root.findtext("NextMarker")
+            if not marker:
+                return names
+
+    def get_blob_properties(self, container: str, name: str, /) -> BlobItem:
+        """
+        Gets the properties of a single blob.
+        """
+        response = self._request("HEAD", f"{container}/{name}")
+        headers = response.headers
+        return BlobItem(
+            name=name,
+            size=int(headers.get("Content-Length") or 0),
+            date_created=parse_http_date(headers.get("x-ms-creation-time")),
+            date_modified=parse_http_date(headers.get("Last-Modified")),
+        )
+
+    @contextmanager
+    def stream_blob(
+        self, container: str, name: str, /
+    ) -> Generator[httpx.Response, None, None]:
+        """
+        Opens a (streamed) response to the contents of a blob.
+        """
+        request = self._build_request("GET", f"{container}/{name}")
+        response = self._client.send(request, stream=True)
+        try:
+            raise_for_status(response)
+            yield response
+
+        finally:
+            response.close()
+
+    def get_blob(self, container: str, name: str, /) -> bytes:
+        """
+        Downloads the contents of a blob.
+        """
+        response = self._request("GET", f"{container}/{name}")
+        return response.content
+
+    def put_blob(self, container: str, name: str, contents: bytes, /):
+        """
+        Uploads (or overwrites) a block blob.
+        """
+        headers = {"x-ms-blob-type": "BlockBlob", "Content-Type": "application/octet-stream"}  # fmt: skip
+        self._request("PUT", f"{container}/{name}", headers=headers, content=contents)
+
+    def put_blob_blocks(
+        self,
+        container: str,
+        name: str,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        block_size: int = BLOCK_SIZE,
+    ):
+        """
+        Uploads (or overwrites) a block blob from a stream of buffers,
+        by staging blocks of (at most) the given size and then committing the list of blocks.
+
+        NOTE: at most one block is held in memory at any time.
+        NOTE: contents which fit into a single block are uploaded in a single request.
+        """
+        block_ids = []
+        buffer = bytearray()
+
+        def put_block(contents: bytes):
+            block_id = base64.b64encode(f"{len(block_ids):010d}".encode("utf-8")).decode(
+                "utf-8"
+            )
+            params = {"comp": "block", "blockid": block_id}
+            self._request("PUT", f"{container}/{name}", params=params, content=contents)
+            block_ids.append(block_id)
+
+        for contents in chunks:
+            buffer += contents
+            while len(buffer) > block_size:
+                put_block(bytes(buffer[:block_size]))
+                del buffer[:block_size]
+
+        if len(block_ids) == 0:
+            self.put_blob(container, name, bytes(buffer))
+            return
+
+        if len(buffer) > 0:
+            put_block(bytes(buffer))
+
+        latest = "".join(f"<Latest>{block_id}</Latest>" for block_id in block_ids)
+        contents = f'<?xml version="1.0" encoding="utf-8"?><BlockList>{latest}</BlockList>'
+        headers = {"Content-Type": "application/xml"}
+        self._request("PUT", f"{container}/{name}", params={"comp": "blocklist"}, headers=headers, content=contents.encode("utf-8"))  # fmt: skip
+
+    def delete_blob(self, container: str, name: str, /) -> bool:
+        """
+        Deletes a blob (returns `False` if it does not exist).
+        """
+        response = self._request("DELETE", f"{container}/{name}", accept=(404,))
+        return response.status_code != 404
+
+    def create_container(self, container: str, /) -> bool:
+        """
+        Creates a container (returns `False` if it already exists).
+        """
+        response = self._request("PUT", container, params={"restype": "container"}, accept=(409,))  # fmt: skip
+        return response.status_code != 409
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        /,
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+        accept: tuple[int, ...] = (),
+    ) -> httpx.Response:
+        request = self._build_request(method, path, params=params, headers=headers, content=content)  # fmt: skip
+        response = self._client.send(request)
+        if response.status_code not in accept:
+            raise_for_status(response)
+        return response
+
+    def _build_request(
+        self,
+        method: str,
+        path: str,
+        /,
+        *,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+        content: bytes | None = None,
+    ) -> httpx.Request:
+        url = f"{self.endpoint}/{quote(path, safe='/~')}"
+        query = [*(params or {}).items(), *self._sas]
+        headers = {
+            **(headers or {}),
+            "x-ms-date": format_datetime(datetime.now(timezone.utc), usegmt=True),
+            "x-ms-version": API_VERSION,
+        }
+        request = self._client.build_request(method, url, params=query, headers=headers, content=content)  # fmt: skip
+        if self._key is not None:
+            signature = sign_request(request, account=self.account, key=self._key)
+            request.headers["Authorization"] = f"SharedKey {self.account}:{signature}"
+        return request
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def parse_connection_string(connection_string: str, /) -> dict[str, str]:
+    """
+    Parses a connection string of the form `Key1=value1;Key2=value2;...`.
+    """
+    settings = {}
+    for part in connection_string.strip().split(";"):
+        key, sep, value = part.partition("=")
+        if sep == "":
+            continue
+        settings[key.strip()] = value.strip()
+    return settings
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def sign_request(request: httpx.Request, /, *, account: str, key: bytes) -> str:
+    """
+    Computes the signature of a request for authentication via shared key.
+    """
+    headers = request.headers
+    length = headers.get("Content-Length", "")
+    headers_ms = sorted((name.lower(), value.strip()) for name, value in headers.items() if name.lower().startswith("x-ms-"))  # fmt: skip
+
+    # NOTE: the encoded path, in which for emulators the account also appears
+    path, _, _ = request.url.raw_path.decode("ascii").partition("?")
+    resource = f"/{account}{path}"
+    params = dict[str, list[str]]()
+    for name, value in request.url.params.multi_items():
+        params.setdefault(name.lower(), []).append(value)
+    for name in sorted(params):
+        resource += f"\n{name}:{','.join(sorted(params[name]))}"
+
+    parts = [
+        request.method,
+        headers.get("Content-Encoding", ""),
+        headers.get("Content-Language", ""),
+        "" if length == "0" else length,
+        headers.get("Content-MD5", ""),
+        headers.get("Content-Type", ""),
+        "",  # Date (x-ms-date used instead)
+        headers.get("If-Modified-Since", ""),
+        headers.get("If-Match", ""),
+        headers.get("If-None-Match", ""),
+        headers.get("If-Unmodified-Since", ""),
+        headers.get("Range", ""),
+        *[f"{name}:{value}" for name, value in headers_ms],
+        resource,
+    ]
+    digest = hmac.new(key, "\n".join(parts).encode("utf-8"), hashlib.sha256).digest()
+    return base64.b64encode(digest).decode("utf-8")
+
+
+def parse_blob_page(contents: bytes, /) -> BlobPage:
+    """
+    Parses the (xml) response of a listing of blobs.
+    """
+    root = ET.fromstring(contents)
+    blobs = []
+    for node in root.iterfind("Blobs/Blob"):
+        props = node.find("Properties")
+        get_prop = lambda key: props.findtext(key) if props is not None else None
+        blobs.append(
+            BlobItem(
+                name=node.findtext("Name") or "",
+                size=int(get_prop("Content-Length") or 0),
+                date_created=parse_http_date(get_prop("Creation-Time")),
+                date_modified=parse_http_date(get_prop("Last-Modified")),
+            )
+        )
+
+    prefixes = [node.findtext("Name") or "" for node in root.iterfind("Blobs/BlobPrefix")]
+    next_marker = root.findtext("NextMarker") or None
+    return BlobPage(blobs=blobs, prefixes=prefixes, next_marker=next_marker)
+
+
+def parse_http_date(value: str | None, /) -> datetime | None:
+    if not value:
+        return None
+
+    try:
+        return parsedate_to_datetime(value)
+
+    except Exception as _:
+        return None
+
+
+def raise_for_status(response: httpx.Response, /):
+    if response.is_success:
+        return
+    if not response.is_stream_consumed:
+        response.read()
+    match response.status_code:
+        case 404:
+            raise FileNotFoundError(f"blob storage: not found {response.request.url.path!r}")
+        case 401 | 403:
+            raise PermissionError(f"blob storage: access denied ({response.status_code}) {response.text[:200]}")  # fmt: skip
+        case _:
+            raise OSError(f"blob storage: request failed ({response.status_code}) {response.text[:200]}")  # fmt: skip
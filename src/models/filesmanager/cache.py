@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from collections import OrderedDict
+from datetime import datetime
+from threading import Lock
+from typing import Any
+
+from ..generated.application import EnumDataFileFormat
+from ..generated.application import EnumFilesSystem
+from .traits import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "CONFIG_CACHE",
+    "DEPENDENCY",
+    "ConfigCache",
+    "get_file_signature",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# (location, path, (date modified, size))
+DEPENDENCY = tuple[EnumFilesSystem, str, tuple[datetime | None, int]]
+# (type, location, path, format)
+KEY = tuple[type, EnumFilesSystem, str, EnumDataFileFormat | None]
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class ConfigCache:
+    """
+    Cache of validated configs loaded from files.
+
+    Each entry records the signatures (date modified + size) of the file
+    and of all files it references (via proxies),
+    and is invalidated as soon as any of these change.
+
+    NOTE: cached configs are shared between callers and should be treated as read-only.
+    """
+
+    max_entries: int
+    _entries: OrderedDict[KEY, tuple[Any, list[DEPENDENCY]]]
+    _lock: Lock
+
+    def __init__(self, /, *, max_entries: int = 128):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        return
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+        self,
+        key: KEY,
+        /,
+        *,
+        managers: dict[EnumFilesSystem, FilesManager],
+    ) -> tuple[Any, list[DEPENDENCY]] | None:
+        """
+        Gets the cached config and its dependencies,
+        provided none of the dependencies have changed.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None:
+            return None
+
+        _, deps = entry
+        for loc, path, sig in deps:
+            try:
+                if get_file_signature(managers[loc], path) != sig:
+                    break
+
+            except Exception as _:
+                break
+
+        else:
+            with self._lock:
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry
+
+        # invalidate stale entry
+        with self._lock:
+            if self._entries.get(key) is entry:
+                del self._entries[key]
+        return None
+
+    def set(self, key: KEY, value: Any, /, *, deps: list[DEPENDENCY]):
+        with self._lock:
+            self._entries[key] = (value, list(deps))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def get_file_signature(
+    manager: FilesManager,
+    path: str,
+    /,
+) -> tuple[datetime | None, int]:
+    """
+    Computes the signature (date modified + size) of a file,
+    which changes whenever the file is modified.
+    """
+    file = manager.get_file(path)
+    return file.date_modified, file.size
+
+
+# ----------------------------------------------------------------
+# GLOBAL CACHE
+# ----------------------------------------------------------------
+
+CONFIG_CACHE = ConfigCache()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This module contains a columnar representation of the metadata of files
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+from array import array
+from dataclasses import dataclass
+from dataclasses import field
+from datetime import datetime
+from datetime import timezone
+from typing import Any
+from typing import Generator
+from typing import Iterable
+
+from ..._core.utils.time import *
+from ..generated.application import MetaData
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "MetaDataColumns",
+]
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class MetaDataColumns:
+    """
+    Metadata of the files within a folder as columns (struct of arrays),
+    i.e. the k-th entry of each column belongs to the k-th file.
+
+    Times are stored as posix timestamps.
+    The (validated) models are only built upon request, see `get_meta_data`/`to_meta_data`.
+
+    NOTE: the numerical columns can be viewed as numpy arrays (without copying) via `as_numpy`.
+    """
+
+    names: list[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array("q"))
+    times_created: array = field(default_factory=lambda: array("d"))
+    times_modified: array = field(default_factory=lambda: array("d"))
+    owners: list[str | None] = field(default_factory=list)
+    tz: timezone | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(
+        self,
+        name: str,
+        /,
+        *,
+        size: int,
+        time_created: float,
+        time_modified: float,
+        owner: str | None = None,
+    ):
+        """
+        Appends the metadata of a file.
+        """
+        self.names.append(name)
+        self.sizes.append(size)
+        self.times_created.append(time_created)
+        self.times_modified.append(time_modified)
+        self.owners.append(owner)
+
+    @property
+    def total_size(self) -> int:
+        """
+        Gets the total size of all files.
+        """
+        return sum(self.sizes)
+
+    def select(self, indices: Iterable[int], /) -> MetaDataColumns:
+        """
+        Restricts the columns to a selection of files (e.g. as computed from a filter).
+        """
+        indices = list(indices)
+        return MetaDataColumns(
+            names=[self.names[k] for k in indices],
+            sizes=array("q", [self.sizes[k] for k in indices]),
+            times_created=array("d", [self.times_created[k] for k in indices]),
+            times_modified=array("d", [self.times_modified[k] for k in indices]),
+            owners=[self.owners[k] for k in indices],
+            tz=self.tz,
+        )
+
+    def filter_size(self, *, min_size: int = 0, max_size: int | None = None) -> MetaDataColumns:
+        """
+        Restricts the columns to files within a range of sizes.
+        """
+        indices = [
+            k
+            for k, size in enumerate(self.sizes)
+            if size >= min_size and (max_size is None or size <= max_size)
+        ]
+        return self.select(indices)
+
+    def as_numpy(self) -> dict[str, Any]:
+        """
+        Views the numerical columns as numpy arrays.
+
+        NOTE: requires the optional dependency `numpy`.
+        """
+        try:
+            import numpy as np
+
+        except ImportError as err:
+            raise ImportError("numpy is required for numpy-backed metadata columns") from err
+
+        return {
+            "sizes": np.frombuffer(self.sizes, dtype=np.int64),
+            "times_created": np.frombuffer(self.times_created, dtype=np.float64),
+            "times_modified": np.frombuffer(self.times_modified, dtype=np.float64),
+        }
+
+    def get_meta_data(self, k: int, /) -> MetaData:
+        """
+        Builds the metadata model of the k-th file.
+        """
+        name = self.names[k]
+        basename, ext = os.path.splitext(name)
+        t_created = datetime.fromtimestamp(self.times_created[k])
+        t_modified = datetime.fromtimestamp(self.times_modified[k])
+        return MetaData(
+            filename=name,
+            basename=basename,
+            ext=ext,
+            size=self.sizes[k],
+            author=self.owners[k],
+            author_id=None,
+            time_created=add_timezone(t_created, tz=self.tz),
+            time_updated=add_timezone(t_modified, tz=self.tz),
+        )
+
+    def iter_meta_data(self) -> Generator[MetaData, None, None]:
+        """
+        Iterates through the metadata models of all files.
+        """
+        for k in range(len(self)):
+            yield self.get_meta_data(k)
+
+    def to_meta_data(self) -> list[MetaData]:
+        """
+        Builds the metadata models of all files.
+        """
+        return list(self.iter_meta_data())
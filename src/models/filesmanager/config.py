@@ -6,17 +6,20 @@
 # ----------------------------------------------------------------
 
 import logging
+from functools import cache
 from typing import Generic
 from typing import TypeVar
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import SkipValidation
+from pydantic import TypeAdapter
 
 from ..._core.utils.io import *
 from ..generated.application import EnumDataFileFormat
 from ..generated.application import EnumFilesSystem
 from ..generated.application import ProxyConfig
+from .cache import *
 from .traits import *
 
 # ----------------------------------------------------------------
@@ -25,6 +28,7 @@ from .traits import *
 
 __all__ = [
     "ConfigLoader",
+    "get_config_validator",
 ]
 
 # ----------------------------------------------------------------
@@ -64,6 +68,11 @@ class ConfigLoader(BaseModel, Generic[T]):
     loader = ConfigLoader[GeneralConfig](managers=managers, type_=GeneralConfig)
     cfg = loader.load_from_contents(contents) # will be type GeneralConfig
     ```
+
+    ## Caching ##
+    If a `cache` is provided, configs loaded from files are cached
+    (along with the files they reference via proxies or include via `!include`)
+    and only reloaded when one of these files changes.
     """
 
     model_config = ConfigDict(
@@ -74,6 +83,7 @@ class ConfigLoader(BaseModel, Generic[T]):
 
     managers: dict[EnumFilesSystem, SkipValidation[FilesManager]]
     type_: type[BaseModel]
+    cache: SkipValidation[ConfigCache] | None = None
 
     def get_file_contents(
         self,
@@ -119,22 +129,42 @@ class ConfigLoader(BaseModel, Generic[T]):
         path: str,
         fmt: EnumDataFileFormat | None = None,
         chain: list[tuple[EnumFilesSystem, str]] | None = None,
+        deps: list[DEPENDENCY] | None = None,
     ) -> T:
         """
         Extracts config from file.
 
         NOTE: if `ref` attribute is set, will recursively extract referenced config-file.
+
+        NOTE: the signatures of all files read are collected in `deps` (if provided).
         """
         # for chain of references
         if chain is None:
             chain = []
 
+        # use cached config if none of its files have changed
+        key = (self.type_, loc, path, fmt)
+        if self.cache is not None and (entry := self.cache.get(key, managers=self.managers)):  # fmt: skip
+            cfg, deps_ = entry
+            if deps is not None:
+                deps.extend(deps_)
+            return cfg
+
+        # NOTE: determine signature prior to reading, so that concurrent changes invalidate the entry
+        deps_ = list[DEPENDENCY]()
+        if self.cache is not None:
+            deps_.append((loc, path, get_file_signature(self.managers[loc], path)))
+
         # access file and read contents
         contents, fmt_ = self.get_file_contents(loc=loc, path=path)
-        fmt = fmt or fmt_
 
         # load (recursively) from contents
-        cfg = self.load_from_contents(contents, fmt=fmt, chain=chain)
+        cfg = self.load_from_contents(contents, fmt=fmt or fmt_, chain=chain, deps=deps_)
+
+        if self.cache is not None:
+            self.cache.set(key, cfg, deps=deps_)
+        if deps is not None:
+            deps.extend(deps_)
 
         return cfg
 
@@ -145,6 +175,7 @@ class ConfigLoader(BaseModel, Generic[T]):
         *,
         fmt: EnumDataFileFormat,
         chain: list[tuple[EnumFilesSystem, str]] | None = None,
+        deps: list[DEPENDENCY] | None = None,
     ) -> T:
         """
         Extracts config from file-contents optionally parsed.
@@ -155,32 +186,64 @@ class ConfigLoader(BaseModel, Generic[T]):
         if chain is None:
             chain = []
 
-        # parse bytes -> dictionary
-        assets = parse_contents(contents, format=fmt.value)
+        # parse bytes -> model (or else proxy)
+        validator = get_config_validator(self.type_)
+        validator_proxy = get_config_validator(ProxyConfig)
+        match fmt:
+            case EnumDataFileFormat.FIELD_JSON:
+                # NOTE: fast path - validates raw bytes without intermediate python objects
+                validate = validator.validate_json
+                validate_proxy = validator_proxy.validate_json
+                assets = contents
+
+            case _:
+                validate = validator.validate_python
+                validate_proxy = validator_proxy.validate_python
+                includes = list[str]()
+                assets = parse_contents(contents, format=fmt.value, includes=includes)
+                # NOTE: files included (via `!include`) are read from the OS
+                if deps is not None:
+                    deps.extend(self.get_include_dependency(path) for path in includes)
 
-        # parse dictionary -> model
         try:
-            cfg = self.type_.model_validate(assets)
+            cfg = validate(assets)
 
         except Exception as err:
             try:
-                cfg = ProxyConfig.model_validate(assets)
+                cfg = validate_proxy(assets)
 
             except Exception as _:
                 # raise first error!
                 raise err
 
         if isinstance(proxy := cfg, ProxyConfig):
-            cfg = self.load_from_proxy(proxy, chain=chain)
+            cfg = self.load_from_proxy(proxy, chain=chain, deps=deps)
 
         return cfg
 
+    def get_include_dependency(self, path: str, /) -> DEPENDENCY:
+        """
+        Gets the dependency on a file included (via `!include`) in a yaml file.
+
+        NOTE: if the signature cannot be determined, the dependency never matches,
+        i.e. configs depending on it are not served from the cache.
+        """
+        loc = EnumFilesSystem.OS
+        try:
+            sig = get_file_signature(self.managers[loc], path)
+
+        except Exception as _:
+            sig = (None, -1)
+
+        return loc, path, sig
+
     def load_from_proxy(
         self,
         proxy: ProxyConfig,
         /,
         *,
         chain: list[tuple[EnumFilesSystem, str]] | None = None,
+        deps: list[DEPENDENCY] | None = None,
     ) -> T:
         """
         Extracts config from a proxy to a file.
@@ -200,6 +263,19 @@ class ConfigLoader(BaseModel, Generic[T]):
 
         # recursive call
         chain.append((loc, path))
-        cfg = self.load_from_file(loc=loc, path=path, fmt=fmt, chain=chain)  # fmt: skip
+        cfg = self.load_from_file(loc=loc, path=path, fmt=fmt, chain=chain, deps=deps)  # fmt: skip
 
         return cfg
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+@cache
+def get_config_validator(type_: type[T], /) -> TypeAdapter[T]:
+    """
+    Returns a (cached) validator for a type of config.
+    """
+    return TypeAdapter(type_)
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This submodule provides a realisation of the FilesManager interface for file systems held in memory
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from .classes import *
+from .trees import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "MemoryFilesManager",
+    "MemoryFilesManagerFile",
+    "MemoryFilesManagerFolder",
+    "create_deep_tree",
+    "create_skewed_tree",
+    "create_wide_tree",
+]
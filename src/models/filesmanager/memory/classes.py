@@ -0,0 +1,792 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from __future__ import annotations
+
+import posixpath
+import re
+import time
+from array import array
+from bisect import bisect_left
+from datetime import datetime
+from datetime import timezone
+from threading import RLock
+from typing import Generator
+from typing import Iterable
+
+from pydantic import AwareDatetime
+
+from ...._core.constants import *
+from ...._core.utils.time import *
+from ...generated.application import MetaData
+from ..columns import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "MemoryFilesManager",
+    "MemoryFilesManagerFile",
+    "MemoryFilesManagerFolder",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+ROOT = 0
+KIND_FILE = 0
+KIND_FOLDER = 1
+KIND_DELETED = 2
+MAX_INDEX_SIZE = 100_000
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class MemoryFilesManager:
+    """
+    File system held in memory, e.g. for synthetic trees in tests and benchmarks.
+
+    Nodes are identified by integers and stored in flat (parallel) arrays,
+    so that trees of millions of nodes remain compact.
+    The children of each folder are kept sorted by name,
+    so that paths are resolved via binary search level by level
+    (and folders which have been resolved once are indexed by their paths).
+
+    NOTE: paths are posix-like and relative to a single root,
+    i.e. `"/a/b"`, `"a/b"` and `"./a//b/"` all refer to the same folder.
+
+    NOTE: files without explicitly written contents consist of null bytes.
+    """
+
+    _timezone: timezone | None
+    _lock: RLock
+    _names: list[str]
+    _parents: array
+    _kinds: bytearray
+    _sizes: array
+    _created: array
+    _modified: array
+    _child_names: list[list[str] | None]
+    _child_nodes: list[array | None]
+    _contents: dict[int, bytes]
+    _index: dict[str, int]
+    _n_files: int
+    _n_folders: int
+
+    def __init__(self, tz: timezone | None = None):
+        self._timezone = tz
+        self._lock = RLock()
+        t = time.time()
+        self._names = [""]
+        self._parents = array("q", [-1])
+        self._kinds = bytearray([KIND_FOLDER])
+        self._sizes = array("q", [0])
+        self._created = array("d", [t])
+        self._modified = array("d", [t])
+        self._child_names = [[]]
+        self._child_nodes = [array("q")]
+        self._contents = {}
+        self._index = {}
+        self._n_files = 0
+        self._n_folders = 1
+        return
+
+    @property
+    def n_files(self) -> int:
+        """
+        Number of files currently in the file system
+        """
+        return self._n_files
+
+    @property
+    def n_folders(self) -> int:
+        """
+        Number of folders currently in the file system (incl. root)
+        """
+        return self._n_folders
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        """
+        Splits a full path into (absolute directory, basename, ext).
+        """
+        path = path.strip().rstrip(r"\/")
+        filename = posixpath.basename(path)
+        path = posixpath.dirname(path) or "."
+        basename, ext = posixpath.splitext(filename)
+        return path, basename, ext
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path).
+        """
+        return "", path
+
+    @staticmethod
+    def path_join(*path: str) -> str:
+        """
+        Static method to combine parts of path
+        """
+        # NOTE: fast path for paths which are already normalised (e.g. as returned by folders)
+        if len(path) == 1 and is_normalised_path(path[0]):
+            return path[0]
+        parts = MemoryFilesManager.path_parts(*path)
+        return "/".join(parts) or "."
+
+    @staticmethod
+    def path_rel(root: str, path: str, /) -> list[str]:
+        """
+        Static method to compute series of subpaths from a root to a given path
+        """
+        parts_root = MemoryFilesManager.path_parts(root)
+        parts = MemoryFilesManager.path_parts(path)
+        if parts[: len(parts_root)] != parts_root:
+            return []
+        return parts[len(parts_root) :]
+
+    @staticmethod
+    def path_parts(*path: str) -> list[str]:
+        """
+        Static method to normalise a path into its parts (relative to the root)
+        """
+        parts = []
+        for part in re.split(r"[\\/]+", "/".join(path).strip()):
+            match part:
+                case "" | ".":
+                    continue
+
+                case "..":
+                    if len(parts) > 0:
+                        parts.pop()
+
+                case _:
+                    parts.append(part)
+
+        return parts
+
+    def get_file(self, *path: str) -> MemoryFilesManagerFile:
+        """
+        Use files manager to get file by full path
+        """
+        path_full = MemoryFilesManager.path_join(*path)
+        return MemoryFilesManagerFile(self, path=path_full, tz=self._timezone)
+
+    def get_folder(self, *path: str) -> MemoryFilesManagerFolder:
+        """
+        Use files manager to get folder by full path
+        """
+        path_full = MemoryFilesManager.path_join(*path)
+        return MemoryFilesManagerFolder(self, path=path_full, tz=self._timezone)
+
+    def create_folder(self, path: str, /) -> MemoryFilesManagerFolder:
+        """
+        Use files manager to create folder by full path.
+        First checks if folder already exists.
+        """
+        with self._lock:
+            node = ROOT
+            for name in MemoryFilesManager.path_parts(path):
+                node = self.add_folder_node(node, name)
+
+        return self.get_folder(path)
+
+    def create_file(
+        self,
+        contents: bytes,
+        /,
+        *,
+        path: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> MemoryFilesManagerFile:
+        """
+        Use files manager to create file by full path
+        """
+        path, basename, ext = MemoryFilesManager.path_split(path)
+        filename = f"{basename}{ext}"
+        # first ensure folder exists
+        folder = self.create_folder(path)
+        # next create file within folder
+        file = folder.write_bytes(contents, name=filename, chunk=chunk)
+        return file
+
+    # ----------------------------------------------------------------
+    # LOW LEVEL API
+    # ----------------------------------------------------------------
+
+    def get_node(self, path: str, /) -> int | None:
+        """
+        Resolves a path to the id of its node (if it exists).
+
+        NOTE: paths of resolved folders are indexed,
+        so that e.g. during traversals entries are resolved via their parent in O(1),
+        rather than from the root.
+        """
+        path = MemoryFilesManager.path_join(path)
+        node = self._get_indexed(path)
+        if node is not None:
+            return node
+
+        head, _, name = path.rpartition("/")
+        node = self._get_indexed(head or ".")
+        if node is not None:
+            node = self.get_child_node(node, name)
+
+        else:
+            node = ROOT
+            for name in MemoryFilesManager.path_parts(path):
+                node = self.get_child_node(node, name)
+                if node is None:
+                    return None
+
+        if node is not None and self._kinds[node] == KIND_FOLDER:
+            if len(self._index) >= MAX_INDEX_SIZE:
+                self._index.clear()
+            self._index[path] = node
+
+        return node
+
+    def get_child_node(self, node: int, name: str, /) -> int | None:
+        """
+        Gets the id of a child node of a folder by name (if it exists).
+        """
+        names = self._child_names[node]
+        if names is None:
+            return None
+        k = bisect_left(names, name)
+        if k < len(names) and names[k] == name:
+            return self._child_nodes[node][k]
+        return None
+
+    def get_kind(self, node: int, /) -> int:
+        return self._kinds[node]
+
+    def add_folder_node(self, parent: int, name: str, /) -> int:
+        """
+        Adds a subfolder to a folder node and returns its id.
+        If the subfolder already exists, it will not be created.
+
+        NOTE: for bulk construction of trees (no paths are resolved).
+        """
+        with self._lock:
+            node = self.get_child_node(parent, name)
+            if node is not None:
+                if self._kinds[node] != KIND_FOLDER:
+                    raise FileExistsError(f"cannot create folder {name} as a file of this name exists")  # fmt: skip
+                return node
+
+            node = self._add_node(parent, name, kind=KIND_FOLDER, size=0)
+            self._child_names.append([])
+            self._child_nodes.append(array("q"))
+            self._n_folders += 1
+            return node
+
+    def add_file_node(
+        self,
+        parent: int,
+        name: str,
+        /,
+        *,
+        size: int = 0,
+        contents: bytes | None = None,
+        timestamp: float | None = None,
+        timestamp_created: float | None = None,
+    ) -> int:
+        """
+        Adds a file to a folder node and returns its id.
+        If the file already exists, it will be overwritten.
+
+        NOTE: for bulk construction of trees (no paths are resolved).
+        NOTE: the (optional) timestamps set the dates of modification/creation (default: now).
+        """
+        if contents is not None:
+            size = len(contents)
+
+        with self._lock:
+            node = self.get_child_node(parent, name)
+            if node is not None:
+                if self._kinds[node] != KIND_FILE:
+                    raise IsADirectoryError(f"cannot create file {name} as a folder of this name exists")  # fmt: skip
+                self._sizes[node] = size
+                self._modified[node] = time.time()
+
+            else:
+                node = self._add_node(parent, name, kind=KIND_FILE, size=size)
+                self._child_names.append(None)
+                self._child_nodes.append(None)
+                self._n_files += 1
+
+            if timestamp is not None:
+                self._modified[node] = timestamp
+            if timestamp_created is not None:
+                self._created[node] = timestamp_created
+
+            self._contents.pop(node, None)
+            if contents is not None:
+                self._contents[node] = contents
+
+            return node
+
+    def remove_node(self, node: int, /) -> bool:
+        """
+        Removes a node (and its descendants) from the file system.
+
+        NOTE: the ids of removed nodes are not reused.
+        """
+        with self._lock:
+            if node == ROOT or self._kinds[node] == KIND_DELETED:
+                return False
+
+            # detach from parent
+            parent = self._parents[node]
+            names = self._child_names[parent]
+            k = bisect_left(names, self._names[node])
+            del names[k]
+            del self._child_nodes[parent][k]
+
+            # mark descendants as deleted
+            stack = [node]
+            while len(stack) > 0:
+                node = stack.pop()
+                if self._kinds[node] == KIND_FOLDER:
+                    stack.extend(self._child_nodes[node])
+                    self._child_names[node] = None
+                    self._child_nodes[node] = None
+                    self._n_folders -= 1
+                else:
+                    self._contents.pop(node, None)
+                    self._n_files -= 1
+                self._kinds[node] = KIND_DELETED
+
+            return True
+
+    def _get_indexed(self, path: str, /) -> int | None:
+        if path == ".":
+            return ROOT
+        node = self._index.get(path)
+        # NOTE: ids of removed nodes are not reused, hence stale entries are recognised
+        if node is None or self._kinds[node] != KIND_FOLDER:
+            return None
+        return node
+
+    def _add_node(self, parent: int, name: str, /, *, kind: int, size: int) -> int:
+        if self._kinds[parent] != KIND_FOLDER:
+            raise NotADirectoryError(f"cannot add {name} to a node which is not a folder")  # fmt: skip
+        if name in ["", ".", ".."] or "/" in name or "\\" in name:
+            raise ValueError(f"invalid name {name!r} for node")
+
+        t = time.time()
+        node = len(self._names)
+        self._names.append(name)
+        self._parents.append(parent)
+        self._kinds.append(kind)
+        self._sizes.append(size)
+        self._created.append(t)
+        self._modified.append(t)
+
+        # NOTE: appending is O(1) if nodes are added in order of name (e.g. by generators)
+        names = self._child_names[parent]
+        k = bisect_left(names, name)
+        names.insert(k, name)
+        self._child_nodes[parent].insert(k, node)
+        self._modified[parent] = t
+        return node
+
+
+class MemoryFilesManagerFile:
+    """
+    File manager for a file system held in memory
+    """
+
+    _manager: MemoryFilesManager
+    _path: str
+    _timezone: timezone | None
+
+    def __init__(
+        self,
+        manager: MemoryFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        return
+
+    @staticmethod
+    def path_split(path: str, /) -> tuple[str, str, str]:
+        return MemoryFilesManager.path_split(path)
+
+    @staticmethod
+    def path_split_root(path: str, /) -> tuple[str, str]:
+        """
+        Splits a full path into (root, relative path).
+        """
+        return MemoryFilesManager.path_split_root(path)
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the file exists (unknown -> `None`)
+        """
+        node = self._manager.get_node(self._path)
+        return node is not None and self._manager.get_kind(node) == KIND_FILE
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to file
+        """
+        return self._path
+
+    @property
+    def directory(self) -> str:
+        """
+        Gets basepath of file
+        """
+        return posixpath.dirname(self._path)
+
+    @property
+    def filename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        return posixpath.basename(self._path)
+
+    @property
+    def basename(self) -> str:
+        """
+        Gets basename of file (including extension)
+        """
+        basename, _ = posixpath.splitext(self.filename)
+        return basename
+
+    @property
+    def ext(self) -> str:
+        """
+        Gets file extension
+        """
+        _, ext = posixpath.splitext(self._path)
+        return ext
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of file
+        """
+        node = self._get_node()
+        return self._manager._sizes[node]
+
+    @property
+    def author(self) -> str | None:
+        """
+        Gets file author
+        """
+        return None
+
+    @property
+    def author_id(self) -> int | None:
+        """
+        Gets file author id
+        """
+        return None
+
+    @property
+    def date_created(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of creation
+        """
+        node = self._get_node()
+        t = datetime.fromtimestamp(self._manager._created[node])
+        return add_timezone(t, tz=self._timezone)
+
+    @property
+    def date_modified(self) -> AwareDatetime | None:
+        """
+        Gets meta attribute - date of (last) modification
+        """
+        node = self._get_node()
+        t = datetime.fromtimestamp(self._manager._modified[node])
+        return add_timezone(t, tz=self._timezone)
+
+    def get_meta_data(self) -> MetaData:
+        """
+        Gets bundled meta data associated to file.
+        """
+        return MetaData(
+            filename=self.filename,
+            basename=self.basename,
+            ext=self.ext,
+            size=self.size,
+            author=self.author,
+            author_id=self.author_id,
+            time_created=self.date_created,
+            time_updated=self.date_modified,
+        )
+
+    def read_as_bytes(self) -> bytes:
+        """
+        Downloads file contents as bytes
+        """
+        node = self._get_node()
+        contents = self._manager._contents.get(node)
+        if contents is None:
+            contents = bytes(self._manager._sizes[node])
+        return contents
+
+    def iter_chunks(self, *, chunk: int = SIZE_1_MB) -> Generator[bytes, None, None]:
+        """
+        Streams file contents in chunks (of at most the given size)
+
+        NOTE: synthetic files without contents are streamed without being materialised.
+        """
+        node = self._get_node()
+        contents = self._manager._contents.get(node)
+        size = self._manager._sizes[node]
+        for k in range(0, size, chunk):
+            n = min(chunk, size - k)
+            yield bytes(n) if contents is None else contents[k : k + n]
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current file
+        """
+        node = self._manager.get_node(self._path)
+        if node is None or self._manager.get_kind(node) != KIND_FILE:
+            return True
+        return self._manager.remove_node(node)
+
+    def _get_node(self) -> int:
+        node = self._manager.get_node(self._path)
+        if node is None or self._manager.get_kind(node) != KIND_FILE:
+            raise FileNotFoundError(f"no such file: {self._path!r}")
+        return node
+
+
+class MemoryFilesManagerFolder:
+    """
+    Folder manager for a file system held in memory
+    """
+
+    _manager: MemoryFilesManager
+    _path: str
+    _timezone: timezone | None
+
+    def __init__(
+        self,
+        manager: MemoryFilesManager,
+        /,
+        *,
+        path: str,
+        tz: timezone | None,
+    ):
+        assert path != "", "Path cannot be empty!"
+        self._manager = manager
+        self._path = path
+        self._timezone = tz
+        return
+
+    @property
+    def exists(self) -> bool | None:
+        """
+        Whether or not the folder exists (unknown -> `None`)
+        """
+        node = self._manager.get_node(self._path)
+        return node is not None and self._manager.get_kind(node) == KIND_FOLDER
+
+    @property
+    def path(self) -> str:
+        """
+        Gets path locator to folder
+        """
+        return self._path
+
+    @property
+    def name(self) -> str:
+        """
+        Gets name identifier of folder
+        """
+        return posixpath.basename(self._path)
+
+    @property
+    def size(self) -> int:
+        """
+        Gets meta attribute - size of folder
+
+        NOTE: the number of entries (as for directories on some file systems),
+        in particular this is `0` if and only if the folder is empty.
+        """
+        node = self._get_node()
+        return len(self._manager._child_nodes[node])
+
+    def get_file(self, name: str, /) -> MemoryFilesManagerFile:
+        """
+        Gets file object by name within folder
+        """
+        return self._manager.get_file(self._path, name)
+
+    def get_filenames(self) -> list[str]:
+        """
+        Get all filenames in folder
+        """
+        return self._get_children(KIND_FILE)
+
+    def get_files(self) -> list[MemoryFilesManagerFile]:
+        """
+        Gets all file objects in folder
+        """
+        filenames = self.get_filenames()
+        files = [self.get_file(filename) for filename in filenames]
+        return files
+
+    def get_subfolder(self, name: str, /) -> MemoryFilesManagerFolder:
+        """
+        Gets subfolder object by name within folder
+        """
+        return self._manager.get_folder(self._path, name)
+
+    def get_subfolder_paths(self) -> list[str]:
+        """
+        Gets all paths to subfolders within folder
+        """
+        names = self._get_children(KIND_FOLDER)
+        # NOTE: names of nodes cannot contain separators, hence paths are normalised
+        if self._path == ".":
+            return names
+        return [f"{self._path}/{name}" for name in names]
+
+    def get_subfolders(self) -> list[MemoryFilesManagerFolder]:
+        """
+        Gets all subfolder objects within folder
+        """
+        names = self._get_children(KIND_FOLDER)
+        return [self.get_subfolder(name) for name in names]
+
+    def has_file(self, file: MemoryFilesManagerFile, /) -> bool:
+        """
+        Checks if file of given name exists in folder
+        """
+        node = self._get_node()
+        child = self._manager.get_child_node(node, file.filename)
+        return child is not None and self._manager.get_kind(child) == KIND_FILE
+
+    def get_files_meta_data(self) -> list[MetaData]:
+        """
+        Gets a list of metadata associated to files
+        """
+        files = self.get_files()
+        return [file.get_meta_data() for file in files]
+
+    def get_files_meta_data_columns(self) -> MetaDataColumns:
+        """
+        Gets the metadata associated to files as columns.
+        """
+        node = self._get_node()
+        manager = self._manager
+        columns = MetaDataColumns(tz=self._timezone)
+        for name, child in zip(manager._child_names[node], manager._child_nodes[node]):
+            if manager._kinds[child] != KIND_FILE:
+                continue
+            columns.append(name, size=manager._sizes[child], time_created=manager._created[child], time_modified=manager._modified[child])  # fmt: skip
+        return columns
+
+    def get_listing(self) -> tuple[MetaDataColumns, list[str]]:
+        """
+        Gets the metadata associated to files as columns and all paths to subfolders.
+        """
+        return self.get_files_meta_data_columns(), self.get_subfolder_paths()
+
+    def write_bytes(
+        self,
+        contents: bytes,
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> MemoryFilesManagerFile:
+        node = self._get_node()
+        self._manager.add_file_node(node, name, contents=bytes(contents))
+        return self.get_file(name)
+
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> MemoryFilesManagerFile:
+        """
+        Writes file contents given a stream of buffers.
+        """
+        return self.write_bytes(b"".join(chunks), name=name, chunk=chunk)
+
+    def add_subfolder(self, name: str) -> MemoryFilesManagerFolder:
+        """
+        Adds subfolder and returns a manager for it.
+        If subfolder already exists, it will not be created.
+        """
+        path = MemoryFilesManager.path_join(self._path, name)
+        return self._manager.create_folder(path)
+
+    def clear_folder(self) -> bool:
+        """
+        Removes all contents of current folder
+        """
+        node = self._get_node()
+        success = True
+        for child in list(self._manager._child_nodes[node]):
+            success = self._manager.remove_node(child) and success
+        return success
+
+    def delete_self(self) -> bool:
+        """
+        Deletes current folder
+        """
+        node = self._manager.get_node(self._path)
+        if node is None or self._manager.get_kind(node) != KIND_FOLDER:
+            return True
+        if node == ROOT:
+            return self.clear_folder()
+        return self._manager.remove_node(node)
+
+    def _get_node(self) -> int:
+        node = self._manager.get_node(self._path)
+        if node is None or self._manager.get_kind(node) != KIND_FOLDER:
+            raise FileNotFoundError(f"no such folder: {self._path!r}")
+        return node
+
+    def _get_children(self, kind: int, /) -> list[str]:
+        node = self._get_node()
+        kinds = self._manager._kinds
+        names = self._manager._child_names[node]
+        nodes = self._manager._child_nodes[node]
+        return [name for name, child in zip(names, nodes) if kinds[child] == kind]
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def is_normalised_path(path: str, /) -> bool:
+    """
+    Checks whether a path is already in the normalised form `"a/b/c"` (or `"."`).
+    """
+    if path == ".":
+        return True
+    if path == "" or path != path.strip() or "\\" in path:
+        return False
+    path_ = f"/{path}/"
+    return "//" not in path_ and "/./" not in path_ and "/../" not in path_
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Generators of synthetic trees for file systems held in memory
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import random
+from typing import Callable
+
+from .classes import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "create_deep_tree",
+    "create_skewed_tree",
+    "create_wide_tree",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def create_wide_tree(
+    manager: MemoryFilesManager,
+    /,
+    *,
+    path: str = ".",
+    width: int,
+    depth: int = 1,
+    files_per_folder: int = 0,
+    file_size: int = 0,
+    seed: int | None = None,
+) -> MemoryFilesManagerFolder:
+    """
+    Creates a complete tree, in which each folder (up to the given depth)
+    has `width` subfolders, i.e. `width + width² + ... + width^depth` folders in total.
+
+    @inputs
+
+    - `manager` - the files manager in which the tree is created
+
+    - `path` <`string`> - path to the root of the tree (created if need be)
+
+    - `width` <`integer`> - number of subfolders per folder
+
+    - `depth` <`integer`> - number of levels of subfolders
+
+    - `files_per_folder` <`integer`> - number of files in each folder (incl. root)
+
+    - `file_size` <`integer`> - (mean) size of files, see `seed`
+
+    - `seed` <`integer`> - (optional) if set, sizes are drawn from an exponential distribution
+        of mean `file_size`, otherwise all files have size `file_size`
+
+    @returns
+
+    - the folder at the root of the tree
+    """
+    return _create_tree(
+        manager,
+        path=path,
+        depth=depth,
+        get_heights=lambda h: [h - 1] * width,
+        files_per_folder=files_per_folder,
+        file_size=file_size,
+        seed=seed,
+    )
+
+
+def create_deep_tree(
+    manager: MemoryFilesManager,
+    /,
+    *,
+    path: str = ".",
+    depth: int,
+    width: int = 1,
+    files_per_folder: int = 0,
+    file_size: int = 0,
+    seed: int | None = None,
+) -> MemoryFilesManagerFolder:
+    """
+    Creates a tree consisting of a chain of `depth` nested folders,
+    each of which has `width - 1` further sibling folders without subfolders.
+
+    NOTE: see `create_wide_tree` for the remaining inputs.
+    """
+    return _create_tree(
+        manager,
+        path=path,
+        depth=depth,
+        get_heights=lambda h: [h - 1] + [0] * (width - 1),
+        files_per_folder=files_per_folder,
+        file_size=file_size,
+        seed=seed,
+    )
+
+
+def create_skewed_tree(
+    manager: MemoryFilesManager,
+    /,
+    *,
+    path: str = ".",
+    depth: int,
+    width: int = 2,
+    files_per_folder: int = 0,
+    file_size: int = 0,
+    seed: int | None = None,
+) -> MemoryFilesManagerFolder:
+    """
+    Creates an unbalanced tree, in which the `k`-th subfolder (`k = 0, 1, ...`)
+    of a folder of height `h` has height `h - 1 - k`,
+    i.e. the first branch is as deep as possible and later branches are increasingly shallow.
+    For `width = 2` the number of folders grows like the Fibonacci numbers.
+
+    NOTE: see `create_wide_tree` for the remaining inputs.
+    """
+    return _create_tree(
+        manager,
+        path=path,
+        depth=depth,
+        get_heights=lambda h: [h - 1 - k for k in range(min(width, h))],
+        files_per_folder=files_per_folder,
+        file_size=file_size,
+        seed=seed,
+    )
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def _create_tree(
+    manager: MemoryFilesManager,
+    /,
+    *,
+    path: str,
+    depth: int,
+    get_heights: Callable[[int], list[int]],
+    files_per_folder: int,
+    file_size: int,
+    seed: int | None,
+) -> MemoryFilesManagerFolder:
+    """
+    Creates a tree depth-first, whereby `get_heights(h)` determines
+    the heights of the subfolders of a folder of height `h > 0`.
+    """
+    rng = random.Random(seed) if seed is not None else None
+    root = manager.create_folder(path)
+
+    # NOTE: zero-padded names are added in sorted order, hence in O(1)
+    digits = len(str(max(files_per_folder - 1, 0)))
+    filenames = [f"file_{i:0{digits}d}.txt" for i in range(files_per_folder)]
+
+    # (node, height)
+    stack = [(manager.get_node(root.path), depth)]
+    while len(stack) > 0:
+        node, h = stack.pop()
+
+        for filename in filenames:
+            size = file_size
+            if rng is not None and file_size > 0:
+                size = int(rng.expovariate(1 / file_size))
+            manager.add_file_node(node, filename, size=size)
+
+        if h <= 0:
+            continue
+
+        heights = get_heights(h)
+        digits = len(str(max(len(heights) - 1, 0)))
+        for i, height in enumerate(heights):
+            child = manager.add_folder_node(node, f"folder_{i:0{digits}d}")
+            stack.append((child, height))
+
+    return root
@@ -10,13 +10,16 @@ This submodule provides a realisation of the FilesManager interface for local op
 # ----------------------------------------------------------------
 
 from .classes import *
+from .deletion import *
 
 # ----------------------------------------------------------------
 # EXPORTS
 # ----------------------------------------------------------------
 
 __all__ = [
+    "DeletionReport",
     "OSFilesManager",
     "OSFilesManagerFile",
     "OSFilesManagerFolder",
+    "delete_tree",
 ]
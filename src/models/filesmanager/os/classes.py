@@ -7,16 +7,25 @@
 
 from __future__ import annotations
 
+import mmap
 import os
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from datetime import datetime
 from datetime import timezone
 from pathlib import Path
+from threading import Lock
+from typing import Generator
+from typing import Iterable
 
 from pydantic import AwareDatetime
 
 from ...._core.constants import *
 from ...._core.utils.time import *
 from ...generated.application import MetaData
+from ..columns import *
+from .deletion import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -28,6 +37,13 @@ __all__ = [
     "OSFilesManagerFolder",
 ]
 
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+MAX_STATS = 100_000
+MAX_OWNERS = 1_024
+
 # ----------------------------------------------------------------
 # CLASSES
 # ----------------------------------------------------------------
@@ -36,12 +52,30 @@ __all__ = [
 class OSFilesManager:
     """
     File system for a local operating system
+
+    NOTE: file objects stat their file at most once.
+    If `stat_ttl` (in seconds) is set, stat results are moreover shared across file objects
+    for at most that duration (and invalidated by modifications made via this manager).
+    Names of owners are resolved once per uid.
     """
 
     _timezone: timezone | None
+    stat_ttl: float | None
+    _stats: OrderedDict[str, tuple[float, os.stat_result]]
+    _owners: OrderedDict[int, str | None]
+    _lock: Lock
 
-    def __init__(self, tz: timezone | None = None):
+    def __init__(
+        self,
+        tz: timezone | None = None,
+        *,
+        stat_ttl: float | None = None,
+    ):
         self._timezone = tz
+        self.stat_ttl = stat_ttl
+        self._stats = OrderedDict()
+        self._owners = OrderedDict()
+        self._lock = Lock()
         return
 
     @staticmethod
@@ -89,7 +123,7 @@ class OSFilesManager:
         tz = self._timezone
         path_full = Path(*path).as_posix() or "."
         path_full = path_full.strip().rstrip(r"\/")
-        return OSFilesManagerFile(path=path_full, tz=tz)
+        return OSFilesManagerFile(self, path=path_full, tz=tz)
 
     def get_folder(self, *path: str) -> OSFilesManagerFolder:
         """
@@ -129,26 +163,97 @@ class OSFilesManager:
         file = folder.write_bytes(contents, name=filename, chunk=chunk)
         return file
 
+    def get_stat(self, path: str, /) -> os.stat_result:
+        """
+        Gets the stat result of a path,
+        from the cache if enabled and the cached result is not older than `stat_ttl`.
+        """
+        if self.stat_ttl is None:
+            return os.stat(path)
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._stats.get(path)
+            if entry is not None and now - entry[0] < self.stat_ttl:
+                self._stats.move_to_end(path)
+                return entry[1]
+
+        meta = os.stat(path)
+        with self._lock:
+            self._stats[path] = (now, meta)
+            self._stats.move_to_end(path)
+            while len(self._stats) > MAX_STATS:
+                self._stats.popitem(last=False)
+
+        return meta
+
+    def invalidate_stat(self, path: str, /):
+        """
+        Drops the cached stat result of a path.
+        """
+        with self._lock:
+            self._stats.pop(path, None)
+
+    def invalidate_stats(self):
+        """
+        Drops all cached stat results (e.g. after a tree has been deleted).
+        """
+        with self._lock:
+            self._stats.clear()
+
+    def get_owner(self, uid: int, /) -> str | None:
+        """
+        Gets the name of the owner with a given uid (`None` if it cannot be resolved).
+
+        NOTE: owner names are cached (least recently used entries are evicted).
+        """
+        with self._lock:
+            if uid in self._owners:
+                self._owners.move_to_end(uid)
+                return self._owners[uid]
+
+        try:
+            # NOTE: only works on unix
+            import pwd
+
+            name = pwd.getpwuid(uid).pw_name
+
+        except Exception as _:
+            name = None
+
+        with self._lock:
+            self._owners[uid] = name
+            while len(self._owners) > MAX_OWNERS:
+                self._owners.popitem(last=False)
+
+        return name
+
 
 class OSFilesManagerFile:
     """
     File manager for a local operating system
     """
 
+    _manager: OSFilesManager
     _path: str
     _timezone: timezone | None
-    _object: Path
+    _stat: os.stat_result | None
+    _dates: tuple[AwareDatetime, AwareDatetime] | None
 
     def __init__(
         self,
+        manager: OSFilesManager,
         /,
         *,
         path: str,
         tz: timezone | None,
     ):
         assert path != "", "Path cannot be empty!"
+        self._manager = manager
         self._path = path
         self._timezone = tz
+        self._stat = None
+        self._dates = None
         return
 
     @staticmethod
@@ -214,7 +319,7 @@ class OSFilesManagerFile:
         """
         Gets meta attribute - size of file
         """
-        meta = os.stat(self._path)
+        meta = self._get_stat()
         return meta.st_size
 
     @property
@@ -223,9 +328,8 @@ class OSFilesManagerFile:
         Gets file author
         """
         try:
-            # NOTE: only works on linux
-            p = Path(self._path)
-            return p.owner()
+            meta = self._get_stat()
+            return self._manager.get_owner(meta.st_uid)
 
         except Exception as _:
             return None
@@ -242,24 +346,16 @@ class OSFilesManagerFile:
         """
         Gets meta attribute - date of creation
         """
-        meta = os.stat(self._path)
-
-        try:
-            # NOTE: only works for some OS's
-            t = datetime.fromtimestamp(meta.st_birthtime)
-
-        except Exception as _:
-            t = datetime.fromtimestamp(meta.st_ctime)
-        return add_timezone(t, tz=self._timezone)
+        t, _ = self._get_dates()
+        return t
 
     @property
     def date_modified(self) -> AwareDatetime | None:
         """
         Gets meta attribute - date of (last) modification
         """
-        meta = os.stat(self._path)
-        t = datetime.fromtimestamp(meta.st_mtime)
-        return add_timezone(t, tz=self._timezone)
+        _, t = self._get_dates()
+        return t
 
     def get_meta_data(self) -> MetaData:
         """
@@ -284,6 +380,40 @@ class OSFilesManagerFile:
             contents = fp.read()
             return contents
 
+    def iter_chunks(self, *, chunk: int = SIZE_1_MB) -> Generator[bytes, None, None]:
+        """
+        Streams file contents in chunks (of at most the given size)
+        """
+        with open(self._path, "rb", buffering=0) as fp:
+            while True:
+                contents = fp.read(chunk)
+                if not contents:
+                    break
+                yield contents
+
+    @contextmanager
+    def open_memoryview(self) -> Generator[memoryview, None, None]:
+        """
+        Maps the file into memory (read-only) and provides a view of its contents,
+        so that (large) files can be processed without reading them into buffers.
+
+        NOTE: the view is released upon exiting the context, hence must not be retained.
+        """
+        with open(self._path, "rb") as fp:
+            size = os.fstat(fp.fileno()).st_size
+            # NOTE: empty files cannot be mapped
+            if size == 0:
+                yield memoryview(b"")
+                return
+
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                view = memoryview(mm)
+                try:
+                    yield view
+
+                finally:
+                    view.release()
+
     def delete_self(self) -> bool:
         """
         Deletes current file
@@ -292,12 +422,36 @@ class OSFilesManagerFile:
             return True
         try:
             os.remove(self._path)
+            self._manager.invalidate_stat(self._path)
+            self._stat = None
+            self._dates = None
             ex = self.exists
             return False if ex is None else not ex
 
         except Exception:
             return False
 
+    def _get_stat(self) -> os.stat_result:
+        """
+        Gets the stat result of the file (loaded once).
+        """
+        if self._stat is None:
+            self._stat = self._manager.get_stat(self._path)
+        return self._stat
+
+    def _get_dates(self) -> tuple[AwareDatetime, AwareDatetime]:
+        """
+        Gets the dates of creation and (last) modification (converted once).
+        """
+        if self._dates is None:
+            meta = self._get_stat()
+            # NOTE: only some OS's record the time of birth
+            t_created = getattr(meta, "st_birthtime", meta.st_ctime)
+            t_created = add_timezone(datetime.fromtimestamp(t_created), tz=self._timezone)
+            t_modified = add_timezone(datetime.fromtimestamp(meta.st_mtime), tz=self._timezone)
+            self._dates = (t_created, t_modified)
+        return self._dates
+
 
 class OSFilesManagerFolder:
     """
@@ -418,8 +572,46 @@ class OSFilesManagerFolder:
         """
         Gets a list of metadata associated to files
         """
-        files = self.get_files()
-        return [file.get_meta_data() for file in files]
+        columns = self.get_files_meta_data_columns()
+        return columns.to_meta_data()
+
+    def get_files_meta_data_columns(self) -> MetaDataColumns:
+        """
+        Gets the metadata associated to files as columns.
+
+        NOTE: lists the folder once, without constructing file objects or models.
+        """
+        columns, _ = self.get_listing()
+        return columns
+
+    def get_listing(self) -> tuple[MetaDataColumns, list[str]]:
+        """
+        Gets the metadata associated to files as columns and all paths to subfolders.
+
+        NOTE: lists the folder once (via `scandir`), whereby the kinds of entries
+        are mostly known from the listing itself, i.e. only files are stat-ed.
+        """
+        columns = MetaDataColumns(tz=self._timezone)
+        paths = list[str]()
+        with os.scandir(self._path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        paths.append(Path(self._path, entry.name).as_posix())
+                        continue
+                    if not entry.is_file():
+                        continue
+                    meta = entry.stat()
+
+                except OSError as _:
+                    continue
+
+                # NOTE: only some OS's record the time of birth
+                t_created = getattr(meta, "st_birthtime", meta.st_ctime)
+                owner = self._manager.get_owner(meta.st_uid)
+                columns.append(entry.name, size=meta.st_size, time_created=t_created, time_modified=meta.st_mtime, owner=owner)  # fmt: skip
+
+        return columns, paths
 
     def write_bytes(
         self,
@@ -429,11 +621,28 @@ class OSFilesManagerFolder:
         name: str,
         chunk: int = 10 * SIZE_1_MB,
     ) -> OSFilesManagerFile:
+        view = memoryview(contents)
+        chunks = (view[k : k + chunk] for k in range(0, len(view), chunk))
+        return self.write_chunks(chunks, name=name, chunk=chunk)
+
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        name: str,
+        chunk: int = 10 * SIZE_1_MB,
+    ) -> OSFilesManagerFile:
+        """
+        Writes file contents given a stream of buffers (written as they arrive).
+        """
         path = Path(self._path, name).as_posix()
         with open(path, "wb") as fp:
-            fp.write(contents)
+            for contents in chunks:
+                fp.write(contents)
 
-        return OSFilesManagerFile(path=path, tz=self._timezone)
+        self._manager.invalidate_stat(path)
+        return OSFilesManagerFile(self._manager, path=path, tz=self._timezone)
 
     def add_subfolder(self, name: str) -> OSFilesManagerFolder:
         """
@@ -449,29 +658,26 @@ class OSFilesManagerFolder:
             tz=self._timezone,
         )
 
-    def clear_folder(self) -> bool:
+    def clear_folder(self, *, max_workers: int = 1) -> DeletionReport:
         """
-        Removes all contents of current folder
+        Removes all contents of current folder.
+
+        Returns a report of the deletion, which evaluates to `True` if nothing failed.
+
+        NOTE: for `max_workers > 1` the subfolders are deleted concurrently.
         """
-        success = True
-        for file in self.get_files():
-            success = success and file.delete_self()
-        for subfolder in self.get_subfolders():
-            success = success and subfolder.delete_self()
-        return success
+        report = delete_tree(self._path, keep_root=True, max_workers=max_workers)
+        self._manager.invalidate_stats()
+        return report
 
-    def delete_self(self) -> bool:
+    def delete_self(self, *, max_workers: int = 1) -> DeletionReport:
         """
-        Deletes current folder
+        Deletes current folder.
+
+        Returns a report of the deletion, which evaluates to `True` if nothing failed.
+
+        NOTE: for `max_workers > 1` the subfolders are deleted concurrently.
         """
-        if not self.exists:
-            return True
-        success = self.clear_folder()
-        if not success:
-            return False
-        if not self.exists:
-            return True
-        os.rmdir(self._path)
-        ex = self.exists
-        not_ex = False if ex is None else not ex
-        return success and not_ex
+        report = delete_tree(self._path, max_workers=max_workers)
+        self._manager.invalidate_stats()
+        return report
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from dataclasses import field
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "DeletionReport",
+    "delete_tree",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# NOTE: with directory descriptors entries are removed relative to their parent (unlinkat/rmdir),
+# which avoids resolving full paths and following symlinks that were swapped in meanwhile
+USE_DIR_FD = {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd  # fmt: skip
+FLAGS_DIR = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_NOFOLLOW", 0)
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+@dataclass(slots=True)
+class DeletionReport:
+    """
+    Report of a (recursive) deletion.
+
+    Evaluates to `True` if and only if nothing failed,
+    so that it can be used in place of the boolean of success.
+    """
+
+    n_files: int = 0
+    n_folders: int = 0
+    failures: list[tuple[str, str]] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return len(self.failures) == 0
+
+    def merge(self, other: DeletionReport, /) -> DeletionReport:
+        """
+        Adds the counts and failures of another report to this one.
+        """
+        self.n_files += other.n_files
+        self.n_folders += other.n_folders
+        self.failures.extend(other.failures)
+        return self
+
+    def add_failure(self, path: str, err: BaseException, /):
+        self.failures.append((path, f"{type(err).__name__}: {err}"))
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def delete_tree(
+    path: str,
+    /,
+    *,
+    keep_root: bool = False,
+    max_workers: int = 1,
+) -> DeletionReport:
+    """
+    Deletes a directory and all its contents (only the contents if `keep_root` is set).
+
+    Each directory is listed exactly once (via `scandir`)
+    and entries are removed relative to descriptors of their parent directories.
+    Failures are collected in the report rather than aborting the deletion.
+
+    NOTE: symbolic links are removed, not followed.
+    NOTE: for `max_workers > 1` the immediate subdirectories are deleted concurrently.
+    """
+    report = DeletionReport()
+    if not os.path.lexists(path):
+        return report
+
+    if not os.path.isdir(path) or os.path.islink(path):
+        report.add_failure(path, NotADirectoryError(f"not a directory: {path!r}"))
+        return report
+
+    try:
+        if USE_DIR_FD:
+            fd = os.open(path, FLAGS_DIR)
+            try:
+                clear_tree_fd(fd, path, report=report, max_workers=max_workers)
+
+            finally:
+                os.close(fd)
+
+        else:
+            clear_tree_path(path, report=report, max_workers=max_workers)
+
+    except OSError as err:
+        report.add_failure(path, err)
+
+    if not keep_root and report:
+        try:
+            os.rmdir(path)
+            report.n_folders += 1
+
+        except OSError as err:
+            report.add_failure(path, err)
+
+    return report
+
+
+# ----------------------------------------------------------------
+# AUXILIARY METHODS
+# ----------------------------------------------------------------
+
+
+def clear_tree_fd(
+    fd: int,
+    path: str,
+    /,
+    *,
+    report: DeletionReport,
+    max_workers: int = 1,
+):
+    """
+    Removes the contents of a directory given by a descriptor.
+    """
+    subfolders = clear_files_fd(fd, path, report=report)
+
+    def delete_subfolder(name: str) -> DeletionReport:
+        report_ = DeletionReport()
+        delete_subfolders_fd(fd, path, [name], report=report_)
+        return report_
+
+    for report_ in map_subfolders(delete_subfolder, subfolders, max_workers=max_workers):
+        report.merge(report_)
+
+
+def delete_subfolders_fd(
+    fd: int,
+    path: str,
+    names: list[str],
+    /,
+    *,
+    report: DeletionReport,
+):
+    """
+    Deletes subfolders (given by their names) of a directory given by a descriptor.
+
+    NOTE: the subtrees are walked depth-first with an explicit stack rather than recursively,
+    so that deep trees do not exceed the recursion limit,
+    and only the descriptors of the directories along the current branch are open.
+    """
+    # frames: (descriptor, path, name, remaining subfolders, number of failures upon entry)
+    stack = [(fd, path, "", iter(names), len(report.failures))]
+    try:
+        while len(stack) > 0:
+            fd_, path_, name_, subfolders, n_failures = stack[-1]
+            name = next(subfolders, None)
+            if name is not None:
+                path_sub = f"{path_}/{name}"
+                n_failures_sub = len(report.failures)
+                try:
+                    fd_sub = os.open(name, FLAGS_DIR, dir_fd=fd_)
+
+                except OSError as err:
+                    report.add_failure(path_sub, err)
+                    continue
+
+                stack.append((fd_sub, path_sub, name, iter([]), n_failures_sub))
+                try:
+                    names_sub = clear_files_fd(fd_sub, path_sub, report=report)
+                    stack[-1] = (fd_sub, path_sub, name, iter(names_sub), n_failures_sub)
+
+                except OSError as err:
+                    report.add_failure(path_sub, err)
+
+                continue
+
+            stack.pop()
+            if len(stack) == 0:
+                break
+
+            # NOTE: the directory is only removed if nothing within it failed
+            os.close(fd_)
+            if len(report.failures) == n_failures:
+                try:
+                    os.rmdir(name_, dir_fd=stack[-1][0])
+                    report.n_folders += 1
+
+                except OSError as err:
+                    report.add_failure(path_, err)
+
+    finally:
+        # NOTE: only relevant if aborted, the descriptor of the root is owned by the caller
+        for fd_, *_ in stack[1:]:
+            os.close(fd_)
+
+
+def clear_files_fd(
+    fd: int,
+    path: str,
+    /,
+    *,
+    report: DeletionReport,
+) -> list[str]:
+    """
+    Removes the files (and symbolic links) of a directory given by a descriptor
+    and returns the names of its subfolders.
+    """
+    subfolders = []
+    with os.scandir(fd) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.name)
+                    continue
+                os.unlink(entry.name, dir_fd=fd)
+                report.n_files += 1
+
+            except OSError as err:
+                report.add_failure(f"{path}/{entry.name}", err)
+
+    return subfolders
+
+
+def clear_tree_path(
+    path: str,
+    /,
+    *,
+    report: DeletionReport,
+    max_workers: int = 1,
+):
+    """
+    Removes the contents of a directory given by a path
+    (fallback for systems without support for directory descriptors).
+    """
+    subfolders = clear_files_path(path, report=report)
+
+    def delete_subfolder(path_: str) -> DeletionReport:
+        report_ = DeletionReport()
+        delete_subfolders_path([path_], report=report_)
+        return report_
+
+    for report_ in map_subfolders(delete_subfolder, subfolders, max_workers=max_workers):
+        report.merge(report_)
+
+
+def delete_subfolders_path(
+    paths: list[str],
+    /,
+    *,
+    report: DeletionReport,
+):
+    """
+    Deletes folders (given by their paths) and all their contents
+    (fallback for systems without support for directory descriptors).
+
+    NOTE: the subtrees are walked depth-first with an explicit stack rather than recursively.
+    """
+    # frames: (path, remaining subfolders, number of failures upon entry)
+    stack = [("", iter(paths), len(report.failures))]
+    while len(stack) > 0:
+        path_, subfolders, n_failures = stack[-1]
+        path = next(subfolders, None)
+        if path is not None:
+            n_failures_sub = len(report.failures)
+            try:
+                paths_sub = clear_files_path(path, report=report)
+                stack.append((path, iter(paths_sub), n_failures_sub))
+
+            except OSError as err:
+                report.add_failure(path, err)
+
+            continue
+
+        stack.pop()
+        if len(stack) == 0:
+            break
+
+        # NOTE: the directory is only removed if nothing within it failed
+        if len(report.failures) == n_failures:
+            try:
+                os.rmdir(path_)
+                report.n_folders += 1
+
+            except OSError as err:
+                report.add_failure(path_, err)
+
+
+def clear_files_path(
+    path: str,
+    /,
+    *,
+    report: DeletionReport,
+) -> list[str]:
+    """
+    Removes the files (and symbolic links) of a directory given by a path
+    and returns the paths of its subfolders.
+    """
+    subfolders = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subfolders.append(entry.path)
+                    continue
+                os.unlink(entry.path)
+                report.n_files += 1
+
+            except OSError as err:
+                report.add_failure(entry.path, err)
+
+    return subfolders
+
+
+def map_subfolders(method, subfolders: list[str], /, *, max_workers: int):
+    """
+    Applies a method to subfolders, concurrently if more than one worker is allowed.
+
+    NOTE: the removal of entries is dominated by system calls (which release the GIL),
+    hence threads suffice.
+    """
+    if max_workers <= 1 or len(subfolders) <= 1:
+        return map(method, subfolders)
+
+    n = min(max_workers, len(subfolders))
+    with ThreadPoolExecutor(max_workers=n, thread_name_prefix="delete-tree") as executor:
+        return list(executor.map(method, subfolders))
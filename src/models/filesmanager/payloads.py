@@ -5,8 +5,9 @@
 # IMPORTS
 # ----------------------------------------------------------------
 
-
+from functools import cached_property
 from functools import wraps
+from typing import Any
 from typing import Callable
 from typing import Concatenate
 from typing import Generic
@@ -21,6 +22,8 @@ from ..._core.constants import *
 from ..._core.utils.io import *
 from ..generated.application import EnumDataFileFormat
 from ..generated.application import EnumFilesSystem
+from ..generated.application import ProxyConfig
+from .cache import *
 from .config import *
 from .traits import *
 
@@ -61,6 +64,16 @@ class PayloadParser(BaseModel, Generic[T]):
     managers: dict[EnumFilesSystem, SkipValidation[FilesManager]]
     location: EnumFilesSystem | None = None
     root: str | None = None
+    cache: SkipValidation[ConfigCache] | None = None
+
+    def model_post_init(self, __context: Any) -> None:
+        # NOTE: builds validators upon creation rather than upon first parse
+        get_config_validator(self.type_)
+        get_config_validator(ProxyConfig)
+
+    @cached_property
+    def loader(self) -> ConfigLoader[T]:
+        return ConfigLoader[T](managers=self.managers, type_=self.type_, cache=self.cache)
 
     def parse(
         self,
@@ -76,7 +89,7 @@ class PayloadParser(BaseModel, Generic[T]):
         - `contents = null`  -> reads from local file in setup/...
         - `contents ~ bytes` -> parses payload.
         """
-        managers = self.managers
+        loader = self.loader
         loc = self.location
         root = self.root
 
@@ -94,13 +107,11 @@ class PayloadParser(BaseModel, Generic[T]):
             case None:
                 assert (loc is not None) and (root is not None), \
                     f"need to set location and path in PayloadParser for {self.type_.__name__}"  # fmt: skip
-                loader = ConfigLoader[T](managers=managers, type_=self.type_)
                 result = loader.load_from_file(loc=loc, path=root, fmt=fmt)
                 return result
 
             case _:
                 fmt = fmt or EnumDataFileFormat.FIELD_JSON
-                loader = ConfigLoader[T](managers=managers, type_=self.type_)
                 result = loader.load_from_contents(contents, fmt=fmt)
                 return result
 
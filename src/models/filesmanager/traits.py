@@ -11,12 +11,15 @@ This module contains interfaces/types
 
 from __future__ import annotations
 
+from typing import Generator
+from typing import Iterable
 from typing import Protocol
 
 from pydantic import AwareDatetime
 
 from ..._core.constants import *
 from ..generated.application import MetaData
+from .columns import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -207,6 +210,12 @@ class FilesManagerFile(Protocol):
         """
         ...
 
+    def iter_chunks(self, *, chunk: int) -> Generator[bytes, None, None]:
+        """
+        Streams file contents in chunks (of at most the given size)
+        """
+        ...
+
     def delete_self(self) -> bool:
         """
         Deletes current file
@@ -295,6 +304,19 @@ class FilesManagerFolder(Protocol):
         """
         ...
 
+    def get_files_meta_data_columns(self) -> MetaDataColumns:
+        """
+        Gets the metadata associated to files as columns
+        """
+        ...
+
+    def get_listing(self) -> tuple[MetaDataColumns, list[str]]:
+        """
+        Gets the metadata associated to files as columns and all paths to subfolders
+        (in one listing of the folder, where the file system permits)
+        """
+        ...
+
     def write_bytes(
         self,
         contents: bytes,
@@ -308,6 +330,19 @@ class FilesManagerFolder(Protocol):
         """
         ...
 
+    def write_chunks(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        /,
+        *,
+        name: str,
+        chunk: int,
+    ) -> FilesManagerFile:
+        """
+        Writes file contents to a folder given a stream of buffers
+        """
+        ...
+
     def add_subfolder(self, name: str) -> FilesManagerFolder:
         """
         Adds subfolder and returns a manager for it.
@@ -49,6 +49,15 @@ class GeneralConfig(BaseModel):
     )
 
 
+class EnumHashAlgorithm(str, Enum):
+    """
+    Algorithm with which to hash contents of files
+    """
+
+    BLAKE2B = "blake2b"
+    SHA256 = "sha256"
+
+
 class RequestTaskOptions(BaseModel):
     """
     Structure of requests payload > options
@@ -83,6 +92,58 @@ class RequestTaskOptions(BaseModel):
         alias="max-duration",
         description="Limits the amount of time spent for a search",
     )
+    publish_rate: float | None = Field(
+        default=None,
+        alias="publish-rate",
+        description="Maximum rate (messages per second) at which results are published to the queue.\nIf not set, publication is not rate limited.",
+    )
+    publish_burst: int = Field(
+        default=100,
+        alias="publish-burst",
+        description="Maximum number of messages which may be published in a burst (size of token bucket).",
+    )
+    queue_high_watermark: int | None = Field(
+        default=None,
+        alias="queue-high-watermark",
+        description="If set, the depth of the queue is polled and traversal pauses whilst it exceeds this value.",
+    )
+    queue_low_watermark: int | None = Field(
+        default=None,
+        alias="queue-low-watermark",
+        description="Depth of queue below which paused traversal resumes.\nIf not set, defaults to half of the high watermark.",
+    )
+    hash: EnumHashAlgorithm | None = Field(
+        default=None,
+        description="If set, the contents of each file found are hashed with this algorithm\nand the digest is included in the published message.",
+    )
+    sniff: bool = Field(
+        default=False,
+        description="Whether to detect the content type of each file found (from its first few KB)\nand include it in the published message.",
+    )
+    top_n: int = Field(
+        default=20,
+        alias="top-n",
+        description="Number of heaviest directories reported (for DISK-USAGE).",
+    )
+    summary_depth: int = Field(
+        default=2,
+        alias="summary-depth",
+        description="Depth of the summary tree of directories published (for DISK-USAGE).",
+    )
+
+
+class EstimateInterval(BaseModel):
+    """
+    An estimated value together with confidence bounds
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        populate_by_name=True,
+    )
+    value: float
+    lower: float
+    upper: float
 
 
 class MetaData(BaseModel):
@@ -115,6 +176,8 @@ class EnumFeatures(str, Enum):
 
     VERSION = "version"
     SEARCH_FS = "SEARCH-FS"
+    DUPLICATES = "DUPLICATES"
+    DISK_USAGE = "DISK-USAGE"
 
 
 class EnumDataFileFormat(str, Enum):
@@ -123,6 +186,8 @@ class EnumDataFileFormat(str, Enum):
     """
 
     FIELD_JSON = ".json"
+    FIELD_NDJSON = ".ndjson"
+    FIELD_JSONL = ".jsonl"
     FIELD_YAML = ".yaml"
     FIELD_TOML = ".toml"
     FIELD_XML = ".xml"
@@ -139,6 +204,8 @@ class EnumFilesSystem(str, Enum):
     OS = "OS"
     BLOB_STORAGE = "BLOB-STORAGE"
     SHAREPOINT = "SHAREPOINT"
+    MEMORY = "MEMORY"
+    ARCHIVE = "ARCHIVE"
 
 
 class FileRef(BaseModel):
@@ -173,6 +240,51 @@ class RequestTaskData(BaseModel):
     inputs: FileRef
 
 
+class DiskUsageEntry(BaseModel):
+    """
+    Cumulative usage of a directory (incl. all its subdirectories)
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        populate_by_name=True,
+    )
+    path: str = Field(..., description="Path to directory")
+    folders: int = Field(..., description="Number of subdirectories (recursively)")
+    files: int = Field(..., description="Number of files (recursively)")
+    bytes: int = Field(
+        ..., description="Total size (in bytes) of all files (recursively)"
+    )
+
+
+class SearchEstimate(BaseModel):
+    """
+    Estimated size of a directory tree (and of the duration of a full search),
+    based on random probes of the tree.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+        populate_by_name=True,
+    )
+    probes: int = Field(
+        ..., description="Number of random probes (root-to-leaf walks) performed"
+    )
+    folders_listed: int = Field(
+        ...,
+        alias="folders-listed",
+        description="Number of distinct folders listed during the estimation",
+    )
+    elapsed: float = Field(..., description="Time (in seconds) spent on the estimation")
+    confidence: float = Field(..., description="Confidence level of the bounds")
+    folders: EstimateInterval
+    files: EstimateInterval
+    bytes: EstimateInterval
+    duration: EstimateInterval = Field(
+        ..., description="Expected duration (in seconds) of a full search"
+    )
+
+
 class ProxyConfig(BaseModel):
     """
     A proxy config which simply links to another config file.
@@ -20,9 +20,12 @@ from .trees import *
 # ----------------------------------------------------------------
 
 __all__ = [
+    "SETTINGS",
+    "EnumPropertyScope",
     "ExceptionWithData",
     "GenericTree",
     "Property",
+    "SettingsRegistry",
     "TempNameGenerator",
     "TriggerProperty",
     "convert_notes_to_exception",
@@ -6,22 +6,23 @@
 # ----------------------------------------------------------------
 
 from contextvars import ContextVar
+from enum import StrEnum
+from threading import RLock
 from typing import Any
 from typing import Callable
 from typing import Generic
 from typing import TypeVar
-
-from pydantic import BaseModel
-from pydantic import ConfigDict
-from pydantic import Field
-from pydantic import SkipValidation
+from weakref import WeakSet
 
 # ----------------------------------------------------------------
 # EXPORTS
 # ----------------------------------------------------------------
 
 __all__ = [
+    "SETTINGS",
+    "EnumPropertyScope",
     "Property",
+    "SettingsRegistry",
     "TriggerProperty",
 ]
 
@@ -31,12 +32,68 @@ __all__ = [
 
 T = TypeVar("T")
 
+# NOTE: marker for unset values (as `None` may be a legitimate value)
+_UNSET: Any = object()
+
 # ----------------------------------------------------------------
 # CLASSES
 # ----------------------------------------------------------------
 
 
-class Property(BaseModel, Generic[T]):
+class EnumPropertyScope(StrEnum):
+    """
+    Scope in which the value of a property is visible:
+
+    - `PROCESS` - value is shared by all threads/tasks/requests of the process
+    - `REQUEST` - value is local to the current context (e.g. asyncio task or request)
+    """
+
+    PROCESS = "PROCESS"
+    REQUEST = "REQUEST"
+
+
+class SettingsRegistry:
+    """
+    Keeps track of all properties and of hooks to be called upon reload.
+
+    ```py
+    SETTINGS.add_reload_hook(clear_some_cache)
+    SETTINGS.reload() # resets all properties and calls hooks
+    ```
+    """
+
+    _properties: WeakSet
+    _hooks: list[Callable[[], Any]]
+    _lock: RLock
+
+    def __init__(self):
+        self._properties = WeakSet()
+        self._hooks = []
+        self._lock = RLock()
+
+    def register(self, prop: "Property", /):
+        with self._lock:
+            self._properties.add(prop)
+
+    def add_reload_hook(self, hook: Callable[[], Any], /):
+        with self._lock:
+            self._hooks.append(hook)
+
+    def reload(self):
+        """
+        Resets all process-wide properties, whose values were computed (and not explicitly set),
+        so that these are recomputed upon next access, and calls the reload hooks.
+        """
+        with self._lock:
+            for prop in list(self._properties):
+                if prop.scope == EnumPropertyScope.PROCESS and not prop.explicit:
+                    prop.reset()
+
+            for hook in self._hooks:
+                hook()
+
+
+class Property(Generic[T]):
     """
     A class allowing delayed setting of properties.
 
@@ -87,24 +144,54 @@ class Property(BaseModel, Generic[T]):
     name.set('Julia Musterfrau') # allowed
     print(name()) # 'Julia Musterfrau'
     ```
+
+    By default values are shared across the entire process
+    and the factory is called at most once (thread-safe).
+    Values of properties with the `REQUEST` scope are local to the current context:
+
+    ```py
+    user = Property[str](label="user", scope="REQUEST")
+    ```
+
+    To force recomputation via the factory call `.reset()`
+    or `SETTINGS.reload()` for all properties which have not been explicitly set.
     """
 
-    model_config = ConfigDict(
-        extra="forbid",
-        populate_by_name=True,
-        arbitrary_types_allowed=True,
-    )
+    # DEV-NOTE: a plain class (rather than a pydantic model) keeps reads cheap
+    __slots__ = ("__weakref__", "_context", "_lock", "_value", "default", "explicit", "factory", "label", "scope")  # fmt: skip
 
     label: str
-    default: SkipValidation[T] | None = Field(default=None)
-    factory: SkipValidation[Callable[[], T]] | None = Field(default=None)
-    value: SkipValidation[ContextVar[T]] = Field(
-        default_factory=lambda: ContextVar[T]("name"),
-        init=False,
-    )
-
-    def model_post_init(self, __context: Any) -> None:
-        self.value = ContextVar[T](self.label)
+    default: T | None
+    factory: Callable[[], T] | None
+    scope: EnumPropertyScope
+    explicit: bool
+    _value: Any
+    _context: ContextVar[T] | None
+    _lock: RLock
+
+    def __init__(
+        self,
+        /,
+        *,
+        label: str,
+        default: T | None = None,
+        factory: Callable[[], T] | None = None,
+        scope: EnumPropertyScope | str = EnumPropertyScope.PROCESS,
+    ):
+        self.label = label
+        self.default = default
+        self.factory = factory
+        self.scope = EnumPropertyScope(scope)
+        self.explicit = False
+        self._value = _UNSET
+        self._context = None
+        self._lock = RLock()
+        if self.scope == EnumPropertyScope.REQUEST:
+            self._context = ContextVar[T](label)
+        SETTINGS.register(self)
+
+    def __repr__(self) -> str:
+        return f"Property(label={self.label!r}, scope={self.scope.value})"
 
     def get_default(self) -> T:
         if callable(self.factory):
@@ -115,21 +202,48 @@ class Property(BaseModel, Generic[T]):
 
         raise LookupError(f"Property {self.label} unset. Call {self.label}.set(...) first!")  # fmt: skip
 
-    def __call__(self) -> T:
-        return self.get()
-
     def get(self) -> T:
-        try:
-            value = self.value.get()
+        # NOTE: hot path - no locking once set
+        if (value := self._value) is not _UNSET:
             return value
 
-        except LookupError as _:
-            value = self.get_default()
-            self.set(value)
+        if self._context is not None:
+            if (value := self._context.get(_UNSET)) is _UNSET:
+                value = self.get_default()
+                self._context.set(value)
             return value
 
+        # DEV-NOTE: double-checked, so that factory is only called once
+        with self._lock:
+            if (value := self._value) is _UNSET:
+                value = self.get_default()
+                self._value = value
+            return value
+
+    __call__ = get
+
     def set(self, x: T):
-        self.value.set(x)
+        if self._context is not None:
+            self._context.set(x)
+            return
+
+        with self._lock:
+            self._value = x
+            self.explicit = True
+
+    def reset(self):
+        """
+        Unsets the value, so that it is recomputed via the factory/default upon next access.
+
+        NOTE: for the `REQUEST` scope only affects the current context.
+        """
+        if self._context is not None:
+            self._context.set(_UNSET)
+            return
+
+        with self._lock:
+            self._value = _UNSET
+            self.explicit = False
 
 
 class TriggerProperty:
@@ -154,3 +268,10 @@ class TriggerProperty:
         Permanently sets trigger value to `true`.
         """
         self._value.set(True)
+
+
+# ----------------------------------------------------------------
+# GLOBAL REGISTRY
+# ----------------------------------------------------------------
+
+SETTINGS = SettingsRegistry()
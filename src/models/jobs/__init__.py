@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+This submodule provides a subsystem to run (long running) features as background jobs
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from .admission import *
+from .manager import *
+from .progress import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "AdmissionController",
+    "EnumJobStatus",
+    "Job",
+    "JobCancelledError",
+    "JobManager",
+    "JobProgress",
+    "get_admission_key",
+]
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import collections
+import math
+import posixpath
+import time
+from collections import deque
+from contextlib import contextmanager
+from threading import Condition
+from typing import Callable
+from typing import Generator
+from typing import Iterable
+
+from ..._core.metrics import *
+from ..internal.errors import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "AdmissionController",
+    "get_admission_key",
+]
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+# NOTE: interval (in seconds) at which waiting callers check for cancellation
+CHECK_INTERVAL = 0.5
+
+# ----------------------------------------------------------------
+# METRICS
+# ----------------------------------------------------------------
+
+METRIC_IN_FLIGHT = METRICS.gauge("admission_scans_in_flight", "number of admitted scans")  # fmt: skip
+METRIC_WAITING = METRICS.gauge("admission_scans_waiting", "number of scans waiting for admission")  # fmt: skip
+METRIC_REJECTED = METRICS.counter("admission_rejected_total", "number of rejected scans", labels=["reason"])  # fmt: skip
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class AdmissionController:
+    """
+    Limits the number of concurrent scans
+    globally and per key (e.g. a prefix of the path being scanned).
+
+    ```py
+    admission = AdmissionController(max_global=4, max_per_key=1, max_waiting=16, timeout=30)
+    with admission.admit(["OS:data/example"]):
+        ... # perform scan
+    ```
+
+    Callers which cannot be admitted immediately wait in a bounded queue.
+    If the queue is full or the wait times out,
+    an error with code `429` and a `retry-after` estimate (in seconds) is raised.
+    """
+
+    max_global: int
+    max_per_key: int
+    max_waiting: int
+    timeout: float
+    _in_flight: int
+    _in_flight_per_key: collections.Counter[str]
+    _waiting: int
+    _durations: deque[float]
+    _cond: Condition
+
+    def __init__(
+        self,
+        /,
+        *,
+        max_global: int,
+        max_per_key: int,
+        max_waiting: int,
+        timeout: float,
+        history: int = 50,
+    ):
+        self.max_global = max_global
+        self.max_per_key = max_per_key
+        self.max_waiting = max_waiting
+        self.timeout = timeout
+        self._in_flight = 0
+        self._in_flight_per_key = collections.Counter()
+        self._waiting = 0
+        self._durations = deque(maxlen=history)
+        self._cond = Condition()
+        return
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @property
+    def waiting(self) -> int:
+        return self._waiting
+
+    @contextmanager
+    def admit(
+        self,
+        keys: Iterable[str],
+        /,
+        *,
+        queue: bool = True,
+        timeout: float | None = -1,
+        check: Callable[[], None] | None = None,
+    ) -> Generator[None, None, None]:
+        """
+        Context within which a scan is admitted.
+
+        - `queue` - whether the caller counts towards (and is bounded by) the wait queue.
+            Set to `false` for callers which are already bounded elsewhere (e.g. background jobs).
+        - `timeout` - maximal wait (in seconds). Defaults to the timeout of the controller.
+            Set to `None` to wait indefinitely.
+        - `check` - (optional) called regularly whilst waiting, e.g. to abort upon cancellation.
+        """
+        keys = sorted(set(keys))
+        timeout = self.timeout if timeout == -1 else timeout
+        self._acquire(keys, queue=queue, timeout=timeout, check=check)
+        t0 = time.monotonic()
+        try:
+            yield
+
+        finally:
+            self._release(keys, duration=time.monotonic() - t0)
+
+    def estimate_retry_after(self) -> int:
+        """
+        Estimates (in whole seconds) when a slot will become available
+        based on the durations of recent scans.
+        """
+        with self._cond:
+            if len(self._durations) == 0:
+                return 1
+            mean = sum(self._durations) / len(self._durations)
+            rounds = max(1.0, (self._in_flight + self._waiting) / max(1, self.max_global))
+            return max(1, math.ceil(mean * rounds))
+
+    # ----------------------------------------------------------------
+    # PRIVATE METHODS
+    # ----------------------------------------------------------------
+
+    def _can_admit(self, keys: list[str], /) -> bool:
+        if self._in_flight >= self.max_global:
+            return False
+        return all(self._in_flight_per_key[key] < self.max_per_key for key in keys)
+
+    def _acquire(
+        self,
+        keys: list[str],
+        /,
+        *,
+        queue: bool,
+        timeout: float | None,
+        check: Callable[[], None] | None,
+    ):
+        with self._cond:
+            if not self._can_admit(keys):
+                if queue and self._waiting >= self.max_waiting:
+                    METRIC_REJECTED.labels(reason="queue-full").inc()
+                    self._reject(f"too many scans waiting ({self._waiting}) - try again later")  # fmt: skip
+
+                t_end = None if timeout is None else time.monotonic() + timeout
+                if queue:
+                    self._waiting += 1
+                    METRIC_WAITING.inc()
+                try:
+                    while not self._can_admit(keys):
+                        remaining = None if t_end is None else t_end - time.monotonic()
+                        if remaining is not None and remaining <= 0:
+                            METRIC_REJECTED.labels(reason="timeout").inc()
+                            self._reject(f"timed out after {timeout}s waiting for other scans to finish - try again later")  # fmt: skip
+                        if check is not None:
+                            check()
+                        interval = CHECK_INTERVAL if remaining is None else min(CHECK_INTERVAL, remaining)  # fmt: skip
+                        self._cond.wait(timeout=interval)
+
+                finally:
+                    if queue:
+                        self._waiting -= 1
+                        METRIC_WAITING.dec()
+
+            self._in_flight += 1
+            self._in_flight_per_key.update(keys)
+            METRIC_IN_FLIGHT.inc()
+
+    def _release(self, keys: list[str], /, *, duration: float):
+        with self._cond:
+            self._in_flight -= 1
+            self._in_flight_per_key.subtract(keys)
+            self._in_flight_per_key += collections.Counter()  # NOTE: drops non-positive counts
+            self._durations.append(duration)
+            METRIC_IN_FLIGHT.dec()
+            self._cond.notify_all()
+
+    def _reject(self, message: str, /):
+        # DEV-NOTE: called whilst holding the (re-entrant) lock
+        err = ExceptionWithData(message)
+        err.code = 429
+        err.add_data("retry-after", self.estimate_retry_after())
+        raise err
+
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+def get_admission_key(location: str, path: str, /, *, depth: int) -> str:
+    """
+    Returns the key used for admission of a scan,
+    consisting of the location and the first `depth` parts of the (normalised) path.
+    """
+    path = posixpath.normpath(path.replace("\\", "/"))
+    parts = [part for part in path.split("/") if part not in ["", "."]][:depth]
+    prefix = "/".join(parts)
+    if path.startswith("/"):
+        prefix = f"/{prefix}"
+    return f"{location}:{prefix}"
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from enum import StrEnum
+from threading import Lock
+from typing import Any
+from typing import Callable
+from uuid import uuid4
+
+from safetywrap import Err
+from safetywrap import Ok
+
+from ..._core.utils.serialise import *
+from ..._core.utils.time import *
+from ..internal.errors import *
+from .progress import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "EnumJobStatus",
+    "Job",
+    "JobManager",
+]
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class EnumJobStatus(StrEnum):
+    PENDING = "PENDING"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+class Job:
+    """
+    Handle for a job submitted to the `JobManager`
+    """
+
+    id: str
+    label: str
+    status: EnumJobStatus
+    progress: JobProgress
+    result: Any
+    timestamp: str
+    future: Future | None
+
+    def __init__(self, /, *, label: str):
+        self.id = uuid4().hex
+        self.label = label
+        self.status = EnumJobStatus.PENDING
+        self.progress = JobProgress()
+        self.result = None
+        self.timestamp = get_datetime_stamp()
+        self.future = None
+        return
+
+    @property
+    def done(self) -> bool:
+        return self.status in [
+            EnumJobStatus.SUCCEEDED,
+            EnumJobStatus.FAILED,
+            EnumJobStatus.CANCELLED,
+        ]
+
+    def summary(self) -> dict[str, JSON_TYPE]:
+        return {
+            "id": self.id,
+            "label": self.label,
+            "status": self.status.value,
+            "timestamp": self.timestamp,
+            "progress": self.progress.summary(),
+            "result": self.result,
+        }
+
+
+class JobManager:
+    """
+    Runs jobs in the background on a bounded pool of workers.
+
+    ```py
+    manager = JobManager(max_workers=4, max_pending=100)
+    job = manager.submit(lambda progress: ..., label="SEARCH-FS")
+    print(manager.get(job.id).summary())
+    manager.cancel(job.id)
+    ```
+
+    The submitted action receives a `JobProgress` instance,
+    which it is expected to update and to check regularly for cancellation.
+
+    NOTE: the context (e.g. properties set in the current request) is copied to the worker.
+    """
+
+    _executor: ThreadPoolExecutor
+    _jobs: OrderedDict[str, Job]
+    _lock: Lock
+    _max_pending: int
+    _max_retained: int
+
+    def __init__(
+        self,
+        /,
+        *,
+        max_workers: int,
+        max_pending: int,
+        max_retained: int = 1000,
+    ):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="job")  # fmt: skip
+        self._jobs = OrderedDict[str, Job]()
+        self._lock = Lock()
+        self._max_pending = max_pending
+        self._max_retained = max_retained
+        return
+
+    def submit(
+        self,
+        action: Callable[[JobProgress], Any],
+        /,
+        *,
+        label: str,
+    ) -> Job:
+        """
+        Submits an action to be run in the background and returns immediately.
+        """
+        with self._lock:
+            n_pending = sum(1 for job in self._jobs.values() if not job.done)
+            if n_pending >= self._max_pending:
+                err = ExceptionWithData(f"too many unfinished jobs ({n_pending}) - try again later")  # fmt: skip
+                err.code = 503
+                raise err
+
+            job = Job(label=label)
+            self._jobs[job.id] = job
+            self._evict()
+
+        ctx = copy_context()
+        job.future = self._executor.submit(ctx.run, self._run, job, action)
+        return job
+
+    def get(self, id: str, /) -> Job:
+        """
+        Gets job by id
+        """
+        job = self._jobs.get(id)
+        if job is None:
+            err = ExceptionWithData(f"no job with id '{id}'")
+            err.code = 404
+            raise err
+        return job
+
+    def list(self) -> list[Job]:
+        """
+        Lists all retained jobs (latest last)
+        """
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, id: str, /) -> Job:
+        """
+        Requests cancellation of a job.
+
+        NOTE: pending jobs are cancelled immediately,
+        running jobs terminate at their next checkpoint.
+        """
+        job = self.get(id)
+        job.progress.cancel()
+        if job.future is not None and job.future.cancel():
+            job.status = EnumJobStatus.CANCELLED
+        return job
+
+    def shutdown(self):
+        """
+        Cancels all unfinished jobs and waits for workers to terminate.
+        """
+        for job in self.list():
+            if not job.done:
+                self.cancel(job.id)
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    # ----------------------------------------------------------------
+    # PRIVATE METHODS
+    # ----------------------------------------------------------------
+
+    def _evict(self):
+        """
+        Removes oldest finished jobs beyond retention limit
+        """
+        n = len(self._jobs) - self._max_retained
+        if n <= 0:
+            return
+        ids = [id for id, job in self._jobs.items() if job.done][:n]
+        for id in ids:
+            self._jobs.pop(id, None)
+
+    @staticmethod
+    def _run(job: Job, action: Callable[[JobProgress], Any], /):
+        progress = job.progress
+        job.status = EnumJobStatus.RUNNING
+        progress.start()
+
+        try:
+            output = action(progress)
+            match output:
+                case Err() as err:
+                    job.status = EnumJobStatus.FAILED
+                    job.result = serialise_any_as_object(err.unwrap_err()).unwrap_or(None)
+
+                case Ok() as value:
+                    job.status = EnumJobStatus.SUCCEEDED
+                    job.result = serialise_any_as_object(value.unwrap()).unwrap_or(None)
+
+                case _:
+                    job.status = EnumJobStatus.SUCCEEDED
+                    job.result = serialise_any_as_object(output).unwrap_or(None)
+
+        except JobCancelledError as _:
+            logging.info(f"job {job.id} cancelled")
+            job.status = EnumJobStatus.CANCELLED
+
+        except BaseException as err:
+            logging.error(f"job {job.id} failed - {err}")
+            job.status = EnumJobStatus.FAILED
+            job.result = str(err)
+
+        finally:
+            progress.finish()
+
+        return
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import time
+from threading import Event
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "JobCancelledError",
+    "JobProgress",
+]
+
+# ----------------------------------------------------------------
+# CLASSES
+# ----------------------------------------------------------------
+
+
+class JobCancelledError(BaseException):
+    """
+    Raised inside a running job once it has been cancelled.
+
+    DEV-NOTE: extends BaseException (like `KeyboardInterrupt`),
+    so that the per-task error handling of features does not swallow it
+    and the entire job terminates.
+    """
+
+
+class JobProgress:
+    """
+    Live progress of a (long running) job.
+
+    The running job updates the counters,
+    other threads read them and may request cancellation,
+    which the job honours cooperatively at its next checkpoint.
+    """
+
+    files_found: int
+    directories_scanned: int
+    directories_pending: int
+    tasks_total: int | None
+    tasks_done: int
+    _t_start: float | None
+    _t_end: float | None
+    _cancel: Event
+
+    def __init__(self):
+        self.files_found = 0
+        self.directories_scanned = 0
+        self.directories_pending = 0
+        self.tasks_total = None
+        self.tasks_done = 0
+        self._t_start = None
+        self._t_end = None
+        self._cancel = Event()
+        return
+
+    @property
+    def elapsed(self) -> float:
+        """
+        Duration (in seconds) since start of job
+        """
+        if self._t_start is None:
+            return 0.0
+        t_end = self._t_end if self._t_end is not None else time.monotonic()
+        return t_end - self._t_start
+
+    @property
+    def cancelled(self) -> bool:
+        """
+        Whether or not cancellation has been requested
+        """
+        return self._cancel.is_set()
+
+    def start(self):
+        self._t_start = time.monotonic()
+
+    def finish(self):
+        self._t_end = time.monotonic()
+
+    def cancel(self):
+        """
+        Requests cancellation of the job
+        """
+        self._cancel.set()
+
+    def check(self):
+        """
+        Checkpoint - raises if cancellation has been requested
+        """
+        if self._cancel.is_set():
+            raise JobCancelledError("job cancelled")
+
+    def add_file(self):
+        self.files_found += 1
+        self.check()
+
+    def update_folders(self, pending: int, /):
+        self.directories_scanned += 1
+        self.directories_pending = pending
+        self.check()
+
+    def add_task(self):
+        self.tasks_done += 1
+        self.directories_pending = 0
+        self.check()
+
+    def summary(self) -> dict:
+        return {
+            "files-found": self.files_found,
+            "directories-scanned": self.directories_scanned,
+            "directories-pending": self.directories_pending,
+            "tasks-done": self.tasks_done,
+            "tasks-total": self.tasks_total,
+            "elapsed": round(self.elapsed, 3),
+        }
@@ -7,6 +7,7 @@
 
 from argparse import ArgumentParser
 
+from ..._core.utils.misc import *
 from .basic import *
 
 # ----------------------------------------------------------------
@@ -48,6 +49,18 @@ class CliArguments(CliArgumentsBase):
             type=str,
             help="path to files for logging",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help=dedent_full(
+                """
+                number of worker processes for the server (default: 1).
+                NOTE: each worker holds its own background jobs,
+                so that job ids are only known to the worker which created them.
+                """
+            ),
+            default=1,
+        )
         parser.add_argument(
             "--verbose",
             action="store_true",
@@ -10,7 +10,7 @@ from argparse import ArgumentParser
 from argparse import RawTextHelpFormatter
 
 from ..._core.utils.misc import *
-from ...models.application import *
+from ...models.generated.application import RepoInfo
 
 # ----------------------------------------------------------------
 # EXPORTS
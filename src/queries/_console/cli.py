@@ -8,7 +8,7 @@
 from argparse import ArgumentParser
 
 from ..._core.utils.misc import *
-from ...models.application import *
+from ...models.generated.application import EnumFeatures
 from .basic import *
 
 # ----------------------------------------------------------------
@@ -38,6 +38,8 @@ class CliArguments(CliArgumentsBase):
                 f"""
                 {EnumFeatures.VERSION.value} = show version of programme
                 {EnumFeatures.SEARCH_FS.value} = runs feature that searches a filesystem
+                {EnumFeatures.DUPLICATES.value} = runs feature that finds duplicate files in a filesystem
+                {EnumFeatures.DISK_USAGE.value} = runs feature that summarises the usage of disk space per directory
                 """
             ),
         )
@@ -62,6 +64,11 @@ class CliArguments(CliArgumentsBase):
             help="path to environment file",
             default=".env",
         )
+        parser.add_argument(
+            "--estimate",
+            action="store_true",
+            help=f"for {EnumFeatures.SEARCH_FS.value} only estimate the size and duration of the search (by sampling)",  # fmt: skip
+        )
         parser.add_argument(
             "--verbose",
             action="store_true",
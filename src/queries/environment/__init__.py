@@ -10,6 +10,8 @@ from .http import *
 from .mode import *
 from .network import *
 from .rabbit import *
+from .server import *
+from .storage import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -17,6 +19,13 @@ from .rabbit import *
 
 __all__ = [
     "add_environment",
+    "clear_environment_cache",
+    "get_admission_max_scans",
+    "get_admission_max_scans_per_prefix",
+    "get_admission_max_waiting",
+    "get_admission_prefix_depth",
+    "get_admission_timeout",
+    "get_blob_storage_connection_string",
     "get_environment",
     "get_http_host_name_rabbit",
     "get_http_ip",
@@ -29,6 +38,10 @@ __all__ = [
     "get_http_user",
     "get_http_user_rabbit_admin",
     "get_http_user_rabbit_guest",
+    "get_jobs_max_pending",
+    "get_jobs_max_workers",
+    "get_os_stat_ttl",
+    "get_path_hash_cache",
     "get_path_logs",
     "get_shared_network",
 ]
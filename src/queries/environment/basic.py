@@ -6,14 +6,15 @@
 # ----------------------------------------------------------------
 
 import os
+import time
 from functools import wraps
+from threading import Lock
 from typing import Callable
 from typing import Concatenate
 from typing import ParamSpec
 from typing import TypeVar
 
 from dotenv import dotenv_values
-from dotenv import load_dotenv
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -21,6 +22,7 @@ from dotenv import load_dotenv
 
 __all__ = [
     "add_environment",
+    "clear_environment_cache",
     "get_environment",
 ]
 
@@ -31,6 +33,18 @@ __all__ = [
 PARAMS = ParamSpec("PARAMS")
 RETURN = TypeVar("RETURN")
 
+# NOTE: minimal interval (in seconds) between checks of whether .env-files have changed
+STAT_INTERVAL = 1.0
+
+# snapshots: path -> (file signature, time of last check, environment)
+_snapshots: dict[str, tuple[tuple[int, int] | None, float, dict[str, str]]] = {}
+_lock = Lock()
+
+# values written to the session from .env-files: path -> {key: value}
+# NOTE: needed to tell these apart from genuine session values when a file changes
+_injected: dict[str, dict[str, str]] = {}
+_lock_injected = Lock()
+
 # ----------------------------------------------------------------
 # METHODS
 # ----------------------------------------------------------------
@@ -48,12 +62,48 @@ def get_environment(path: str, /) -> dict[str, str]:
     If a key is in both the session and file,
     then the session-value takes precedence,
     allowing users to change environments on-the-fly.
+
+    NOTE: The result is a process-wide snapshot per file,
+    which is only reloaded if the file changes (or the cache is cleared).
+    The snapshot is shared and should not be modified.
+    """
+    key = os.path.abspath(path)
+    t = time.monotonic()
+
+    # NOTE: fast path - checked recently
+    snapshot = _snapshots.get(key)
+    if snapshot is not None and t - snapshot[1] < STAT_INTERVAL:
+        return snapshot[2]
+
+    with _lock:
+        sig = get_file_signature(key)
+        snapshot = _snapshots.get(key)
+        if snapshot is not None and snapshot[0] == sig:
+            env = snapshot[2]
+        else:
+            env = load_environment(path)
+        _snapshots[key] = (sig, t, env)
+
+    return env
+
+
+def clear_environment_cache():
+    """
+    Clears all snapshots of environments, forcing these to be reloaded.
+    """
+    with _lock:
+        _snapshots.clear()
+
+
+def load_environment(path: str, /) -> dict[str, str]:
+    """
+    Loads environment variables (uncached) - see `get_environment`.
     """
     # values in file
     environ_file = dotenv_values(path)
 
-    # load from session
-    load_dotenv(dotenv_path=path)
+    # load from session (and update the values previously injected from the file)
+    inject_environment(path, environ_file)
     env_from_session = {
         key: value
         for key, value in os.environ.items()
@@ -76,6 +126,47 @@ def get_environment(path: str, /) -> dict[str, str]:
     return dict(env)
 
 
+def inject_environment(path: str, environ_file: dict[str, str | None], /):
+    """
+    Writes the values of a .env-file into the session (`os.environ`) without overriding session values.
+
+    Keys which were injected from the same file before are overridden (or removed),
+    so that changes of values in the file take effect upon reload.
+    """
+    key_path = os.path.abspath(path)
+    with _lock_injected:
+        injected_prev = _injected.get(key_path, {})
+        injected = dict[str, str]()
+
+        # remove keys which are no longer in the file (unless modified in the session meanwhile)
+        for key, value in injected_prev.items():
+            if key not in environ_file and os.environ.get(key) == value:
+                del os.environ[key]
+
+        for key, value in environ_file.items():
+            if value is None:
+                continue
+            # NOTE: genuine session values take precedence
+            if key in os.environ and os.environ[key] != injected_prev.get(key):
+                continue
+            os.environ[key] = value
+            injected[key] = value
+
+        _injected[key_path] = injected
+
+
+def get_file_signature(path: str, /) -> tuple[int, int] | None:
+    """
+    Returns modification time and size of a file or else `None` if it does not exist.
+    """
+    try:
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    except OSError as _:
+        return None
+
+
 def add_environment(
     action: Callable[
         Concatenate[str, dict[str, str], PARAMS],
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from .basic import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "get_admission_max_scans",
+    "get_admission_max_scans_per_prefix",
+    "get_admission_max_waiting",
+    "get_admission_prefix_depth",
+    "get_admission_timeout",
+    "get_jobs_max_pending",
+    "get_jobs_max_workers",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+@add_environment
+def get_jobs_max_workers(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 4,
+) -> int:
+    """
+    Gets the number of workers available to run background jobs.
+    """
+    value = env.get("JOBS_MAX_WORKERS") or default
+    return int(value)
+
+
+@add_environment
+def get_jobs_max_pending(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 100,
+) -> int:
+    """
+    Gets the maximum number of unfinished (queued or running) background jobs.
+    """
+    value = env.get("JOBS_MAX_PENDING") or default
+    return int(value)
+
+
+@add_environment
+def get_admission_max_scans(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 4,
+) -> int:
+    """
+    Gets the maximum number of scans running concurrently (per worker).
+    """
+    value = env.get("ADMISSION_MAX_SCANS") or default
+    return int(value)
+
+
+@add_environment
+def get_admission_max_scans_per_prefix(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 1,
+) -> int:
+    """
+    Gets the maximum number of scans running concurrently on the same path prefix.
+    """
+    value = env.get("ADMISSION_MAX_SCANS_PER_PREFIX") or default
+    return int(value)
+
+
+@add_environment
+def get_admission_prefix_depth(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 2,
+) -> int:
+    """
+    Gets the number of leading path parts which constitute the prefix of a scan.
+    """
+    value = env.get("ADMISSION_PREFIX_DEPTH") or default
+    return int(value)
+
+
+@add_environment
+def get_admission_max_waiting(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: int = 16,
+) -> int:
+    """
+    Gets the maximum number of requests waiting to be admitted for a scan.
+    """
+    value = env.get("ADMISSION_MAX_WAITING") or default
+    return int(value)
+
+
+@add_environment
+def get_admission_timeout(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, str],
+    # end decorator args
+    default: float = 30.0,
+) -> float:
+    """
+    Gets the maximum time (in seconds) a request waits to be admitted for a scan.
+    """
+    value = env.get("ADMISSION_TIMEOUT") or default
+    return float(value)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from typing import Any
+
+from pydantic import SecretStr
+
+from .basic import *
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "get_blob_storage_connection_string",
+    "get_os_stat_ttl",
+    "get_path_hash_cache",
+]
+
+# ----------------------------------------------------------------
+# METHODS
+# ----------------------------------------------------------------
+
+
+@add_environment
+def get_blob_storage_connection_string(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, Any],
+    # end decorator args
+) -> SecretStr | None:
+    """
+    Gets connection string to blob storage (e.g. to a local Azurite emulator).
+    If value not set in .env, the blob storage is not available.
+    """
+    value = env.get("BLOB_STORAGE_CONNECTION_STRING") or None
+    return None if value is None else SecretStr(value)
+
+
+@add_environment
+def get_path_hash_cache(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, Any],
+    # end decorator args
+) -> str | None:
+    """
+    Gets path to the (sqlite) cache of digests of files.
+    If value not set in .env, digests are only cached in memory.
+    """
+    value = env.get("PATH_HASH_CACHE") or None
+    return value
+
+
+@add_environment
+def get_os_stat_ttl(
+    # DEV-NOTE: from decorator
+    path: str,
+    env: dict[str, Any],
+    # end decorator args
+) -> float | None:
+    """
+    Gets the time (in seconds) for which stat results of files on the local system are shared.
+    If value not set in .env, stat results are only cached per file object.
+    """
+    value = env.get("OS_STAT_TTL") or None
+    return None if value is None else float(value)
@@ -28,19 +28,32 @@ def get_files_manager(
     /,
     *,
     tz: timezone | None = None,
+    connection_string: str | None = None,
+    stat_ttl: float | None = None,
 ) -> FilesManager:
     """
     Obtains files manager from user choice of system location.
+
+    NOTE: blob storage requires a connection string.
+    NOTE: `stat_ttl` only applies to the local operating system.
     """
     match location:
         case EnumFilesSystem.OS:
-            return OSFilesManager(tz=tz)
+            return OSFilesManager(tz=tz, stat_ttl=stat_ttl)
+
+        case EnumFilesSystem.MEMORY:
+            return MemoryFilesManager(tz=tz)
+
+        case EnumFilesSystem.ARCHIVE:
+            return ArchiveFilesManager(tz=tz)
 
         case EnumFilesSystem.SHAREPOINT:
             raise NotImplementedError("FilesManager protocol not yet implemented for Sharepoint")  # fmt: skip
 
         case EnumFilesSystem.BLOB_STORAGE:
-            raise NotImplementedError("FilesManager protocol not yet implemented for Blobstorage")  # fmt: skip
+            if connection_string is None:
+                raise ValueError("FilesManager for Blobstorage requires a connection string")  # fmt: skip
+            return BlobFilesManager(connection_string, tz=tz)
 
         case _:
             raise ValueError(f"No method determined for files system manager {extract_string(location)}.")  # fmt: skip
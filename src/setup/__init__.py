@@ -10,9 +10,10 @@ e.g. configuration of application.
 # IMPORTS
 # ----------------------------------------------------------------
 
-# NOTE: only import/export the submodules which are called as such
-from . import config
-from .config import *
+from importlib import import_module
+from typing import Any
+
+from .info import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -23,4 +24,25 @@ __all__ = [
     "TIMEZONE",
     "VERSION",
     "config",
+    "get_version",
+    "load_repo_info",
 ]
+
+# ----------------------------------------------------------------
+# LAZY LOADED SUBMODULES
+# ----------------------------------------------------------------
+
+# NOTE: only import/export the submodules which are called as such
+# DEV-NOTE: the config (and hence the entire application) is only loaded upon first access,
+# so that light entry points (e.g. `cli.py version`) start quickly.
+
+
+def __getattr__(name: str) -> Any:
+    match name:
+        case "config":
+            return import_module(f"{__name__}.config")
+
+        case "INFO" | "TIMEZONE" | "VERSION":
+            return getattr(import_module(f"{__name__}.config"), name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,10 +6,10 @@
 # ----------------------------------------------------------------
 
 import logging
-from contextvars import ContextVar
-from pathlib import Path
+import os
+from datetime import timezone
+from typing import Any
 
-import toml
 from pika import ConnectionParameters
 from pika import PlainCredentials
 from pydantic import SecretStr
@@ -19,11 +19,14 @@ from .._core.constants import *
 from .._core.logging import *
 from .._core.utils.code import *
 from .._core.utils.time import *
+from ..algorithms.filesmanager import HashCache
 from ..models.application import *
 from ..models.filesmanager import *
 from ..models.internal import *
+from ..models.jobs import *
 from ..queries.environment import *
 from ..queries.filesmanager import *
+from .info import *
 
 # ----------------------------------------------------------------
 # EXPORTS
@@ -39,8 +42,8 @@ __all__ = [
 # GLOBAL PROPERTIES
 # ----------------------------------------------------------------
 
-pid = ContextVar[int]("pid")  # fmt: skip
-path_env = ContextVar[str]("path env", default=".env")  # fmt: skip
+pid = Property[int](label="pid", factory=os.getpid)  # fmt: skip
+path_env = Property[str](label="path env", default=".env")  # fmt: skip
 path_logging = Property[str | None](label="path logging", factory=lambda: get_path_logs(path_env.get()))  # fmt: skip
 path_config = Property[str](label="path application config", factory=lambda: get_root_path("setup", "config.yaml"))  # fmt: skip
 path_requests = Property[str](label="path user requests", factory=lambda: get_root_path("setup", "requests.yaml"))  # fmt: skip
@@ -50,7 +53,18 @@ http_ip = Property[str](label="http ip", factory=lambda: get_http_ip(path_env.ge
 http_port = Property[int](label="http port", factory=lambda: get_http_port(path_env.get()))  # fmt: skip
 http_user = Property[str](label="http user", factory=lambda: get_http_user(path_env.get()))  # fmt: skip
 http_password = Property[SecretStr](label="http password", factory=lambda: get_http_password(path_env.get()))  # fmt: skip
+api_workers = Property[int](label="number of worker processes of api", default=1)  # fmt: skip
 shared_network = Property[bool](label="is in docker network", factory=lambda: get_shared_network(path_env.get()))  # fmt: skip
+jobs_max_workers = Property[int](label="max workers for jobs", factory=lambda: get_jobs_max_workers(path_env.get()))  # fmt: skip
+jobs_max_pending = Property[int](label="max unfinished jobs", factory=lambda: get_jobs_max_pending(path_env.get()))  # fmt: skip
+admission_max_scans = Property[int](label="max concurrent scans", factory=lambda: get_admission_max_scans(path_env.get()))  # fmt: skip
+admission_max_scans_per_prefix = Property[int](label="max concurrent scans per prefix", factory=lambda: get_admission_max_scans_per_prefix(path_env.get()))  # fmt: skip
+admission_prefix_depth = Property[int](label="depth of prefix of scans", factory=lambda: get_admission_prefix_depth(path_env.get()))  # fmt: skip
+admission_max_waiting = Property[int](label="max scans waiting for admission", factory=lambda: get_admission_max_waiting(path_env.get()))  # fmt: skip
+admission_timeout = Property[float](label="timeout for admission of scans", factory=lambda: get_admission_timeout(path_env.get()))  # fmt: skip
+os_stat_ttl = Property[float | None](label="ttl of shared stat results", factory=lambda: get_os_stat_ttl(path_env.get()))  # fmt: skip
+path_hash_cache = Property[str | None](label="path cache of digests", factory=lambda: get_path_hash_cache(path_env.get()))  # fmt: skip
+blob_storage_connection_string = Property[SecretStr | None](label="connection string for blob storage", factory=lambda: get_blob_storage_connection_string(path_env.get()))  # fmt: skip
 
 # for rabbit/queue
 http_host_name_rabbit = Property[str](label="host name of rabbit mq", factory=lambda: get_http_host_name_rabbit(path_env.get()))  # fmt: skip
@@ -85,25 +99,29 @@ def initialise_application(
     return
 
 
+def reload_settings():
+    """
+    Forces settings to be reloaded (e.g. after the .env file has been modified).
+
+    NOTE: values which were explicitly set (e.g. from cli arguments) are retained.
+    """
+    SETTINGS.reload()
+    return
+
+
 # ----------------------------------------------------------------
 # QUERIES
 # ----------------------------------------------------------------
 
 
 @compute_once
-def load_repo_info() -> RepoInfo:
-    path = Path(get_root_path(), "pyproject.toml").as_posix()
-    with open(path, "r") as fp:
-        config_repo = toml.load(fp)
-        assets = config_repo.get("project", {})
-        info = RepoInfo.model_validate(assets)
-        return info
-
+def get_timezone() -> timezone:
+    """
+    Returns the timezone of the system.
 
-@compute_once
-def get_version() -> str:
-    info = load_repo_info()
-    return info.version
+    NOTE: determined upon first use only, as this requires the tz database to be loaded.
+    """
+    return get_local_timezone()
 
 
 @compute_once
@@ -111,13 +129,31 @@ def get_managers() -> dict[EnumFilesSystem, FilesManager]:
     """
     Returns managers to access files in different locations.
     """
-    return {
-        EnumFilesSystem.OS: get_files_manager(EnumFilesSystem.OS, tz=TIMEZONE),
+    tz = get_timezone()
+    stat_ttl = os_stat_ttl()
+    managers = {
+        EnumFilesSystem.OS: get_files_manager(EnumFilesSystem.OS, tz=tz, stat_ttl=stat_ttl),
+        EnumFilesSystem.MEMORY: get_files_manager(EnumFilesSystem.MEMORY, tz=tz),
+        EnumFilesSystem.ARCHIVE: get_files_manager(EnumFilesSystem.ARCHIVE, tz=tz),
         # TODO: implement use of credentials and add protocols for other file systems
-        # EnumFilesSystem.SHAREPOINT: get_files_manager(EnumFilesSystem.SHAREPOINT, tz=TIMEZONE),
-        # EnumFilesSystem.BLOB_STORAGE: get_files_manager(EnumFilesSystem.BLOB_STORAGE, tz=TIMEZONE),
+        # EnumFilesSystem.SHAREPOINT: get_files_manager(EnumFilesSystem.SHAREPOINT, tz=get_timezone()),
     }
 
+    # NOTE: blob storage is only available if a connection string has been configured
+    connection_string = blob_storage_connection_string()
+    if connection_string is not None:
+        managers[EnumFilesSystem.BLOB_STORAGE] = get_files_manager(EnumFilesSystem.BLOB_STORAGE, tz=get_timezone(), connection_string=connection_string.get_secret_value())  # fmt: skip
+
+    return managers
+
+
+@compute_once
+def get_hash_cache() -> HashCache:
+    """
+    Returns the cache of digests of files (persisted, if a path has been configured).
+    """
+    return HashCache(path_hash_cache() or ":memory:")
+
 
 @compute_once
 def get_queue_parameters() -> ConnectionParameters:
@@ -140,20 +176,69 @@ def get_queue_parameters() -> ConnectionParameters:
     return settings
 
 
+def check_jobs_available():
+    """
+    Raises (with code `503`) if background jobs are unavailable.
+
+    NOTE: jobs (and their progress) are held in memory by the worker process which created them.
+    With several worker processes, requests to poll/cancel a job would mostly reach another worker,
+    hence jobs are refused instead.
+    """
+    if api_workers() > 1:
+        err = ExceptionWithData("background jobs are unavailable whilst the server runs with several worker processes")  # fmt: skip
+        err.code = 503
+        raise err
+
+
+@compute_once
+def get_job_manager() -> JobManager:
+    """
+    Returns manager to run features as background jobs.
+    """
+    return JobManager(max_workers=jobs_max_workers(), max_pending=jobs_max_pending())
+
+
+@compute_once
+def get_admission_controller() -> AdmissionController:
+    """
+    Returns controller limiting the number of concurrent scans.
+    """
+    return AdmissionController(
+        max_global=admission_max_scans(),
+        max_per_key=admission_max_scans_per_prefix(),
+        max_waiting=admission_max_waiting(),
+        timeout=admission_timeout(),
+    )
+
+
+# ----------------------------------------------------------------
+# RELOAD HOOKS
+# ----------------------------------------------------------------
+
+SETTINGS.add_reload_hook(clear_environment_cache)
+SETTINGS.add_reload_hook(get_queue_parameters.reset)
+SETTINGS.add_reload_hook(CONFIG_CACHE.clear)
+
 # ----------------------------------------------------------------
 # LAZY LOADED RESOURCES / PROPERTIES
 # ----------------------------------------------------------------
 
 INFO = load_repo_info()
 VERSION = get_version()
-TIMEZONE = get_local_timezone()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "TIMEZONE":
+        return get_timezone()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 parser_requests = Property[PayloadParser[RequestsPayload]](
     label="parser:requests payload",
-    factory=lambda: PayloadParser(type_=RequestsPayload, managers=get_managers(), location="OS", root=path_requests.get()),
+    factory=lambda: PayloadParser(type_=RequestsPayload, managers=get_managers(), location="OS", root=path_requests.get(), cache=CONFIG_CACHE),
 )  # fmt: skip
 
 parser_config = Property[PayloadParser[GeneralConfig]](
     label="parser:general application config",
-    factory=lambda: PayloadParser(type_=GeneralConfig, managers=get_managers(), location="OS", root=path_config.get()),
+    factory=lambda: PayloadParser(type_=GeneralConfig, managers=get_managers(), location="OS", root=path_config.get(), cache=CONFIG_CACHE),
 )  # fmt: skip
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Lightweight queries for information about the repository.
+
+DEV-NOTE: this module is imported by the entry points before anything else,
+so should only depend on the standard library and the generated models.
+"""
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import tomllib
+from functools import cache
+from pathlib import Path
+
+from ..__paths__ import *
+from ..models.generated.application import RepoInfo
+
+# ----------------------------------------------------------------
+# EXPORTS
+# ----------------------------------------------------------------
+
+__all__ = [
+    "get_version",
+    "load_repo_info",
+]
+
+# ----------------------------------------------------------------
+# QUERIES
+# ----------------------------------------------------------------
+
+
+@cache
+def load_repo_info() -> RepoInfo:
+    path = Path(get_root_path(), "pyproject.toml").as_posix()
+    with open(path, "rb") as fp:
+        config_repo = tomllib.load(fp)
+        assets = config_repo.get("project", {})
+        info = RepoInfo.model_validate(assets)
+        return info
+
+
+@cache
+def get_version() -> str:
+    info = load_repo_info()
+    return info.version
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from unittest import TestCase
+
+from src._core.metrics import MetricsRegistry
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_registry_render(
+    *,
+    test: TestCase,
+):
+    registry = MetricsRegistry()
+    files = registry.counter("files_total", "files found")
+    trips = registry.counter("guard_trips_total", "guard trips", labels=["reason"])
+    latency = registry.histogram("listing_seconds", "listing latency", buckets=(0.1, 1.0))
+
+    # NOTE: registration is idempotent
+    test.assertIs(registry.counter("files_total", "files found"), files)
+
+    files.inc(3)
+    trips.labels(reason="depth").inc()
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(5.0)
+
+    lines = registry.render().splitlines()
+    test.assertIn("# TYPE files_total counter", lines)
+    test.assertIn("files_total 3", lines)
+    test.assertIn('guard_trips_total{reason="depth"} 1', lines)
+    test.assertIn('listing_seconds_bucket{le="0.1"} 1', lines)
+    test.assertIn('listing_seconds_bucket{le="1"} 2', lines)
+    test.assertIn('listing_seconds_bucket{le="+Inf"} 3', lines)
+    test.assertIn("listing_seconds_count 3", lines)
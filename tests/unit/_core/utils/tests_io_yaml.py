@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src._core.utils.io import read_yaml
+from src._core.utils.io import read_yaml_from_contents
+from src._core.utils.io_yaml import YamlIncludeCycleError
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_custom_tags(
+    *,
+    test: TestCase,
+):
+    assets = read_yaml_from_contents(
+        b"a: !not true\nb: !join ['-', [x, y]]\nc: !tuple [1, 2]\n"
+    )
+    test.assertEqual(assets, {"a": False, "b": "x-y", "c": (1, 2)})
+
+
+def test_include_parsed_once_per_load(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        path_part = os.path.join(root, "part.yaml")
+        path = os.path.join(root, "main.yaml")
+        with open(path_part, "w") as fp:
+            fp.write("options:\n  max-depth: 3\n")
+        with open(path, "w") as fp:
+            fp.write(f'- !include "{path_part}"\n- !include "{path_part}/#/options"\n')
+
+        assets = read_yaml(path)
+
+    test.assertEqual(assets, [{"options": {"max-depth": 3}}, {"max-depth": 3}])
+    # NOTE: included file is shared
+    test.assertIs(assets[0]["options"], assets[1])
+
+
+def test_include_cycle_detected(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        path_a = os.path.join(root, "a.yaml")
+        path_b = os.path.join(root, "b.yaml")
+        with open(path_a, "w") as fp:
+            fp.write(f'b: !include "{path_b}"\n')
+        with open(path_b, "w") as fp:
+            fp.write(f'a: !include "{path_a}"\n')
+
+        with test.assertRaisesRegex(YamlIncludeCycleError, "circular reference"):
+            read_yaml(path_a)
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import json
+from datetime import datetime
+from unittest import TestCase
+
+from src._core.utils.serialise import serialise_any_as_object
+from src._core.utils.serialise import serialise_any_as_stream
+from src.models.filesmanager import FileRef
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_stream_consistent_with_object(
+    *,
+    test: TestCase,
+):
+    x = {
+        "timestamp": datetime(2024, 1, 1, 12),
+        "message": "ünïcödé",
+        "data": [1, 2.5, None, True, {"ref": FileRef(location="OS", path="data")}],
+        "contents": b"bytes",
+    }
+    text = b"".join(serialise_any_as_stream(x)).decode()
+    test.assertEqual(json.loads(text), serialise_any_as_object(x).unwrap())
+
+
+def test_stream_iterators_in_chunks(
+    *,
+    test: TestCase,
+):
+    items = ({"index": k} for k in range(1000))
+    chunks = list(serialise_any_as_stream(items, chunk_size=1024))
+    test.assertGreater(len(chunks), 1)
+    test.assertTrue(all(len(chunk) >= 1024 for chunk in chunks[:-1]))
+    test.assertEqual(json.loads(b"".join(chunks)), [{"index": k} for k in range(1000)])
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import hashlib
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.algorithms.filesmanager import find_duplicates
+from src.algorithms.filesmanager import recursive_file_search
+from src.models.application import EnumHashAlgorithm
+from src.models.filesmanager import MemoryFilesManager
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_find_duplicates(
+    *,
+    test: TestCase,
+):
+    n = 20_000
+    contents = bytes(k % 251 for k in range(n))
+    # NOTE: same size and same head/tail, but different middle
+    contents_middle = contents[: n // 2] + b"!" + contents[n // 2 + 1 :]
+    # NOTE: same size, but different tail
+    contents_tail = contents[:-1] + b"!"
+
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        manager.create_file(contents, path=f"{root}/a/1.bin")
+        manager.create_file(contents, path=f"{root}/b/2.bin")
+        manager.create_file(contents_middle, path=f"{root}/b/3.bin")
+        manager.create_file(contents_tail, path=f"{root}/b/4.bin")
+        manager.create_file(b"small", path=f"{root}/a/5.txt")
+        manager.create_file(b"small", path=f"{root}/b/c/6.txt")
+        manager.create_file(b"other", path=f"{root}/b/c/7.txt")
+        manager.create_file(b"", path=f"{root}/a/8.txt")
+        manager.create_file(b"", path=f"{root}/b/9.txt")
+
+        results = recursive_file_search(manager, path=root)
+        groups = list(find_duplicates(manager, results, algorithm=EnumHashAlgorithm.SHA256, max_workers=4))  # fmt: skip
+
+    # NOTE: groups are ordered by size (largest first) and empty files are ignored
+    test.assertEqual([group.size for group in groups], [n, 5])
+    test.assertEqual(groups[0].digest, f"sha256:{hashlib.sha256(contents).hexdigest()}")
+    test.assertEqual(sorted(path.rsplit("/", 1)[-1] for path in groups[0].paths), ["1.bin", "2.bin"])  # fmt: skip
+    test.assertEqual(groups[1].digest, f"sha256:{hashlib.sha256(b'small').hexdigest()}")
+    test.assertEqual(sorted(path.rsplit("/", 1)[-1] for path in groups[1].paths), ["5.txt", "6.txt"])  # fmt: skip
+
+    # works on any file system
+    manager = MemoryFilesManager()
+    manager.create_file(contents, path="x/1.bin")
+    manager.create_file(contents, path="y/2.bin")
+    manager.create_file(contents_middle, path="y/3.bin")
+    results = recursive_file_search(manager, path=".")
+    groups = list(find_duplicates(manager, results, max_workers=1))
+    test.assertEqual(len(groups), 1)
+    test.assertEqual(groups[0].digest, f"blake2b:{hashlib.blake2b(contents).hexdigest()}")
+    test.assertEqual(sorted(groups[0].paths), ["x/1.bin", "y/2.bin"])
+
+
+def test_find_duplicates_vanished_and_guarded(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        manager.create_file(b"same", path=f"{root}/1.txt")
+        manager.create_file(b"same", path=f"{root}/2.txt")
+
+        # NOTE: files (and folders) which vanished since the search are skipped
+        results = [(0, root, "1.txt"), (0, root, "2.txt"), (0, root, "gone.txt"), (1, f"{root}/gone", "3.txt")]  # fmt: skip
+        groups = list(find_duplicates(manager, results, max_workers=2))
+        test.assertEqual([len(group.paths) for group in groups], [2])
+
+        # NOTE: the guard also applies whilst comparing contents
+        calls = []
+
+        def guard():
+            calls.append(None)
+            raise TimeoutError("deadline exceeded")
+
+        with test.assertRaises(TimeoutError):
+            list(find_duplicates(manager, results, max_workers=2, guard=guard))
+        test.assertEqual(len(calls), 1)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.algorithms.filesmanager import estimate_tree_size
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------
+
+
+def create_balanced_tree(root: str, /, *, depth: int, branching: int, files: int):
+    """
+    Creates a tree in which each folder has the same number of subfolders and files
+    """
+    for k in range(files):
+        with open(os.path.join(root, f"file_{k}.txt"), "wb") as fp:
+            fp.write(b"x" * 10)
+
+    if depth == 0:
+        return
+
+    for k in range(branching):
+        path = os.path.join(root, f"folder_{k}")
+        os.mkdir(path)
+        create_balanced_tree(path, depth=depth - 1, branching=branching, files=files)
+
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_estimate_exact_for_balanced_tree(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        # 1 + 3 + 9 folders with 2 files each
+        create_balanced_tree(root, depth=2, branching=3, files=2)
+        result = estimate_tree_size(OSFilesManager(), path=root, max_probes=10, seed=0)
+
+    # NOTE: for balanced trees every probe yields the exact value
+    test.assertEqual(result.probes, 10)
+    test.assertEqual(result.folders.value, 13)
+    test.assertEqual(result.files.value, 26)
+    test.assertEqual(result.bytes.value, 260)
+    test.assertEqual(result.files.lower, result.files.upper)
+
+
+def test_estimate_bounds(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        create_balanced_tree(root, depth=1, branching=2, files=1)
+        # unbalance the tree
+        create_balanced_tree(os.path.join(root, "folder_0"), depth=2, branching=4, files=3)
+        result = estimate_tree_size(OSFilesManager(), path=root, time_budget=0.1, seed=0)
+
+    for interval in [result.folders, result.files, result.bytes, result.duration]:
+        test.assertLessEqual(interval.lower, interval.value)
+        test.assertLessEqual(interval.value, interval.upper)
+
+    # observed values are lower bounds
+    test.assertGreaterEqual(result.folders.lower, result.folders_listed)
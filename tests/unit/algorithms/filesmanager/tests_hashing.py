@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import hashlib
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src._core.utils.parallel import map_ordered
+from src.algorithms.filesmanager import HashCache
+from src.algorithms.filesmanager import hash_file
+from src.algorithms.filesmanager import hash_search_results
+from src.algorithms.filesmanager import recursive_file_search
+from src.models.application import EnumHashAlgorithm
+from src.models.filesmanager import MemoryFilesManager
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_hash_files(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        for k in range(20):
+            manager.create_file(b"x" * k, path=f"{root}/{k % 3}/{k}.txt")
+
+        cache = HashCache(Path(root, "cache", "hashes.sqlite").as_posix())
+        results = list(recursive_file_search(manager, path=f"{root}/0"))
+        hashed = list(hash_search_results(manager, results, algorithm=EnumHashAlgorithm.SHA256, cache=cache, max_workers=4))  # fmt: skip
+        # NOTE: results remain in order
+        test.assertEqual([result[:3] for result in hashed], results)
+        for _, path, filename, digest in hashed:
+            expected = hashlib.sha256(Path(path, filename).read_bytes()).hexdigest()
+            test.assertEqual(digest, f"sha256:{expected}")
+
+        # unchanged files are served from the cache, modified files are re-hashed
+        path = Path(root, "0", "3.txt")
+        digest = hash_file(manager.get_file(path.as_posix()), algorithm=EnumHashAlgorithm.SHA256, cache=cache)  # fmt: skip
+        test.assertEqual(digest, f"sha256:{hashlib.sha256(b'xxx').hexdigest()}")
+        path.write_bytes(b"yyy")
+        os.utime(path, ns=(0, 1))
+        digest = hash_file(manager.get_file(path.as_posix()), algorithm=EnumHashAlgorithm.SHA256, cache=cache)  # fmt: skip
+        test.assertEqual(digest, f"sha256:{hashlib.sha256(b'yyy').hexdigest()}")
+        cache.close()
+
+    # other file systems are streamed
+    manager = MemoryFilesManager()
+    file = manager.create_file(b"hello", path="a/b.txt")
+    digest = hash_file(file, algorithm=EnumHashAlgorithm.BLAKE2B)
+    test.assertEqual(digest, f"blake2b:{hashlib.blake2b(b'hello').hexdigest()}")
+
+
+def test_map_ordered(
+    *,
+    test: TestCase,
+):
+    values = map_ordered(lambda x: x * x, iter(range(100)), max_workers=4, max_pending=3)
+    test.assertEqual(list(values), [x * x for x in range(100)])
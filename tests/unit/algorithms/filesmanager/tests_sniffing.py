@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.algorithms.filesmanager import recursive_file_search
+from src.algorithms.filesmanager import sniff_content_type
+from src.algorithms.filesmanager import sniff_search_results
+from src.models.filesmanager import MemoryFilesManager
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_sniff_content_type(
+    *,
+    test: TestCase,
+):
+    test.assertEqual(sniff_content_type(b""), "application/x-empty")
+    test.assertEqual(sniff_content_type(b"\x89PNG\r\n\x1a\n" + bytes(10), filename="a.txt"), "image/png")  # fmt: skip
+    test.assertEqual(sniff_content_type(b"RIFF\x00\x00\x00\x00WEBPVP8 "), "image/webp")
+    test.assertEqual(sniff_content_type(bytes(257) + b"ustar\x0000"), "application/x-tar")
+    test.assertEqual(sniff_content_type(b"PK\x03\x04" + bytes(10)), "application/zip")
+    test.assertEqual(sniff_content_type(b"PK\x03\x04" + bytes(10), filename="a.XLSX"), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")  # fmt: skip
+    test.assertEqual(sniff_content_type(b"a,b\n1,2\n", filename="data.csv"), "text/csv")
+    test.assertEqual(sniff_content_type(b"hello w\xc3\xb6rld", filename="README"), "text/plain")
+    # NOTE: heads may end mid-character
+    test.assertEqual(sniff_content_type("wörld".encode()[:2]), "text/plain")
+    test.assertEqual(sniff_content_type(b"\x01\x02\x00\xff"), "application/octet-stream")
+
+
+def test_sniff_content_type_weak_signatures(
+    *,
+    test: TestCase,
+):
+    # NOTE: short signatures are only accepted if the remainder of the header is consistent
+    bmp = b"BM" + bytes(12) + (40).to_bytes(4, "little") + bytes(40)
+    pe = b"MZ" + bytes(0x3A) + (0x80).to_bytes(4, "little") + bytes(0x40) + b"PE\x00\x00" + bytes(20)  # fmt: skip
+    id3 = b"ID3\x04\x00\x00\x00\x00\x01\x7f" + bytes(20)
+    test.assertEqual(sniff_content_type(bmp), "image/bmp")
+    test.assertEqual(sniff_content_type(pe), "application/vnd.microsoft.portable-executable")
+    test.assertEqual(sniff_content_type(id3), "audio/mpeg")
+
+    # ... otherwise text beginning with the same letters is recognised as text
+    test.assertEqual(sniff_content_type(b"BMW,Audi\nBMW,VW\n", filename="cars.csv"), "text/csv")
+    test.assertEqual(sniff_content_type(b"MZ is short for Mozambique\n", filename="a.txt"), "text/plain")  # fmt: skip
+    test.assertEqual(sniff_content_type(b"ID3 tags store metadata\n", filename="a.md"), "text/markdown")  # fmt: skip
+
+
+def test_sniff_search_results(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        manager.create_file(b"%PDF-1.7\n" + bytes(10_000), path=f"{root}/a/1.pdf")
+        manager.create_file(b'{"a": 1}', path=f"{root}/a/2.json")
+        manager.create_file(b"\x1f\x8b\x08\x00", path=f"{root}/b/3.bin")
+        results = list(recursive_file_search(manager, path=root))
+        sniffed = list(sniff_search_results(manager, results, n=64, max_workers=4))
+
+    # NOTE: results remain in order
+    test.assertEqual([result[:3] for result in sniffed], results)
+    mimes = {filename: mime for _, _, filename, mime in sniffed}
+    test.assertEqual(mimes, {"1.pdf": "application/pdf", "2.json": "application/json", "3.bin": "application/gzip"})  # fmt: skip
+
+    # works on any file system (and chains with other stages)
+    manager = MemoryFilesManager()
+    manager.create_file(b"GIF89a" + bytes(100), path="x/1.gif")
+    results = ((*result, None) for result in recursive_file_search(manager, path="."))
+    test.assertEqual(list(sniff_search_results(manager, results)), [(1, "x", "1.gif", None, "image/gif")])  # fmt: skip
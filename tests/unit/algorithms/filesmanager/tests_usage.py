@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.algorithms.filesmanager import compute_disk_usage
+from src.models.filesmanager import MemoryFilesManager
+from src.models.filesmanager import OSFilesManager
+from src.models.internal import GenericTree
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_compute_disk_usage(
+    *,
+    test: TestCase,
+):
+    manager = MemoryFilesManager()
+    manager.create_file(b"x" * 10, path="a/1.txt")
+    manager.create_file(b"x" * 20, path="a/b/2.txt")
+    manager.create_file(b"x" * 30, path="a/b/c/3.txt")
+    manager.create_file(b"x" * 40, path="d/4.txt")
+    manager.create_file(b"x" * 1, path="e/5.txt")
+    manager.create_file(b"x" * 2, path="6.txt")
+
+    usage = compute_disk_usage(manager, path=".")
+
+    # totals are rolled up to the root
+    root = usage.get_entry(0)
+    test.assertEqual((root.folders, root.files, root.bytes), (5, 6, 103))
+    totals = {usage.paths[k]: usage.bytes_total[k] for k in range(len(usage))}
+    test.assertEqual(totals, {".": 103, "a": 60, "d": 40, "e": 1, "a/b": 50, "a/b/c": 30})
+
+    # heaviest directories
+    top = usage.top(3)
+    test.assertEqual([entry.path for entry in top], [".", "a", "a/b"])
+
+    # summary is limited in depth and breadth
+    tree = usage.to_tree(max_depth=1, max_children=2)
+    test.assertEqual(tree.root.path, ".")
+    test.assertEqual([child.path for child in tree.children], ["a", "d", "./..."])
+    test.assertEqual(tree.children[-1].bytes, 1)
+    tree = usage.to_tree(max_depth=3)
+    test.assertIsInstance(tree.children[0], GenericTree)
+    test.assertEqual([entry.path for entry in tree.walk(mode="CHILDREN-FIRST")], ["a/b/c", "a/b", "a", "d", "e", "."])  # fmt: skip
+
+
+def test_compute_disk_usage_root_missing(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        manager.create_file(b"x" * 10, path=f"{root}/a/1.txt")
+        manager.create_file(b"x" * 20, path=f"{root}/2.txt")
+
+        # NOTE: files and subfolders are obtained from one listing
+        columns, paths = manager.get_folder(root).get_listing()
+        test.assertEqual(list(columns.names), ["2.txt"])
+        test.assertEqual(paths, [Path(root, "a").as_posix()])
+
+        usage = compute_disk_usage(manager, path=root)
+        test.assertEqual((usage.files_total[0], usage.bytes_total[0]), (2, 30))
+
+        # NOTE: failures are only tolerated for subfolders, not for the root
+        with test.assertRaises(FileNotFoundError):
+            compute_disk_usage(manager, path=f"{root}/missing")
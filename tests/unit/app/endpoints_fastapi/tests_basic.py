@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from threading import Event
+from unittest import TestCase
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from testfixtures import Replace
+
+from src.app.endpoints_fastapi.basic import lifespan
+from src.models.jobs import EnumJobStatus
+from src.models.jobs import JobManager
+from src.models.jobs import JobProgress
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_lifespan_cancels_jobs_on_shutdown(
+    *,
+    test: TestCase,
+):
+    started = Event()
+
+    def action(progress: JobProgress):
+        started.set()
+        while True:
+            progress.add_file()
+
+    manager = JobManager(max_workers=1, max_pending=2)
+    with Replace("src.setup.config.get_job_manager", lambda: manager):
+        with TestClient(FastAPI(lifespan=lifespan)):
+            job_running = manager.submit(action, label="TEST")
+            job_pending = manager.submit(action, label="TEST")
+            started.wait(timeout=5)
+
+    # NOTE: the pending job never starts, the running one terminates at its next checkpoint
+    test.assertEqual(job_pending.status, EnumJobStatus.CANCELLED)
+    test.assertEqual(job_running.status, EnumJobStatus.CANCELLED)
+    test.assertTrue(job_running.future.done())
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from unittest import TestCase
+
+from fastapi.testclient import TestClient
+from pydantic import SecretStr
+
+from src.app.endpoints_fastapi import create_ui
+from src.setup import config
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_jobs_refused_with_several_workers(
+    *,
+    test: TestCase,
+):
+    try:
+        config.http_user.set("user")
+        config.http_password.set(SecretStr("password"))
+        client = TestClient(create_ui())
+
+        config.api_workers.set(1)
+        response = client.get("/jobs", auth=("user", "password"))
+        test.assertEqual(response.status_code, 200)
+
+        # NOTE: jobs are held per worker process, hence refused with several workers
+        config.api_workers.set(4)
+        response = client.get("/jobs", auth=("user", "password"))
+        test.assertEqual(response.status_code, 503)
+        response = client.post("/feature/search-fs/jobs", auth=("user", "password"), content=b"{}")  # fmt: skip
+        test.assertEqual(response.status_code, 503)
+
+    finally:
+        config.http_user.reset()
+        config.http_password.reset()
+        config.api_workers.reset()
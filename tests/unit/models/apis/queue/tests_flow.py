@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import time
+from datetime import datetime
+from datetime import timedelta
+from types import SimpleNamespace
+from unittest import TestCase
+
+from src.models.apis.queue import FlowControl
+from src.models.apis.queue import TokenBucket
+
+# ----------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------
+
+
+class FakeClock:
+    t: float = 0.0
+
+    def __call__(self) -> float:
+        return self.t
+
+
+class StalledChannel:
+    """
+    Channel whose queue is never consumed
+    """
+
+    def __init__(self, depth: int):
+        self.depth = depth
+        self.published = 0
+        self.connection = SimpleNamespace(
+            add_on_connection_blocked_callback=lambda _: None,
+            add_on_connection_unblocked_callback=lambda _: None,
+            sleep=time.sleep,
+        )
+
+    def queue_declare(self, *, queue: str, passive: bool):
+        return SimpleNamespace(method=SimpleNamespace(message_count=self.depth))
+
+    def basic_publish(self, **_):
+        self.published += 1
+
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_token_bucket_unlimited(
+    *,
+    test: TestCase,
+):
+    bucket = TokenBucket(None, burst=1)
+    test.assertTrue(bucket.unlimited)
+    for _ in range(1000):
+        test.assertEqual(bucket.reserve(), 0.0)
+
+
+def test_token_bucket_burst_then_throttle(
+    *,
+    test: TestCase,
+):
+    clock = FakeClock()
+    bucket = TokenBucket(10, burst=5, clock=clock)
+
+    # burst is available immediately
+    for _ in range(5):
+        test.assertEqual(bucket.reserve(), 0.0)
+
+    # thereafter reservations are paced at the rate
+    test.assertAlmostEqual(bucket.reserve(), 0.1)
+    test.assertAlmostEqual(bucket.reserve(), 0.2)
+
+    # tokens refill over time up to the burst size
+    clock.t = 10.0
+    test.assertAlmostEqual(bucket.tokens, 5.0)
+
+
+def test_token_bucket_drain(
+    *,
+    test: TestCase,
+):
+    clock = FakeClock()
+    bucket = TokenBucket(10, burst=5, clock=clock)
+    bucket.drain()
+    test.assertAlmostEqual(bucket.reserve(), 0.1)
+
+
+def test_flow_control_deadline(
+    *,
+    test: TestCase,
+):
+    chan = StalledChannel(depth=1_000)
+    flow = FlowControl(chan)
+    flow.configure(
+        queue="q", high_watermark=100, deadline=datetime.now() + timedelta(seconds=0.2)
+    )
+    t0 = time.monotonic()
+    with test.assertRaises(TimeoutError):
+        flow.publish(exchange="", routing_key="q", body="x")
+    test.assertLess(time.monotonic() - t0, 2.0)
+    test.assertEqual(chan.published, 0)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.models.application import iter_tasks
+from src.models.application import iter_tasks_from_file
+from src.models.filesmanager import EnumDataFileFormat
+from src.models.filesmanager import EnumFilesSystem
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------
+
+
+def create_task(label: str, /, **kwargs) -> dict:
+    return {
+        "label": label,
+        "options": {"max-duration": "00:05:00"},
+        "data": {"inputs": {"location": "OS", "path": "data/example"}},
+        **kwargs,
+    }
+
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_iter_tasks_json_lazily(
+    *,
+    test: TestCase,
+):
+    # NOTE: the array is invalid after the second element
+    contents = json.dumps([create_task("a"), create_task("b", ignore=True), create_task("c")]).encode()  # fmt: skip
+    contents = contents[:-1] + b", {"
+
+    tasks = iter_tasks(contents, fmt=EnumDataFileFormat.FIELD_JSON)
+    test.assertEqual(next(tasks).label, "a")
+    # ignored tasks are skipped
+    test.assertEqual(next(tasks).label, "c")
+    with test.assertRaises(ValueError):
+        next(tasks)
+
+
+def test_iter_tasks_ndjson_and_yaml(
+    *,
+    test: TestCase,
+):
+    contents = "\n".join([json.dumps(create_task("a")), "", json.dumps([create_task("b")])]).encode()  # fmt: skip
+    tasks = list(iter_tasks(contents, fmt=EnumDataFileFormat.FIELD_NDJSON))
+    test.assertEqual([task.label for task in tasks], ["a", "b"])
+
+    contents = "\n---\n".join([json.dumps(create_task("a")), json.dumps([create_task("b")])]).encode()  # fmt: skip
+    tasks = list(iter_tasks(contents, fmt=EnumDataFileFormat.FIELD_YAML))
+    test.assertEqual([task.label for task in tasks], ["a", "b"])
+
+
+def test_iter_tasks_from_file_via_proxy(
+    *,
+    test: TestCase,
+):
+    managers = {EnumFilesSystem.OS: OSFilesManager()}
+    with TemporaryDirectory() as root:
+        path = os.path.join(root, "requests.jsonl")
+        path_proxy = os.path.join(root, "proxy.json")
+        with open(path, "w") as fp:
+            fp.write(json.dumps(create_task("a")) + "\n" + json.dumps(create_task("b")) + "\n")
+        with open(path_proxy, "w") as fp:
+            json.dump({"ref": {"location": "OS", "path": path}}, fp)
+
+        tasks = list(iter_tasks_from_file(managers, loc=EnumFilesSystem.OS, path=path_proxy))
+
+    test.assertEqual([task.label for task in tasks], ["a", "b"])
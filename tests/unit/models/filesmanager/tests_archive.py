@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import tarfile
+import zipfile
+from io import UnsupportedOperation
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.algorithms.filesmanager import recursive_file_search
+from src.models.filesmanager import ArchiveFilesManager
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+MEMBERS = {
+    "top.txt": b"top",
+    "a/x.txt": b"hello",
+    "a/b/y.txt": b"",
+}
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_archive_files_manager(
+    *,
+    test: TestCase,
+):
+    manager = ArchiveFilesManager()
+
+    with TemporaryDirectory() as root:
+        for name, contents in MEMBERS.items():
+            Path(root, "src", name).parent.mkdir(parents=True, exist_ok=True)
+            Path(root, "src", name).write_bytes(contents)
+
+        path_zip = Path(root, "bundle.zip").as_posix()
+        with zipfile.ZipFile(path_zip, "w") as fp:
+            for name, contents in MEMBERS.items():
+                fp.writestr(name, contents)
+
+        path_tar = Path(root, "bundle.tar.gz").as_posix()
+        with tarfile.open(path_tar, "w:gz") as fp:
+            fp.add(Path(root, "src").as_posix(), arcname=".")
+
+        for path in [path_zip, path_tar]:
+            results = sorted(recursive_file_search(manager, path=path))
+            test.assertEqual(
+                results,
+                [
+                    (0, path, "top.txt"),
+                    (1, f"{path}/a", "x.txt"),
+                    (2, f"{path}/a/b", "y.txt"),
+                ],
+            )
+
+            file = manager.get_file(path, "a/x.txt")
+            test.assertTrue(file.exists)
+            test.assertEqual(file.size, 5)
+            test.assertEqual(file.read_as_bytes(), b"hello")
+            with file.open() as fp:
+                test.assertEqual(fp.read(2), b"he")
+
+            test.assertFalse(manager.get_file(path, "a/z.txt").exists)
+            test.assertEqual(manager.get_folder(path, "a").get_subfolder_paths(), [f"{path}/a/b"])  # fmt: skip
+            test.assertEqual(manager.get_folder(path, "a").get_file("x.txt").size, 5)
+
+            with test.assertRaises(UnsupportedOperation):
+                manager.get_folder(path, "a").write_bytes(b"new", name="new.txt")
+
+        test.assertFalse(manager.get_folder(root, "src").exists)
+        manager.close()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import base64
+import re
+from unittest import TestCase
+from xml.sax.saxutils import escape
+
+import httpx
+
+from src.algorithms.filesmanager import recursive_file_search
+from src.models.filesmanager import BlobFilesManager
+
+# ----------------------------------------------------------------
+# CONSTANTS
+# ----------------------------------------------------------------
+
+ACCOUNT = "devstoreaccount1"
+KEY = base64.b64encode(b"secret").decode("utf-8")
+CONNECTION_STRING = f"AccountName={ACCOUNT};AccountKey={KEY};BlobEndpoint=http://127.0.0.1:10000/{ACCOUNT};"  # fmt: skip
+
+BLOBS = {
+    "top.txt": b"top",
+    "a/x.txt": b"hello",
+    "a/b/y.txt": b"",
+    "a/c/": b"",
+    **{f"d/e/{k:03}.txt": b"z" for k in range(25)},
+}
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_blob_files_manager(
+    *,
+    test: TestCase,
+):
+    service = FakeBlobService({"data": dict(BLOBS)}, page_size=10)
+    manager = BlobFilesManager(CONNECTION_STRING, page_size=10, transport=httpx.MockTransport(service))  # fmt: skip
+
+    results = sorted(recursive_file_search(manager, path="data"))
+    test.assertEqual(results[:3], [(0, "data", "top.txt"), (1, "data/a", "x.txt"), (2, "data/a/b", "y.txt")])  # fmt: skip
+    test.assertEqual(len(results), 3 + 25)
+    test.assertTrue(all(request.headers["Authorization"].startswith(f"SharedKey {ACCOUNT}:") for request in service.requests))  # fmt: skip
+
+    # NOTE: one delimited listing plus the pages of flat listings for 'a' (1 page) and 'd' (3 pages)
+    n_listings = sum(request.url.params.get("comp") == "list" for request in service.requests)
+    test.assertEqual(n_listings, 5)
+
+    test.assertEqual(
+        manager.get_folder("data/a").get_subfolder_paths(), ["data/a/b", "data/a/c"]
+    )
+    test.assertEqual(manager.get_folder(".").get_subfolder_paths(), ["data"])
+    test.assertFalse(manager.get_folder("data/z").exists)
+
+    file = manager.get_file("data", "a/x.txt")
+    test.assertEqual(file.size, 5)
+    # NOTE: properties are taken from the cached listing of the container (or of a parent prefix)
+    test.assertEqual(sum(request.method == "HEAD" for request in service.requests), 0)
+    test.assertIs(manager.find_cached_listing("data", "a/b"), manager.find_cached_listing("data", ""))  # fmt: skip
+    test.assertIsNone(manager.find_cached_listing("other", ""))
+    test.assertEqual(file.read_as_bytes(), b"hello")
+    test.assertFalse(manager.get_file("data/a/z.txt").exists)
+
+    # writes invalidate cached listings
+    manager.create_file(b"new", path="data/a/new.txt")
+    test.assertIn("new.txt", manager.get_folder("data/a").get_filenames())
+    test.assertTrue(manager.get_folder("data/d").delete_self())
+    test.assertFalse(manager.get_folder("data/d").exists)
+
+    # streamed uploads are staged in blocks
+    chunks = [b"abc", b"defg", b"h"]
+    file = manager.get_folder("data/a").write_chunks(chunks, name="blocks.txt", chunk=3)
+    test.assertEqual(file.read_as_bytes(), b"abcdefgh")
+    test.assertEqual(b"".join(file.iter_chunks(chunk=3)), b"abcdefgh")
+    test.assertEqual(sum(request.url.params.get("comp") == "block" for request in service.requests), 3)  # fmt: skip
+    manager.close()
+
+
+# ----------------------------------------------------------------
+# AUXILIARY
+# ----------------------------------------------------------------
+
+
+class FakeBlobService:
+    """
+    Minimal in-memory imitation of the REST api of blob storage.
+    """
+
+    def __init__(self, containers: dict[str, dict[str, bytes]], /, *, page_size: int):
+        self.containers = containers
+        self.page_size = page_size
+        self.blocks: dict[str, bytes] = {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        params = request.url.params
+        _, _, path = request.url.path.lstrip("/").partition("/")
+        container, _, name = path.partition("/")
+
+        if container == "" and params.get("comp") == "list":
+            names = "".join(f"<Container><Name>{escape(c)}</Name></Container>" for c in sorted(self.containers))  # fmt: skip
+            return httpx.Response(200, content=f"<EnumerationResults><Containers>{names}</Containers></EnumerationResults>")  # fmt: skip
+
+        if params.get("restype") == "container" and params.get("comp") == "list":
+            return self.list_blobs(container, params)
+
+        if params.get("restype") == "container" and request.method == "PUT":
+            if container in self.containers:
+                return httpx.Response(409)
+            self.containers[container] = {}
+            return httpx.Response(201)
+
+        blobs = self.containers.get(container)
+        if blobs is None:
+            return httpx.Response(404)
+
+        match request.method:
+            case "PUT" if params.get("comp") == "block":
+                self.blocks[params["blockid"]] = request.read()
+                return httpx.Response(201)
+
+            case "PUT" if params.get("comp") == "blocklist":
+                block_ids = re.findall(
+                    r"<Latest>(.*?)</Latest>", request.read().decode("utf-8")
+                )
+                blobs[name] = b"".join(self.blocks.pop(block_id) for block_id in block_ids)
+                return httpx.Response(201)
+
+            case "PUT":
+                blobs[name] = request.read()
+                return httpx.Response(201)
+
+            case "DELETE":
+                return httpx.Response(202 if blobs.pop(name, None) is not None else 404)
+
+            case "GET" | "HEAD" if name in blobs:
+                headers = {"Content-Length": str(len(blobs[name])), "Last-Modified": "Mon, 05 Jan 2026 10:00:00 GMT"}  # fmt: skip
+                return httpx.Response(200, headers=headers, content=blobs[name] if request.method == "GET" else b"")  # fmt: skip
+
+            case _:
+                return httpx.Response(404)
+
+    def list_blobs(self, container: str, params: httpx.QueryParams) -> httpx.Response:
+        prefix = params.get("prefix", "")
+        delimiter = params.get("delimiter")
+        entries = []
+        for name in sorted(self.containers.get(container, {})):
+            if not name.startswith(prefix):
+                continue
+            if delimiter and delimiter in name[len(prefix) :].rstrip(delimiter):
+                subprefix = prefix + name[len(prefix) :].split(delimiter)[0] + delimiter
+                if entries[-1:] != [("prefix", subprefix)]:
+                    entries.append(("prefix", subprefix))
+                continue
+            entries.append(("blob", name))
+
+        start = int(params.get("marker") or 0)
+        page = entries[start : start + self.page_size]
+        marker = start + self.page_size if start + self.page_size < len(entries) else ""
+
+        xml = ""
+        for kind, name in page:
+            if kind == "prefix":
+                xml += f"<BlobPrefix><Name>{escape(name)}</Name></BlobPrefix>"
+                continue
+            size = len(self.containers[container][name])
+            xml += f"<Blob><Name>{escape(name)}</Name><Properties><Content-Length>{size}</Content-Length><Last-Modified>Mon, 05 Jan 2026 10:00:00 GMT</Last-Modified></Properties></Blob>"  # fmt: skip
+
+        content = f"<EnumerationResults><Blobs>{xml}</Blobs><NextMarker>{marker}</NextMarker></EnumerationResults>"  # fmt: skip
+        return httpx.Response(200, content=content)
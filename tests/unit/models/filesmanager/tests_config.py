@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import json
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.models.application import RequestsPayload
+from src.models.filesmanager import ConfigCache
+from src.models.filesmanager import ConfigLoader
+from src.models.filesmanager import EnumDataFileFormat
+from src.models.filesmanager import EnumFilesSystem
+from src.models.filesmanager import OSFilesManager
+from src.models.filesmanager import ProxyConfig
+
+# ----------------------------------------------------------------
+# FIXTURES
+# ----------------------------------------------------------------
+
+TASK = {
+    "label": "example",
+    "options": {"max-duration": "00:05:00"},
+    "data": {"inputs": {"location": "OS", "path": "data/example"}},
+}
+
+
+class LoaderWithoutProxies(ConfigLoader[RequestsPayload]):
+    """
+    Returns proxies instead of resolving them
+    """
+
+    def load_from_proxy(self, proxy: ProxyConfig, /, **_):
+        return proxy
+
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_load_from_contents_json_fast_path(
+    *,
+    test: TestCase,
+):
+    loader = ConfigLoader[RequestsPayload](managers={}, type_=RequestsPayload)
+    contents = json.dumps([TASK, TASK]).encode()
+    cfg = loader.load_from_contents(contents, fmt=EnumDataFileFormat.FIELD_JSON)
+    test.assertIsInstance(cfg, RequestsPayload)
+    test.assertEqual(cfg, RequestsPayload.model_validate(json.loads(contents)))
+
+
+def test_load_from_contents_raises_first_error(
+    *,
+    test: TestCase,
+):
+    loader = ConfigLoader[RequestsPayload](managers={}, type_=RequestsPayload)
+    contents = json.dumps({"label": "missing fields"}).encode()
+    with test.assertRaisesRegex(Exception, "RequestsPayload"):
+        loader.load_from_contents(contents, fmt=EnumDataFileFormat.FIELD_JSON)
+
+
+def test_load_from_contents_proxy(
+    *,
+    test: TestCase,
+):
+    loader = LoaderWithoutProxies(managers={}, type_=RequestsPayload)
+    contents = json.dumps({"ref": {"location": "OS", "path": "setup/requests.yaml"}}).encode()
+    cfg = loader.load_from_contents(contents, fmt=EnumDataFileFormat.FIELD_JSON)
+    test.assertIsInstance(cfg, ProxyConfig)
+
+
+def test_load_from_file_cached_until_changed(
+    *,
+    test: TestCase,
+):
+    managers = {EnumFilesSystem.OS: OSFilesManager()}
+    loader = ConfigLoader[RequestsPayload](managers=managers, type_=RequestsPayload, cache=ConfigCache())  # fmt: skip
+
+    with TemporaryDirectory() as root:
+        path = os.path.join(root, "requests.json")
+        path_proxy = os.path.join(root, "proxy.json")
+        with open(path, "w") as fp:
+            json.dump(TASK, fp)
+        with open(path_proxy, "w") as fp:
+            json.dump({"ref": {"location": "OS", "path": path}}, fp)
+
+        cfg = loader.load_from_file(loc=EnumFilesSystem.OS, path=path_proxy)
+        test.assertIs(loader.load_from_file(loc=EnumFilesSystem.OS, path=path_proxy), cfg)
+
+        # modifying referenced file invalidates the proxy
+        with open(path, "w") as fp:
+            json.dump({**TASK, "label": "modified"}, fp)
+
+        cfg = loader.load_from_file(loc=EnumFilesSystem.OS, path=path_proxy)
+        test.assertEqual(cfg.root.label, "modified")
+
+
+def test_load_from_file_cached_until_include_changed(
+    *,
+    test: TestCase,
+):
+    managers = {EnumFilesSystem.OS: OSFilesManager()}
+    loader = ConfigLoader[RequestsPayload](managers=managers, type_=RequestsPayload, cache=ConfigCache())  # fmt: skip
+
+    with TemporaryDirectory() as root:
+        path = os.path.join(root, "requests.yaml")
+        path_part = os.path.join(root, "part.yaml")
+        with open(path_part, "w") as fp:
+            fp.write("label: original\n")
+        with open(path, "w") as fp:
+            fp.write(f"label: !include {path_part}/#/label\noptions:\n  max-duration: 00:05:00\ndata:\n  inputs:\n    location: OS\n    path: data\n")  # fmt: skip
+
+        cfg = loader.load_from_file(loc=EnumFilesSystem.OS, path=path)
+        test.assertEqual(cfg.root.label, "original")
+        test.assertIs(loader.load_from_file(loc=EnumFilesSystem.OS, path=path), cfg)
+
+        # modifying an included file invalidates the config
+        with open(path_part, "w") as fp:
+            fp.write("label: modified\n")
+        os.utime(path_part, ns=(0, 0))
+
+        cfg = loader.load_from_file(loc=EnumFilesSystem.OS, path=path)
+        test.assertEqual(cfg.root.label, "modified")
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from unittest import TestCase
+
+from src.algorithms.filesmanager import recursive_file_search
+from src.models.filesmanager import EnumFilesSystem
+from src.models.filesmanager import MemoryFilesManager
+from src.models.filesmanager import create_deep_tree
+from src.models.filesmanager import create_skewed_tree
+from src.models.filesmanager import create_wide_tree
+from src.queries.filesmanager import get_files_manager
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_memory_files_manager(
+    *,
+    test: TestCase,
+):
+    manager = get_files_manager(EnumFilesSystem.MEMORY)
+    test.assertIsInstance(manager, MemoryFilesManager)
+
+    file = manager.create_file(b"hello", path="/data/b/hello.txt")
+    manager.create_file(b"", path="data/a.txt")
+    test.assertTrue(file.exists)
+    test.assertEqual(file.path, "data/b/hello.txt")
+    test.assertEqual(file.read_as_bytes(), b"hello")
+    test.assertEqual(file.get_meta_data().size, 5)
+
+    folder = manager.get_folder("./data//")
+    test.assertEqual(folder.get_filenames(), ["a.txt"])
+    test.assertEqual(folder.get_subfolder_paths(), ["data/b"])
+    test.assertTrue(folder.get_subfolder("b").has_file(file))
+    with test.assertRaises(FileNotFoundError):
+        manager.get_folder("data/c").get_filenames()
+
+    test.assertTrue(folder.delete_self())
+    test.assertFalse(file.exists)
+    test.assertEqual((manager.n_folders, manager.n_files), (1, 0))
+
+
+def test_memory_tree_generators(
+    *,
+    test: TestCase,
+):
+    manager = MemoryFilesManager()
+
+    create_wide_tree(manager, path="wide", width=3, depth=2, files_per_folder=2, file_size=10)  # fmt: skip
+    results = list(recursive_file_search(manager, path="wide"))
+    test.assertEqual(len(results), 2 * (1 + 3 + 9))
+    test.assertEqual(max(d for d, _, _ in results), 2)
+    test.assertEqual(manager.get_file("wide/folder_2/folder_0/file_1.txt").size, 10)
+
+    create_deep_tree(manager, path="deep", depth=50, files_per_folder=1)
+    results = list(recursive_file_search(manager, path="deep"))
+    test.assertEqual(len(results), 51)
+    test.assertEqual(max(d for d, _, _ in results), 50)
+
+    # folder counts follow the Fibonacci numbers 1, 2, 4, 7, 12, 20, ...
+    create_skewed_tree(manager, path="skewed", depth=5, files_per_folder=1)
+    results = list(recursive_file_search(manager, path="skewed"))
+    test.assertEqual(len(results), 20)
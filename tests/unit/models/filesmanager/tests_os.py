@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.models.filesmanager import OSFilesManager
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_os_files_manager_stat_cache(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager(stat_ttl=60.0)
+        folder = manager.get_folder(root)
+        file = folder.write_bytes(b"hello", name="x.txt")
+
+        meta = file.get_meta_data()
+        test.assertEqual(meta.size, 5)
+        test.assertAlmostEqual(
+            meta.time_updated.timestamp(), os.stat(file.path).st_mtime, places=5
+        )
+        test.assertEqual(len(manager._stats), 1)
+
+        # NOTE: modifications outside of the manager are only seen once the ttl expires
+        Path(file.path).write_bytes(b"hello world")
+        test.assertEqual(manager.get_file(file.path).size, 5)
+
+        # modifications via the manager invalidate the cache
+        file = folder.write_bytes(b"hi", name="x.txt")
+        test.assertEqual(file.size, 2)
+
+        # owners are resolved once per uid
+        authors = {manager.get_file(file.path).author for _ in range(3)}
+        test.assertEqual(len(authors), 1)
+        test.assertLessEqual(len(manager._owners), 1)
+
+        # without a ttl, file objects stat their file once
+        manager = OSFilesManager()
+        file = manager.get_file(root, "x.txt")
+        test.assertEqual(file.size, 2)
+        test.assertEqual(len(manager._stats), 0)
+
+
+def test_os_files_manager_columns(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        folder = manager.get_folder(root)
+        for k in range(5):
+            folder.write_bytes(b"x" * k, name=f"{k}.txt")
+        folder.add_subfolder("sub")
+
+        columns = folder.get_files_meta_data_columns()
+        test.assertEqual(sorted(columns.names), [f"{k}.txt" for k in range(5)])
+        test.assertEqual(columns.total_size, 0 + 1 + 2 + 3 + 4)
+        test.assertEqual(sorted(columns.filter_size(min_size=3).names), ["3.txt", "4.txt"])
+
+        # models are built upon request and agree with those of the file objects
+        models = {meta.filename: meta for meta in columns.to_meta_data()}
+        for name in columns.names:
+            test.assertEqual(models[name], folder.get_file(name).get_meta_data())
+
+
+def test_os_files_manager_delete(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        outside = manager.create_file(b"keep", path=f"{root}/outside/keep.txt")
+        for k in range(3):
+            for j in range(4):
+                manager.create_file(b"x", path=f"{root}/tree/{k}/sub/{j}.txt")
+        manager.create_file(b"x", path=f"{root}/tree/top.txt")
+        # NOTE: symbolic links are removed and not followed
+        os.symlink(f"{root}/outside", f"{root}/tree/link")
+
+        folder = manager.get_folder(root, "tree")
+        report = folder.clear_folder(max_workers=4)
+        test.assertTrue(report)
+        test.assertEqual((report.n_files, report.n_folders), (3 * 4 + 1 + 1, 3 * 2))
+        test.assertEqual(os.listdir(folder.path), [])
+        test.assertTrue(outside.exists)
+
+        report = folder.delete_self()
+        test.assertTrue(report)
+        test.assertEqual(report.n_folders, 1)
+        test.assertFalse(folder.exists)
+        test.assertTrue(folder.delete_self())
+
+
+def test_os_files_manager_delete_deep(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        # NOTE: deeper than the recursion limit permits for a recursive walk
+        depth = 600
+        path = os.path.join(root, "tree", *["d"] * depth)
+        os.makedirs(path)
+        Path(path, "leaf.txt").write_bytes(b"x")
+
+        report = manager.get_folder(root, "tree").delete_self()
+        test.assertTrue(report)
+        test.assertEqual((report.n_files, report.n_folders), (1, depth + 1))
+        test.assertEqual(os.listdir(root), [])
+
+
+def test_os_files_manager_streaming(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as root:
+        manager = OSFilesManager()
+        folder = manager.get_folder(root)
+
+        file = folder.write_chunks((bytes([k]) * 100 for k in range(10)), name="x.bin")
+        test.assertEqual(file.size, 1000)
+        chunks = list(file.iter_chunks(chunk=300))
+        test.assertEqual([len(contents) for contents in chunks], [300, 300, 300, 100])
+        test.assertEqual(b"".join(chunks), file.read_as_bytes())
+
+        with file.open_memoryview() as view:
+            test.assertEqual(len(view), 1000)
+            test.assertEqual(bytes(view[100:102]), b"\x01\x01")
+
+        file = folder.write_bytes(b"", name="empty.bin", chunk=10)
+        test.assertEqual(list(file.iter_chunks()), [])
+        with file.open_memoryview() as view:
+            test.assertEqual(len(view), 0)
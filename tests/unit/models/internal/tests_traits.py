@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import Context
+from unittest import TestCase
+
+from src._core.utils.code import compute_once
+from src.models.internal import Property
+from src.models.internal import SettingsRegistry
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_property_process_scope_shared_across_contexts(
+    *,
+    test: TestCase,
+):
+    calls = []
+    prop = Property[int](label="test", factory=lambda: calls.append(1) or 42)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lambda _: Context().run(prop.get), range(100)))
+    test.assertEqual(values, [42] * 100)
+    test.assertEqual(len(calls), 1)
+
+    prop.set(7)
+    test.assertEqual(Context().run(prop.get), 7)
+
+
+def test_property_request_scope_local_to_context(
+    *,
+    test: TestCase,
+):
+    prop = Property[int](label="test", default=1, scope="REQUEST")
+    prop.set(2)
+    test.assertEqual(prop(), 2)
+    test.assertEqual(Context().run(prop.get), 1)
+
+
+def test_settings_reload_retains_explicit_values(
+    *,
+    test: TestCase,
+):
+    registry = SettingsRegistry()
+    counter = iter(range(100))
+    prop_computed = Property[int](label="computed", factory=lambda: next(counter))
+    prop_explicit = Property[int](label="explicit", default=0)
+    prop_explicit.set(5)
+    registry.register(prop_computed)
+    registry.register(prop_explicit)
+
+    hooks = []
+    registry.add_reload_hook(lambda: hooks.append(1))
+
+    test.assertEqual(prop_computed(), 0)
+    registry.reload()
+    test.assertEqual(prop_computed(), 1)
+    test.assertEqual(prop_explicit(), 5)
+    test.assertEqual(hooks, [1])
+
+
+def test_compute_once_thread_safe(
+    *,
+    test: TestCase,
+):
+    calls = []
+
+    @compute_once
+    def method():
+        calls.append(1)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        values = list(pool.map(lambda _: method(), range(100)))
+    test.assertEqual(len(calls), 1)
+    test.assertTrue(all(value is values[0] for value in values))
+
+    method.reset()
+    test.assertIsNot(method(), values[0])
+    test.assertEqual(len(calls), 2)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest import TestCase
+
+from src.models.internal.errors import ExceptionWithData
+from src.models.jobs import AdmissionController
+from src.models.jobs import get_admission_key
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_admission_key(
+    *,
+    test: TestCase,
+):
+    test.assertEqual(get_admission_key("OS", "./data/example/a/b", depth=2), "OS:data/example")  # fmt: skip
+    test.assertEqual(get_admission_key("OS", "/data//example/", depth=1), "OS:/data")
+    test.assertEqual(get_admission_key("OS", ".", depth=2), "OS:")
+
+
+def test_admission_rejects_when_full(
+    *,
+    test: TestCase,
+):
+    admission = AdmissionController(max_global=1, max_per_key=1, max_waiting=0, timeout=0.1)
+
+    with admission.admit(["OS:a"]):
+        test.assertEqual(admission.in_flight, 1)
+        with test.assertRaises(ExceptionWithData) as ctx:
+            with admission.admit(["OS:b"]):
+                pass
+
+    test.assertEqual(ctx.exception.code, 429)
+    test.assertGreaterEqual(ctx.exception.data["retry-after"], 1)
+    test.assertEqual(admission.in_flight, 0)
+
+
+def test_admission_limits_per_prefix(
+    *,
+    test: TestCase,
+):
+    admission = AdmissionController(max_global=2, max_per_key=1, max_waiting=4, timeout=0.1)
+
+    with admission.admit(["OS:a"]):
+        # other prefix is admitted
+        with admission.admit(["OS:b"]):
+            test.assertEqual(admission.in_flight, 2)
+
+        # same prefix times out
+        with test.assertRaises(ExceptionWithData):
+            with admission.admit(["OS:a"]):
+                pass
+
+    test.assertEqual(admission.waiting, 0)
+
+
+def test_admission_waits_for_slot(
+    *,
+    test: TestCase,
+):
+    admission = AdmissionController(max_global=1, max_per_key=1, max_waiting=1, timeout=5)
+    started = Event()
+    release = Event()
+
+    def first():
+        with admission.admit(["OS:a"]):
+            started.set()
+            release.wait(timeout=5)
+
+    def second():
+        with admission.admit(["OS:a"]):
+            return "admitted"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        executor.submit(first)
+        started.wait(timeout=5)
+        future = executor.submit(second)
+        release.set()
+        test.assertEqual(future.result(timeout=5), "admitted")
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+from threading import Event
+from unittest import TestCase
+
+from src.models.internal.errors import ExceptionWithData
+from src.models.jobs import EnumJobStatus
+from src.models.jobs import JobManager
+from src.models.jobs import JobProgress
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_job_succeeds(
+    *,
+    test: TestCase,
+):
+    manager = JobManager(max_workers=1, max_pending=1)
+    job = manager.submit(lambda progress: "success", label="TEST")
+    job.future.result(timeout=5)
+    test.assertEqual(job.status, EnumJobStatus.SUCCEEDED)
+    test.assertEqual(job.result, "success")
+    manager.shutdown()
+
+
+def test_job_cancelled_cooperatively(
+    *,
+    test: TestCase,
+):
+    started = Event()
+
+    def action(progress: JobProgress):
+        started.set()
+        while True:
+            progress.add_file()
+
+    manager = JobManager(max_workers=1, max_pending=1)
+    job = manager.submit(action, label="TEST")
+    started.wait(timeout=5)
+
+    # pool is full
+    with test.assertRaises(ExceptionWithData):
+        manager.submit(lambda progress: None, label="TEST")
+
+    manager.cancel(job.id)
+    job.future.result(timeout=5)
+    test.assertEqual(job.status, EnumJobStatus.CANCELLED)
+    test.assertGreater(job.progress.files_found, 0)
+    manager.shutdown()
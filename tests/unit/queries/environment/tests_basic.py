@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from testfixtures import Replace
+
+from src.queries.environment import clear_environment_cache
+from src.queries.environment import get_environment
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_environment_snapshot_reused(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as folder:
+        path = Path(folder, ".env")
+        path.write_text("TEST_ENV_SNAPSHOT_A=1\n")
+        env1 = get_environment(path.as_posix())
+        env2 = get_environment(path.as_posix())
+        test.assertIs(env1, env2)
+        test.assertEqual(env1.get("TEST_ENV_SNAPSHOT_A"), "1")
+        clear_environment_cache()
+
+
+def test_environment_snapshot_invalidated_on_change(
+    *,
+    test: TestCase,
+):
+    with (
+        TemporaryDirectory() as folder,
+        Replace("src.queries.environment.basic.STAT_INTERVAL", 0.0),
+    ):
+        path = Path(folder, ".env")
+        path.write_text("TEST_ENV_SNAPSHOT_B=1\n")
+        env = get_environment(path.as_posix())
+        test.assertEqual(env.get("TEST_ENV_SNAPSHOT_B"), "1")
+
+        # NOTE: change size and modification time
+        path.write_text("TEST_ENV_SNAPSHOT_C=22\n")
+        os.utime(path, ns=(0, 0))
+        env = get_environment(path.as_posix())
+        test.assertEqual(env.get("TEST_ENV_SNAPSHOT_C"), "22")
+        clear_environment_cache()
+
+
+def test_environment_snapshot_picks_up_changed_values(
+    *,
+    test: TestCase,
+):
+    with (
+        TemporaryDirectory() as folder,
+        Replace("src.queries.environment.basic.STAT_INTERVAL", 0.0),
+    ):
+        path = Path(folder, ".env")
+        path.write_text("TEST_ENV_SNAPSHOT_D=1\nTEST_ENV_SNAPSHOT_E=1\n")
+        env = get_environment(path.as_posix())
+        test.assertEqual(env.get("TEST_ENV_SNAPSHOT_D"), "1")
+
+        # NOTE: same key, changed value
+        path.write_text("TEST_ENV_SNAPSHOT_D=22\n")
+        os.utime(path, ns=(0, 0))
+        env = get_environment(path.as_posix())
+        test.assertEqual(env.get("TEST_ENV_SNAPSHOT_D"), "22")
+        test.assertEqual(os.environ.get("TEST_ENV_SNAPSHOT_D"), "22")
+        test.assertNotIn("TEST_ENV_SNAPSHOT_E", env)
+
+        # session values still take precedence
+        with Replace("os.environ.TEST_ENV_SNAPSHOT_F", "session", strict=False):
+            path.write_text("TEST_ENV_SNAPSHOT_F=file\n")
+            os.utime(path, ns=(1, 1))
+            env = get_environment(path.as_posix())
+            test.assertEqual(env.get("TEST_ENV_SNAPSHOT_F"), "session")
+
+        os.environ.pop("TEST_ENV_SNAPSHOT_D", None)
+        clear_environment_cache()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.models.filesmanager import EnumFilesSystem
+from src.setup import config
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_get_managers_stat_ttl(
+    *,
+    test: TestCase,
+):
+    with TemporaryDirectory() as folder:
+        try:
+            for name, contents, expected in [
+                ("without.env", "", None),
+                ("with.env", "OS_STAT_TTL=2.5\n", 2.5),
+            ]:
+                path = Path(folder, name)
+                path.write_text(contents)
+                config.path_env.set(path.as_posix())
+                config.reload_settings()
+                config.get_managers.reset()
+
+                managers = config.get_managers()
+                test.assertEqual(managers[EnumFilesSystem.OS].stat_ttl, expected)
+                test.assertNotIn(EnumFilesSystem.BLOB_STORAGE, managers)
+
+        finally:
+            # NOTE: values of .env files are injected into the session
+            os.environ.pop("OS_STAT_TTL", None)
+            config.path_env.reset()
+            config.reload_settings()
+            config.get_managers.reset()
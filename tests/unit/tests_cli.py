@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# ----------------------------------------------------------------
+# IMPORTS
+# ----------------------------------------------------------------
+
+import re
+import subprocess
+import sys
+from unittest import TestCase
+
+from src.setup.info import get_version
+
+# ----------------------------------------------------------------
+# TESTS
+# ----------------------------------------------------------------
+
+
+def test_cli_version_imports_lightly(
+    *,
+    test: TestCase,
+):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.cli", "version"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    test.assertEqual(result.stdout.strip(), get_version())
+
+    modules = set(re.findall(r"^import time:.*\|\s*(\S+)\s*$", result.stderr, flags=re.MULTILINE))  # fmt: skip
+    test.assertIn("src.setup.info", modules)
+
+    # the application (incl. connection to queue, server, config parsing) must not be loaded
+    for name in ["src.setup.config", "src.features", "pika", "fastapi", "uvicorn", "yaml", "toml", "tzlocal", "pytz"]:  # fmt: skip
+        test.assertNotIn(name, modules)